@@ -5,22 +5,52 @@ Checks Framework - 可扩展的博客内容检查框架
 提供插件化架构、Python 配置、交互式修复。
 """
 
-from checks.checkers import ImageChecker
-from checks.config import Config, FixConfig, OutputConfig
-from checks.core.checker import Checker
-from checks.core.context import CheckContext
-from checks.core.exceptions import (
-    CheckerError,
-    ChecksError,
-    ConfigError,
-    FileError,
-    FixError,
-    PatchError,
-)
-from checks.core.issue import ContextLines, Fix, Issue, Severity
-from checks.core.resolver import PathResolver
-from checks.resolvers import DefaultResolver, HexoResolver
-from checks.runner import CheckRunner
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from checks.checkers import ImageChecker
+    from checks.config import Config, FixConfig, OutputConfig
+    from checks.core.checker import Checker
+    from checks.core.context import CheckContext
+    from checks.core.exceptions import (
+        CheckerError,
+        ChecksError,
+        ConfigError,
+        FileError,
+        FixError,
+        PatchError,
+    )
+    from checks.core.issue import ContextLines, Fix, Issue, Severity
+    from checks.core.resolver import PathResolver
+    from checks.resolvers import DefaultResolver, HexoResolver
+    from checks.runner import CheckRunner
+
+# 公开名称 -> 所在模块（PEP 562 延迟导入，`checks --version` 等命令无需加载全部组件）
+_LAZY_IMPORTS: dict[str, str] = {
+    "CheckContext": "checks.core.context",
+    "CheckRunner": "checks.runner",
+    "Checker": "checks.core.checker",
+    "CheckerError": "checks.core.exceptions",
+    "ChecksError": "checks.core.exceptions",
+    "Config": "checks.config",
+    "ConfigError": "checks.core.exceptions",
+    "ContextLines": "checks.core.issue",
+    "DefaultResolver": "checks.resolvers",
+    "FileError": "checks.core.exceptions",
+    "Fix": "checks.core.issue",
+    "FixConfig": "checks.config",
+    "FixError": "checks.core.exceptions",
+    "HexoResolver": "checks.resolvers",
+    "ImageChecker": "checks.checkers",
+    "Issue": "checks.core.issue",
+    "OutputConfig": "checks.config",
+    "PatchError": "checks.core.exceptions",
+    "PathResolver": "checks.core.resolver",
+    "Severity": "checks.core.issue",
+}
 
 __all__ = [
     "CheckContext",
@@ -52,3 +82,17 @@ __all__ = [
 ]
 
 __version__ = "0.1.0"
+
+
+def __getattr__(name: str) -> Any:
+    """按需导入公开组件"""
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *_LAZY_IMPORTS])
@@ -3,7 +3,10 @@
 from __future__ import annotations
 
 import re
-from dataclasses import dataclass
+from bisect import bisect_right
+from dataclasses import dataclass, field
+from functools import lru_cache
+from operator import itemgetter
 from typing import TYPE_CHECKING, ClassVar
 
 if TYPE_CHECKING:
@@ -24,53 +27,72 @@ class ImagePatterns:
     - 带空格的路径（引号包裹）: ![]("path with space.png")
     - 带标题: ![](path.png "title")
     - HTML 多种属性顺序
+
+    重复部分尽量使用占有量词（``*+``/``++``），各分支首字符互斥，
+    匹配失败时不会在已消费的字符上做无效回溯。模式在全文上扫描，
+    各字符类均排除换行符，保持与逐行匹配相同的语义（标签不跨行配对）。
     """
 
     # Markdown 图片 - 支持嵌套括号和复杂路径
     # ![alt](path) 或 ![alt](path "title") 或 ![alt](<path with spaces>)
     MARKDOWN_IMAGE: ClassVar[re.Pattern[str]] = re.compile(
-        r"!\[(?:[^\[\]]|\[[^\]]*\])*\]\("  # ![alt]( - alt 支持嵌套方括号
+        r"!\[(?:[^\[\]\r\n]|\[[^\]\r\n]*+\])*+\]\("  # ![alt]( - alt 支持嵌套方括号，不跨行
         r"(?:"
-        r"<(?P<path_angle>[^>]+)>"  # <path> 尖括号包裹的路径
+        r"<(?P<path_angle>[^>\r\n]++)>"  # <path> 尖括号包裹的路径
         r"|"
-        r'(?P<path_normal>(?:[^()\s"]|\([^()]*\))+)'  # 普通路径，支持嵌套括号
+        r'(?P<path_normal>(?:[^()\s"]|\([^()\r\n]*+\))++)'  # 普通路径，支持嵌套括号
         r")"
-        r'(?:\s+["\'][^"\']*["\'])?'  # 可选的标题
+        r'(?:[^\S\r\n]++["\'][^"\'\r\n]*+["\'])?'  # 可选的标题
         r"\)",
         re.MULTILINE,
     )
 
     # HTML img 标签 - 更宽松的匹配
     HTML_IMG: ClassVar[re.Pattern[str]] = re.compile(
-        r"<img\s+"  # <img 开头
-        r"(?:[^>]*?\s+)?"  # 其他属性
-        r'src=["\'](?P<path>[^"\']+)["\']'  # src 属性
-        r"[^>]*"  # 剩余属性
+        r"<img[^\S\r\n]++"  # <img 开头
+        r"(?:[^>\r\n]*?[^\S\r\n]+)?"  # 其他属性
+        r'src=["\'](?P<path>[^"\'\r\n]++)["\']'  # src 属性
+        r"[^>\r\n]*+"  # 剩余属性
         r"/?>",  # 结束
         re.IGNORECASE,
     )
 
     # HTML video poster
     HTML_VIDEO_POSTER: ClassVar[re.Pattern[str]] = re.compile(
-        r"<video\s+"
-        r"(?:[^>]*?\s+)?"
-        r'poster=["\'](?P<path>[^"\']+)["\']'
-        r"[^>]*"
+        r"<video[^\S\r\n]++"
+        r"(?:[^>\r\n]*?[^\S\r\n]+)?"
+        r'poster=["\'](?P<path>[^"\'\r\n]++)["\']'
+        r"[^>\r\n]*+"
         r">",
         re.IGNORECASE,
     )
 
-    # 代码块（支持缩进）
-    CODE_FENCE: ClassVar[re.Pattern[str]] = re.compile(r"^\s*```")
+    # HTML 标签预筛（忽略大小写，无需生成小写副本）
+    HTML_PREFILTER: ClassVar[re.Pattern[str]] = re.compile(r"<(?:img|video)\s", re.IGNORECASE)
+
+    # 完整代码块（从起始标记行到结束标记行，未闭合时延续到文件末尾）
+    FENCE_BLOCK: ClassVar[re.Pattern[str]] = re.compile(
+        r"^[^\S\n]*```.*?(?:^[^\S\n]*```[^\n]*|\Z)", re.DOTALL | re.MULTILINE
+    )
+
+    # 换行符（与 str.splitlines 的分行规则一致）
+    LINE_BREAK: ClassVar[re.Pattern[str]] = re.compile(r"\r\n|[\n\r\v\f\x1c-\x1e\x85\u2028\u2029]")
 
-    # 行内代码（用于跳过）
-    INLINE_CODE: ClassVar[re.Pattern[str]] = re.compile(r"`[^`]+`")
+    # 行内代码（用于跳过，不跨行）
+    INLINE_CODE: ClassVar[re.Pattern[str]] = re.compile(r"`[^`\n]+`")
 
     # 路径清理模式
     PATH_SUFFIX: ClassVar[re.Pattern[str]] = re.compile(r"#[\w-]+$")
 
 
-@dataclass
+@lru_cache(maxsize=4096)
+def _clean_path_cached(path: str) -> str:
+    """清理路径字符串（带缓存，同一路径常在文章中重复出现）"""
+    path = path.strip()
+    return ImagePatterns.PATH_SUFFIX.sub("", path)
+
+
+@dataclass(slots=True)
 class ImageChecker(Checker):
     """图片路径检查器
 
@@ -78,6 +100,7 @@ class ImageChecker(Checker):
     支持模糊匹配以提供修复建议。
 
     Attributes:
+        enabled: 是否启用
         ignore_external: 是否忽略外部链接
         fuzzy_threshold: 模糊匹配阈值
         skip_code_blocks: 是否跳过代码块中的内容
@@ -86,8 +109,10 @@ class ImageChecker(Checker):
         check_video_poster: 是否检查 video poster 属性
     """
 
-    name: str = "image"
-    description: str = "Check image paths in Markdown and HTML"
+    name: ClassVar[str] = "image"
+    description: ClassVar[str] = "Check image paths in Markdown and HTML"
+
+    enabled: bool = field(default=True, kw_only=True)
 
     ignore_external: bool = True
     fuzzy_threshold: float = 0.6
@@ -102,156 +127,123 @@ class ImageChecker(Checker):
         content: str,
         ctx: CheckContext,
     ) -> list[Issue]:
-        """检查文件中的图片路径"""
-        issues: list[Issue] = []
-        lines = content.splitlines()
-
-        # 跟踪代码块状态
-        in_code_block = False
-
-        for line_num, line in enumerate(lines, 1):
-            # 检测代码块边界
-            if self.skip_code_blocks and ImagePatterns.CODE_FENCE.match(line):
-                in_code_block = not in_code_block
-                continue
-
-            # 跳过代码块内容
-            if in_code_block:
-                continue
-
-            # 处理行内代码（替换为占位符以避免匹配）
-            check_line = line
-            if self.skip_inline_code:
-                check_line = ImagePatterns.INLINE_CODE.sub("", line)
+        """检查文件中的图片路径
 
-            # 检查 Markdown 图片
-            issues.extend(self._check_markdown_images(check_line, line, file, line_num, ctx))
-
-            # 检查 HTML img 标签
+        各语法分别在全文上扫描（HTML 标签经预筛后才扫描）；发现无效路径时
+        再通过行起始偏移表二分定位行号，所有路径均有效的文件无需扫描换行。
+        各语法独立匹配，Markdown 图片片段内的 HTML 标签同样会被检查。
+        """
+        # 快速预筛：既无 `![` 也无相关 HTML 标签的文件不可能匹配任何图片语法
+        patterns: list[re.Pattern[str]] = []
+        if "![" in content:
+            patterns.append(ImagePatterns.MARKDOWN_IMAGE)
+        if (self.check_html_img or self.check_video_poster) and ImagePatterns.HTML_PREFILTER.search(
+            content
+        ):
             if self.check_html_img:
-                issues.extend(self._check_html_images(check_line, line, file, line_num, ctx))
-
-            # 检查 video poster
+                patterns.append(ImagePatterns.HTML_IMG)
             if self.check_video_poster:
-                issues.extend(self._check_video_poster(check_line, line, file, line_num, ctx))
-
-        return issues
-
-    def _check_markdown_images(
-        self,
-        check_line: str,
-        original_line: str,
-        file: Path,
-        line_num: int,
-        ctx: CheckContext,
-    ) -> list[Issue]:
-        """检查 Markdown 图片语法"""
-        issues: list[Issue] = []
-
-        for match in ImagePatterns.MARKDOWN_IMAGE.finditer(check_line):
-            # 获取路径（优先尖括号内的路径）
-            path = match.group("path_angle") or match.group("path_normal")
-            if not path:
-                continue
-
-            # 在原始行中查找位置
-            column = original_line.find(path)
-
-            issue = self._check_path(
-                path=path,
-                file=file,
-                line=line_num,
-                column=column if column >= 0 else match.start(),
-                line_content=original_line,
-                ctx=ctx,
-            )
-            if issue:
-                issues.append(issue)
-
-        return issues
-
-    def _check_pattern_matches(
-        self,
-        pattern: re.Pattern[str],
-        check_line: str,
-        original_line: str,
-        file: Path,
-        line_num: int,
-        ctx: CheckContext,
-    ) -> list[Issue]:
-        """检查正则匹配的路径
-
-        通用方法，用于检查 HTML img、video poster 等模式。
+                patterns.append(ImagePatterns.HTML_VIDEO_POSTER)
+        if not patterns:
+            return []
+
+        # 行起始/结束偏移表（首次发现问题时才构建）
+        line_starts: list[int] | None = None
+        line_ends: list[int] = []
+
+        # 代码块与行内代码的屏蔽区间
+        mask_starts, mask_ends = self._masked_ranges(content)
+
+        # (行下标, 语法序号, 偏移, 问题)：按行输出，同一行内依次为 Markdown、img、video
+        found: list[tuple[int, int, int, Issue]] = []
+        for kind, pattern in enumerate(patterns):
+            for match in pattern.finditer(content):
+                # Markdown 分支的路径分组为 path_angle/path_normal，HTML 为 path
+                group = match.lastgroup
+                if group is None:
+                    continue
+
+                path = match.group(group)
+                if not path:
+                    continue
+
+                # 跳过位于屏蔽区间中的路径
+                pos = match.start(group)
+                mask_idx = bisect_right(mask_starts, pos) - 1
+                if mask_idx >= 0 and pos < mask_ends[mask_idx]:
+                    continue
+
+                clean_path = self._clean_path(path)
+                if not self._is_broken(clean_path, file, ctx):
+                    continue
+
+                # 以路径所在位置定位行
+                if line_starts is None:
+                    breaks = list(ImagePatterns.LINE_BREAK.finditer(content))
+                    line_starts = [0, *(m.end() for m in breaks)]
+                    line_ends = [*(m.start() for m in breaks), len(content)]
+                line_idx = bisect_right(line_starts, pos) - 1
+                line_start = line_starts[line_idx]
+
+                issue = self._make_issue(
+                    path=path,
+                    clean_path=clean_path,
+                    file=file,
+                    line=line_idx + 1,
+                    column=pos - line_start,
+                    line_content=content[line_start : line_ends[line_idx]],
+                    ctx=ctx,
+                )
+                found.append((line_idx, kind, pos, issue))
+
+        if len(patterns) > 1:
+            found.sort(key=itemgetter(0, 1, 2))
+        return [item[3] for item in found]
+
+    def _masked_ranges(self, content: str) -> tuple[list[int], list[int]]:
+        """计算需要跳过的区间（代码块、行内代码）
+
+        Returns:
+            合并后互不重叠的区间 (起始偏移列表, 结束偏移列表)，按起始偏移升序
         """
-        issues: list[Issue] = []
-
-        for match in pattern.finditer(check_line):
-            path = match.group("path")
-            column = original_line.find(path)
-
-            issue = self._check_path(
-                path=path,
-                file=file,
-                line=line_num,
-                column=column if column >= 0 else match.start("path"),
-                line_content=original_line,
-                ctx=ctx,
-            )
-            if issue:
-                issues.append(issue)
-
-        return issues
-
-    def _check_html_images(
-        self,
-        check_line: str,
-        original_line: str,
-        file: Path,
-        line_num: int,
-        ctx: CheckContext,
-    ) -> list[Issue]:
-        """检查 HTML img 标签"""
-        return self._check_pattern_matches(
-            ImagePatterns.HTML_IMG, check_line, original_line, file, line_num, ctx
-        )
+        ranges: list[tuple[int, int]] = []
+        if self.skip_code_blocks and "```" in content:
+            ranges.extend(m.span() for m in ImagePatterns.FENCE_BLOCK.finditer(content))
+        if self.skip_inline_code and "`" in content:
+            ranges.extend(m.span() for m in ImagePatterns.INLINE_CODE.finditer(content))
+
+        starts: list[int] = []
+        ends: list[int] = []
+        for start, end in sorted(ranges):
+            if ends and start <= ends[-1]:
+                ends[-1] = max(ends[-1], end)
+            else:
+                starts.append(start)
+                ends.append(end)
+
+        return starts, ends
+
+    def _is_broken(self, clean_path: str, file: Path, ctx: CheckContext) -> bool:
+        """判断清理后的路径是否无效"""
+        # 检查是否为外部链接
+        if self.ignore_external and ctx.resolver.is_external(clean_path):
+            return False
 
-    def _check_video_poster(
-        self,
-        check_line: str,
-        original_line: str,
-        file: Path,
-        line_num: int,
-        ctx: CheckContext,
-    ) -> list[Issue]:
-        """检查 video poster 属性"""
-        return self._check_pattern_matches(
-            ImagePatterns.HTML_VIDEO_POSTER, check_line, original_line, file, line_num, ctx
-        )
+        # 检查路径是否存在（存在性由 ctx.path_exists 按目标路径缓存）
+        return not ctx.resolver.exists(clean_path, file, ctx)
 
-    def _check_path(
+    def _make_issue(
         self,
+        *,
         path: str,
+        clean_path: str,
         file: Path,
         line: int,
         column: int,
         line_content: str,
         ctx: CheckContext,
-    ) -> Issue | None:
-        """检查单个路径"""
-        # 清理路径（去除锚点等）
-        clean_path = self._clean_path(path)
-
-        # 检查是否为外部链接
-        if self.ignore_external and ctx.resolver.is_external(clean_path):
-            return None
-
-        # 检查路径是否存在
-        if ctx.resolver.exists(clean_path, file, ctx):
-            return None
-
-        # 路径不存在，创建 Issue
-        suggestion = self._find_suggestion(clean_path, file, ctx)
-
+    ) -> Issue:
+        """为无效路径创建 Issue"""
         return Issue(
             file=file,
             line=line,
@@ -259,7 +251,7 @@ class ImageChecker(Checker):
             type="broken_image",
             message=f"Image not found: `{clean_path}`",
             original=path,
-            suggestion=suggestion,
+            suggestion=self._find_suggestion(clean_path, file, ctx),
             severity=Severity.ERROR,
             checker=self.name,
             metadata={
@@ -275,9 +267,7 @@ class ImageChecker(Checker):
         - URL 锚点 (#section)
         - 尾随空格
         """
-        path = path.strip()
-        path = ImagePatterns.PATH_SUFFIX.sub("", path)
-        return path
+        return _clean_path_cached(path)
 
     def _find_suggestion(
         self,
@@ -11,6 +11,8 @@ from checks import __version__
 
 if TYPE_CHECKING:
     from checks.config import Config
+    from checks.core.issue import Issue
+    from checks.runner import CheckRunner
 
 
 def main(argv: list[str] | None = None) -> int:
@@ -70,6 +72,13 @@ def create_parser() -> argparse.ArgumentParser:
     check_parser.add_argument(
         "--checker", action="append", default=[], help="Only run specified checker(s)"
     )
+    check_parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=None,
+        help="Check files in N worker processes (default: serial)",
+    )
     check_parser.add_argument("--json", action="store_true", help="Output in JSON format")
     check_parser.add_argument("--quiet", "-q", action="store_true", help="Only show summary")
     check_parser.set_defaults(func=cmd_check)
@@ -126,13 +135,13 @@ def cmd_check(args: argparse.Namespace) -> int:
     runner = CheckRunner(config=config, root=root)
 
     if args.json:
-        issues = runner.run(report=False)
+        issues = _run_checks(runner, args.jobs, report=False)
         _output_json(issues, root)
     elif args.quiet:
-        issues = runner.run(report=False)
+        issues = _run_checks(runner, args.jobs, report=False)
         _output_summary(issues)
     else:
-        issues = runner.run(report=True)
+        issues = _run_checks(runner, args.jobs, report=True)
 
     # 返回码：有错误返回 1
     from checks.core.issue import Severity
@@ -141,6 +150,13 @@ def cmd_check(args: argparse.Namespace) -> int:
     return 1 if has_errors else 0
 
 
+def _run_checks(runner: CheckRunner, jobs: int | None, report: bool) -> list[Issue]:
+    """运行检查：默认串行，仅显式指定多个工作进程时并行"""
+    if jobs is not None and jobs > 1:
+        return runner.run_parallel(max_workers=jobs, report=report)
+    return runner.run(report=report)
+
+
 def cmd_fix(args: argparse.Namespace) -> int:
     """执行 fix 命令"""
     from checks.core.colors import success
@@ -243,6 +259,7 @@ def cmd_list(args: argparse.Namespace) -> int:
 
     if args.checkers or (not args.checkers and not args.resolvers):
         print("Available checkers:")
+        # slots 数据类的字段默认值不保留在类属性上，从实例读取
         print(f"  {info('image')} - {ImageChecker.description}")
 
     if args.resolvers or (not args.checkers and not args.resolvers):
@@ -260,15 +277,20 @@ def _output_json(issues: list, root: Path) -> None:
     import json
 
     output = []
+    # 同一文件的问题共享相对路径，每个文件只计算一次
+    rel_paths: dict[Path, str] = {}
     for issue in issues:
-        try:
-            rel_path = issue.file.relative_to(root)
-        except ValueError:
-            rel_path = issue.file
+        rel_str = rel_paths.get(issue.file)
+        if rel_str is None:
+            try:
+                rel_str = issue.file.relative_to(root).as_posix()
+            except ValueError:
+                rel_str = issue.file.as_posix()
+            rel_paths[issue.file] = rel_str
 
         output.append(
             {
-                "file": rel_path.as_posix(),
+                "file": rel_str,
                 "line": issue.line,
                 "column": issue.column,
                 "type": issue.type,
@@ -290,9 +312,14 @@ def _output_summary(issues: list) -> None:
         print("\033[92m✓ No issues found\033[0m")
         return
 
-    errors = sum(1 for i in issues if i.severity == Severity.ERROR)
-    warnings = sum(1 for i in issues if i.severity == Severity.WARNING)
-    fixable = sum(1 for i in issues if i.has_suggestion)
+    errors = warnings = fixable = 0
+    for i in issues:
+        if i.severity == Severity.ERROR:
+            errors += 1
+        elif i.severity == Severity.WARNING:
+            warnings += 1
+        if i.suggestion is not None:
+            fixable += 1
 
     parts = []
     if errors:
@@ -2,7 +2,12 @@
 
 from __future__ import annotations
 
+import fnmatch
+import glob
+import os
+import re
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
@@ -45,6 +50,8 @@ class Config:
         reporter: 报告器
         output: 输出配置
         fix: 修复配置
+        max_cache_bytes: 文件内容与行缓存上限（按字符数粗略估算，不含 str/list
+            对象本身的开销，实际内存占用会更高），None 表示不限制
     """
 
     root: str | Path = "."
@@ -60,6 +67,9 @@ class Config:
     output: OutputConfig = field(default_factory=OutputConfig)
     fix: FixConfig = field(default_factory=FixConfig)
 
+    # 缓存
+    max_cache_bytes: int | None = 256 * 1024 * 1024
+
     # 钩子函数
     before_check: Callable[..., Any] | None = None
     after_check: Callable[..., Any] | None = None
@@ -93,6 +103,31 @@ class Config:
                 color=color_mode,
             )
 
+    @property
+    def compiled_filter(self) -> tuple[re.Pattern[str], re.Pattern[str] | None]:
+        """将 include/exclude 模式编译为联合正则表达式
+
+        include 采用 Path.glob 语义（``**`` 匹配零或多级目录），
+        exclude 采用 fnmatch 语义（``*`` 可跨越目录分隔符）。
+        二者均用于匹配相对于根目录的 POSIX 风格路径。
+
+        Returns:
+            (include 正则, exclude 正则)，没有 exclude 模式时后者为 None
+        """
+        return _compile_filter(tuple(self.include), tuple(self.exclude))
+
+    @property
+    def compiled_prune(self) -> re.Pattern[str] | None:
+        """将 exclude 中整目录排除的模式编译为目录正则
+
+        形如 ``dir/*`` 或 ``dir/**`` 的 exclude 模式会排除 ``dir`` 下的所有文件，
+        遍历时可直接跳过匹配 ``dir`` 部分的目录，而不必逐个文件过滤。
+
+        Returns:
+            匹配可跳过目录（相对 POSIX 路径）的正则，没有此类模式时为 None
+        """
+        return _compile_prune(tuple(self.exclude))
+
     def resolve_root(self, config_dir: Path) -> Path:
         """解析项目根目录的绝对路径
 
@@ -109,6 +144,28 @@ class Config:
         return (config_dir / root).resolve()
 
 
+@lru_cache(maxsize=32)
+def _compile_filter(
+    include: tuple[str, ...], exclude: tuple[str, ...]
+) -> tuple[re.Pattern[str], re.Pattern[str] | None]:
+    """编译 include/exclude 联合正则（按模式元组缓存）"""
+    # Windows 下文件名不区分大小写
+    flags = re.IGNORECASE if os.name == "nt" else 0
+
+    # 遍历得到的相对路径不含 "./" 等冗余部分，模式先按 Path 规范化
+    include_re = re.compile(
+        "|".join(
+            glob.translate(Path(p).as_posix(), recursive=True, include_hidden=True) for p in include
+        )
+        or "(?!)",
+        flags,
+    )
+    exclude_re = (
+        re.compile("|".join(fnmatch.translate(p) for p in exclude), flags) if exclude else None
+    )
+    return include_re, exclude_re
+
+
 def load_config(config_path: Path | str | None = None) -> tuple[Config, Path]:
     """加载配置文件
 
@@ -172,3 +229,17 @@ def _get_default_config_file() -> Path | None:
     if config_file.exists():
         return config_file
     return None
+
+
+@lru_cache(maxsize=32)
+def _compile_prune(exclude: tuple[str, ...]) -> re.Pattern[str] | None:
+    """编译可整体跳过的目录正则（按模式元组缓存）"""
+    flags = re.IGNORECASE if os.name == "nt" else 0
+
+    # fnmatch 的 * 可跨越目录：目录 d 匹配 head 时，d/ 下的任何文件都匹配 head/*
+    dir_patterns = []
+    for pattern in exclude:
+        head = pattern.rstrip("*")
+        if head != pattern and len(head) > 1 and head.endswith("/"):
+            dir_patterns.append(fnmatch.translate(head[:-1]))
+    return re.compile("|".join(dir_patterns), flags) if dir_patterns else None
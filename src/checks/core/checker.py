@@ -16,6 +16,8 @@ class Checker(ABC):
     """检查器抽象基类
 
     所有检查器都需要继承此类并实现 check 方法。
+    基类不占用实例字典（``__slots__ = ()``），子类可以使用
+    ``@dataclass(slots=True)`` 获得紧凑的实例布局。
 
     Attributes:
         name: 检查器名称，用于标识和配置
@@ -23,6 +25,8 @@ class Checker(ABC):
         enabled: 是否启用
     """
 
+    __slots__ = ()
+
     name: str = "base"
     description: str = "Base checker"
     enabled: bool = True
@@ -41,6 +45,14 @@ class Checker(ABC):
         """
         ...
 
+    def before_check(self, ctx: CheckContext) -> None:  # noqa: B027
+        """每次运行开始前调用，用于重置检查器内部状态（如缓存）
+
+        Args:
+            ctx: 检查上下文
+        """
+        pass
+
     def can_fix(self, issue: Issue) -> bool:
         """判断是否能自动修复此问题
 
@@ -5,8 +5,8 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
 from enum import Enum
+from types import SimpleNamespace
 
 
 class Color(Enum):
@@ -36,28 +36,40 @@ class Color(Enum):
     RESET = "0"
 
 
-@dataclass(frozen=True)
-class Style:
-    """预定义样式"""
-
-    # 状态
-    SUCCESS: str = f"\033[{Color.BRIGHT_GREEN.value}m"
-    ERROR: str = f"\033[{Color.BRIGHT_RED.value}m"
-    WARNING: str = f"\033[{Color.BRIGHT_YELLOW.value}m"
-    INFO: str = f"\033[{Color.BRIGHT_CYAN.value}m"
-    MUTED: str = f"\033[{Color.BRIGHT_BLACK.value}m"
-
-    # 内容
-    ORIGINAL: str = f"\033[{Color.BRIGHT_RED.value}m"
-    SUGGESTION: str = f"\033[{Color.BRIGHT_GREEN.value}m"
-    HIGHLIGHT: str = f"\033[{Color.BRIGHT_MAGENTA.value}m"
-
-    # 重置
-    RESET: str = "\033[0m"
-
-
-# 全局样式实例
-style = Style()
+# 预拼接的 ANSI 转义序列
+# 状态
+SUCCESS = f"\033[{Color.BRIGHT_GREEN.value}m"
+ERROR = f"\033[{Color.BRIGHT_RED.value}m"
+WARNING = f"\033[{Color.BRIGHT_YELLOW.value}m"
+INFO = f"\033[{Color.BRIGHT_CYAN.value}m"
+MUTED = f"\033[{Color.BRIGHT_BLACK.value}m"
+
+# 内容
+ORIGINAL = f"\033[{Color.BRIGHT_RED.value}m"
+SUGGESTION = f"\033[{Color.BRIGHT_GREEN.value}m"
+HIGHLIGHT = f"\033[{Color.BRIGHT_MAGENTA.value}m"
+
+# 重置
+RESET = "\033[0m"
+
+# 颜色（枚举成员及其代码字符串）到转义前缀的映射，供 colorize 查表
+_PREFIX: dict[Color | str, str] = {}
+for _color in Color:
+    _PREFIX[_color] = _PREFIX[_color.value] = f"\033[{_color.value}m"
+del _color
+
+# 兼容旧的 style.X 访问方式
+style = SimpleNamespace(
+    SUCCESS=SUCCESS,
+    ERROR=ERROR,
+    WARNING=WARNING,
+    INFO=INFO,
+    MUTED=MUTED,
+    ORIGINAL=ORIGINAL,
+    SUGGESTION=SUGGESTION,
+    HIGHLIGHT=HIGHLIGHT,
+    RESET=RESET,
+)
 
 
 def colorize(text: str, color: Color | str) -> str:
@@ -70,30 +82,31 @@ def colorize(text: str, color: Color | str) -> str:
     Returns:
         带 ANSI 颜色代码的字符串
     """
-    code = color.value if isinstance(color, Color) else color
-    return f"\033[{code}m{text}\033[0m"
+    # 已知颜色直接查表，其他颜色代码字符串现场拼接
+    prefix = _PREFIX.get(color) or f"\033[{color}m"
+    return prefix + text + RESET
 
 
 def success(text: str) -> str:
     """成功样式（绿色）"""
-    return f"{style.SUCCESS}{text}{style.RESET}"
+    return SUCCESS + text + RESET
 
 
 def error(text: str) -> str:
     """错误样式（红色）"""
-    return f"{style.ERROR}{text}{style.RESET}"
+    return ERROR + text + RESET
 
 
 def warning(text: str) -> str:
     """警告样式（黄色）"""
-    return f"{style.WARNING}{text}{style.RESET}"
+    return WARNING + text + RESET
 
 
 def info(text: str) -> str:
     """信息样式（青色）"""
-    return f"{style.INFO}{text}{style.RESET}"
+    return INFO + text + RESET
 
 
 def muted(text: str) -> str:
     """淡化样式（灰色）"""
-    return f"{style.MUTED}{text}{style.RESET}"
+    return MUTED + text + RESET
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import os
+from collections import OrderedDict, defaultdict
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import TYPE_CHECKING
@@ -9,7 +11,10 @@ from typing import TYPE_CHECKING
 from checks.core.issue import ContextLines
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from checks.config import Config
+    from checks.core.issue import Issue
     from checks.core.resolver import PathResolver
 
 
@@ -24,13 +29,23 @@ class CheckContext:
         root: 项目根目录
         config: 配置对象
         resolver: 路径解析器
-        file_cache: 文件内容缓存
+        file_cache: 文件内容缓存（LRU，总量受 config.max_cache_bytes 限制）
+        cache_bytes: 文件内容与行缓存当前占用（按字符数粗略估算，不含对象开销）
+        lines_cache: 文件行缓存（以解析后的路径为键）
+        exists_cache: 路径存在性缓存（以路径字符串为键）
+        dir_cache: 目录索引缓存（以目录路径字符串为键，值为 (文件名列表, 子目录名列表)）
+        resolve_cache: 绝对路径缓存（原始路径 -> resolve() 结果）
     """
 
     root: Path
     config: Config
     resolver: PathResolver
-    file_cache: dict[Path, str] = field(default_factory=dict)
+    file_cache: OrderedDict[Path, str] = field(default_factory=OrderedDict)
+    cache_bytes: int = field(default=0, init=False)
+    lines_cache: dict[Path, list[str]] = field(default_factory=dict)
+    exists_cache: dict[str, bool] = field(default_factory=dict)
+    dir_cache: dict[str, tuple[list[str], list[str]]] = field(default_factory=dict)
+    resolve_cache: dict[Path | str, Path] = field(default_factory=dict)
 
     def __post_init__(self):
         """确保 root 是绝对路径"""
@@ -49,15 +64,110 @@ class CheckContext:
             FileNotFoundError: 文件不存在
             UnicodeDecodeError: 编码错误
         """
-        path = Path(path).resolve()
+        path = self.resolve_path(path)
+        cache = self.file_cache
+
+        content = cache.get(path)
+        if content is not None:
+            cache.move_to_end(path)
+            return content
+
+        content = path.read_text(encoding="utf-8")
+        cache[path] = content
+        self.cache_bytes += len(content)
+        self._evict_files()
+
+        return content
+
+    def _evict_files(self) -> None:
+        """超出上限时淘汰最久未使用的文件及其行缓存（至少保留当前文件）"""
+        limit = self.config.max_cache_bytes
+        if limit is None:
+            return
+        cache = self.file_cache
+        while self.cache_bytes > limit and len(cache) > 1:
+            evicted, old = cache.popitem(last=False)
+            self.cache_bytes -= len(old)
+            # 行列表与原文字符数相当，按同样大小计入
+            if self.lines_cache.pop(evicted, None) is not None:
+                self.cache_bytes -= len(old)
+
+    def resolve_path(self, path: Path | str) -> Path:
+        """获取绝对路径（带缓存）
+
+        Path.resolve() 会逐级 stat 路径分量，同一文件的多次上下文查询只解析一次。
+
+        Args:
+            path: 文件路径
+
+        Returns:
+            解析后的绝对路径
+        """
+        resolved = self.resolve_cache.get(path)
+        if resolved is None:
+            resolved = Path(path).resolve()
+            self.resolve_cache[path] = resolved
+        return resolved
+
+    def path_exists(self, path: Path | str) -> bool:
+        """检查路径是否存在（带缓存）
+
+        直接使用 os.path.exists 而非 Path.exists，
+        同一路径在一次运行中只 stat 一次。若所在目录已通过 list_dir
+        缓存且包含该名称，则直接判定存在，无需 stat。
+
+        Args:
+            path: 文件或目录路径
+
+        Returns:
+            路径是否存在
+        """
+        key = os.fspath(path)
+        exists = self.exists_cache.get(key)
+        if exists is None:
+            head, name = os.path.split(key)
+            entries = self.dir_cache.get(head)
+            if entries is not None and (name in entries[0] or name in entries[1]):
+                exists = True
+            else:
+                exists = os.path.exists(key)  # noqa: PTH110
+            self.exists_cache[key] = exists
+        return exists
+
+    def list_dir(self, path: Path | str) -> tuple[list[str], list[str]]:
+        """列出目录内容（带缓存）
 
-        if path not in self.file_cache:
-            self.file_cache[path] = path.read_text(encoding="utf-8")
+        每个目录在一次运行中只 scandir 一次，供模糊匹配等反复查询。
 
-        return self.file_cache[path]
+        Args:
+            path: 目录路径
+
+        Returns:
+            (文件名列表, 子目录名列表)，目录不存在或无法读取时均为空
+        """
+        key = os.fspath(path)
+        entries = self.dir_cache.get(key)
+        if entries is None:
+            files: list[str] = []
+            dirs: list[str] = []
+            try:
+                with os.scandir(key) as it:
+                    for entry in it:
+                        if entry.is_file():
+                            files.append(entry.name)
+                        elif entry.is_dir():
+                            dirs.append(entry.name)
+            except OSError:
+                # 不存在、不是目录或无权限时按空目录处理（与 os.path.exists 返回 False 一致）
+                pass
+            entries = (files, dirs)
+            self.dir_cache[key] = entries
+        return entries
 
     def get_file_lines(self, path: Path) -> list[str]:
-        """获取文件所有行
+        """获取文件所有行（带缓存）
+
+        同一文件只 splitlines 一次，返回的列表为共享缓存，调用方不应修改。
 
         Args:
             path: 文件路径
@@ -65,8 +175,19 @@ class CheckContext:
         Returns:
             行列表（不含换行符）
         """
+        path = self.resolve_path(path)
+        lines = self.lines_cache.get(path)
+        if lines is not None:
+            # 行缓存与文件内容一同淘汰，命中时同样刷新 LRU 位置
+            self.file_cache.move_to_end(path)
+            return lines
+
         content = self.read_file(path)
-        return content.splitlines()
+        lines = content.splitlines()
+        self.lines_cache[path] = lines
+        self.cache_bytes += len(content)
+        self._evict_files()
+        return lines
 
     def get_context_lines(
         self, file: Path, line: int, before: int = 3, after: int = 3
@@ -82,19 +203,27 @@ class CheckContext:
         Returns:
             ContextLines 对象
         """
-        lines = self.get_file_lines(file)
-        line_idx = line - 1  # 转换为 0-based
+        return _context_window(self.get_file_lines(file), line, before, after)
 
-        # 计算范围
-        start = max(0, line_idx - before)
-        end = min(len(lines), line_idx + after + 1)
+    def fill_context(self, issues: Iterable[Issue], before: int = 3, after: int = 3) -> None:
+        """批量填充问题的上下文（已有上下文的问题跳过）
 
-        # 构建上下文
-        before_lines = [(i + 1, lines[i]) for i in range(start, line_idx)]
-        current_line = (line, lines[line_idx] if line_idx < len(lines) else "")
-        after_lines = [(i + 1, lines[i]) for i in range(line_idx + 1, end)]
+        按文件分组，每个文件只取一次行列表，再逐个切出上下文窗口。
 
-        return ContextLines(before=before_lines, current=current_line, after=after_lines)
+        Args:
+            issues: 问题列表
+            before: 前面的行数
+            after: 后面的行数
+        """
+        by_file: defaultdict[Path, list[Issue]] = defaultdict(list)
+        for issue in issues:
+            if issue.context is None:
+                by_file[issue.file].append(issue)
+
+        for file, group in by_file.items():
+            lines = self.get_file_lines(file)
+            for issue in group:
+                issue.context = _context_window(lines, issue.line, before, after)
 
     def relative_path(self, path: Path) -> Path:
         """获取相对于项目根目录的路径
@@ -106,10 +235,37 @@ class CheckContext:
             相对路径，如果不在项目内则返回原路径
         """
         try:
-            return path.resolve().relative_to(self.root)
+            return self.resolve_path(path).relative_to(self.root)
         except ValueError:
             return path
 
+    def clear_path_cache(self):
+        """清空路径存在性、目录索引和绝对路径缓存"""
+        self.exists_cache.clear()
+        self.dir_cache.clear()
+        self.resolve_cache.clear()
+
     def clear_cache(self):
-        """清空文件缓存"""
+        """清空文件缓存和路径缓存"""
         self.file_cache.clear()
+        self.lines_cache.clear()
+        self.cache_bytes = 0
+        self.clear_path_cache()
+
+
+def _context_window(lines: list[str], line: int, before: int, after: int) -> ContextLines:
+    """从行列表中切出指定行的上下文窗口"""
+    line_idx = line - 1  # 转换为 0-based
+
+    # 计算范围
+    start = max(0, line_idx - before)
+    end = min(len(lines), line_idx + after + 1)
+
+    # 一次切片编号窗口内的行，再按目标行位置拆分
+    numbered = list(enumerate(lines[start:end], start + 1))
+    pivot = line_idx - start
+    before_lines = numbered[: max(pivot, 0)]
+    current_line = (line, lines[line_idx] if line_idx < len(lines) else "")
+    after_lines = numbered[pivot + 1 :]
+
+    return ContextLines(before=before_lines, current=current_line, after=after_lines)
@@ -18,7 +18,7 @@ class ChecksError(Exception):
 
     def __str__(self) -> str:
         if self.context:
-            ctx_str = ", ".join(f"{k}={v!r}" for k, v in self.context.items())
+            ctx_str = ", ".join([f"{k}={v!r}" for k, v in self.context.items()])
             return f"{self.message} ({ctx_str})"
         return self.message
 
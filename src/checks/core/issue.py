@@ -4,8 +4,12 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from enum import Enum
+from itertools import chain
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
 
 
 class Severity(Enum):
@@ -19,7 +23,7 @@ class Severity(Enum):
         return self.value
 
 
-@dataclass
+@dataclass(slots=True)
 class ContextLines:
     """上下文行信息"""
 
@@ -32,8 +36,12 @@ class ContextLines:
         """获取所有行（包括上下文）"""
         return [*self.before, self.current, *self.after]
 
+    def iter_lines(self) -> Iterator[tuple[int, str]]:
+        """按顺序迭代所有行，不构建中间列表"""
+        return chain(self.before, (self.current,), self.after)
+
 
-@dataclass
+@dataclass(slots=True)
 class Fix:
     """修复方案"""
 
@@ -46,16 +54,19 @@ class Fix:
 
     def apply_to_line(self, line_content: str) -> str:
         """将修复应用到行内容"""
-        if self.start_col is None:
-            # 基于文本匹配替换
+        start = self.start_col
+        if start is None:
+            # 基于文本匹配替换（原文与替换相同时无需改动）
+            if self.original == self.replacement:
+                return line_content
             return line_content.replace(self.original, self.replacement, 1)
         else:
-            # 精确位置替换
-            end = self.end_col if self.end_col is not None else self.start_col + len(self.original)
-            return line_content[: self.start_col] + self.replacement + line_content[end:]
+            # 精确位置替换（join 按总长度一次分配）
+            end = self.end_col if self.end_col is not None else start + len(self.original)
+            return "".join((line_content[:start], self.replacement, line_content[end:]))
 
 
-@dataclass
+@dataclass(slots=True)
 class Issue:
     """表示检查发现的一个问题"""
 
@@ -77,7 +88,8 @@ class Issue:
 
     def __post_init__(self):
         """确保 file 是 Path 对象"""
-        if isinstance(self.file, str):
+        # 调用方几乎总是传入 Path，精确类型比较比 isinstance 更快
+        if type(self.file) is str:
             self.file = Path(self.file)
 
     @property
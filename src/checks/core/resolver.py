@@ -25,6 +25,14 @@ class PathResolver(ABC):
     name: str = "base"
     description: str = "Base path resolver"
 
+    def before_check(self, ctx: CheckContext) -> None:  # noqa: B027
+        """每次运行开始前调用，用于重置解析器内部状态（如缓存）
+
+        Args:
+            ctx: 检查上下文
+        """
+        pass
+
     @abstractmethod
     def resolve(self, path: str, source_file: Path, ctx: CheckContext) -> Path | None:
         """解析相对路径为绝对路径
@@ -87,40 +95,47 @@ class PathResolver(ABC):
 
         # 获取目标目录
         target_dir = resolved.parent
-        if not target_dir.exists():
+        if not ctx.path_exists(target_dir):
             # 目录不存在，尝试在父目录中查找相似目录
             parent = target_dir.parent
-            if parent.exists():
-                similar_dirs = get_close_matches(
-                    target_dir.name,
-                    [d.name for d in parent.iterdir() if d.is_dir()],
-                    n=1,
-                    cutoff=threshold,
-                )
+            if ctx.path_exists(parent):
+                _, dir_names = ctx.list_dir(parent)
+                similar_dirs = get_close_matches(target_dir.name, dir_names, n=1, cutoff=threshold)
                 if similar_dirs:
                     target_dir = parent / similar_dirs[0]
 
-        if not target_dir.exists():
+        if not ctx.path_exists(target_dir):
             return []
 
-        # 在目录中查找相似文件
+        # 在目录中查找相似文件（使用缓存的目录索引）
         target_name = resolved.name
-        candidates = [f.name for f in target_dir.iterdir() if f.is_file()]
+        candidates, _ = ctx.list_dir(target_dir)
         similar_files = get_close_matches(target_name, candidates, n=3, cutoff=threshold)
 
-        # 构建相对路径
-        result = []
-        for similar in similar_files:
-            similar_path = target_dir / similar
-            try:
-                # 尝试获取相对于源文件目录的路径
-                rel_path = similar_path.relative_to(source_file.parent)
-                result.append(rel_path.as_posix())
-            except ValueError:
-                # 如果无法获取相对路径，使用绝对路径
-                result.append(similar_path.as_posix())
-
-        return result
+        # 构建相对路径：候选文件同处一个目录，前缀只需计算一次
+        prefix = self._relative_prefix(target_dir, source_file.parent)
+        if prefix is None:
+            # 如果无法获取相对路径，使用绝对路径
+            prefix = target_dir.as_posix().rstrip("/") + "/"
+
+        return [prefix + similar for similar in similar_files]
+
+    @staticmethod
+    def _relative_prefix(directory: Path, base: Path) -> str | None:
+        """计算目录相对于 base 的 POSIX 前缀
+
+        Args:
+            directory: 候选文件所在目录
+            base: 基准目录
+
+        Returns:
+            以 "/" 结尾的相对前缀（同一目录时为空串），不在 base 下时返回 None
+        """
+        try:
+            rel = directory.relative_to(base).as_posix()
+        except ValueError:
+            return None
+        return "" if rel == "." else rel + "/"
 
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}(name={self.name!r})"
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import time
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from datetime import datetime
@@ -23,7 +24,7 @@ class FixAction(Enum):
     QUIT = "quit"  # 退出
 
 
-@dataclass
+@dataclass(slots=True)
 class FixResult:
     """修复结果"""
 
@@ -39,14 +40,14 @@ class FixResult:
         return self.applied and self.action == FixAction.ACCEPT
 
 
-@dataclass
+@dataclass(slots=True)
 class FixSession:
     """修复会话
 
     记录一次修复操作的所有信息，用于生成 patch 和撤销。
     """
 
-    id: str = field(default_factory=lambda: datetime.now().strftime("%Y%m%d_%H%M%S"))
+    id: str = field(default_factory=lambda: time.strftime("%Y%m%d_%H%M%S"))
     results: list[FixResult] = field(default_factory=list)
     started_at: datetime = field(default_factory=datetime.now)
     completed_at: datetime | None = None
@@ -95,6 +96,9 @@ class Fixer(ABC):
 
     def filter_fixable(self, issues: list[Issue]) -> list[Issue]:
         """过滤出可修复的问题"""
+        # 未覆盖 can_fix 时直接内联判断，省去逐个方法调用
+        if type(self).can_fix is Fixer.can_fix:
+            return [i for i in issues if i.suggestion is not None]
         return [i for i in issues if self.can_fix(i)]
 
     def __repr__(self) -> str:
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
@@ -16,6 +17,19 @@ if TYPE_CHECKING:
     from checks.core.issue import Issue
 
 
+# 固定输出文本（不含变量，直接复用同一字符串对象）
+_PROMPT = "\033[95m[y]es [n]o [a]ll [q]uit [d]iff [?]help\033[0m: "
+_THIN_RULE = "─" * 40
+_THICK_RULE = "═" * 40
+_NO_FIXABLE = "\033[92m✓ No fixable issues found\033[0m"
+_ACCEPTED = "\033[92m✓ Accepted\033[0m"
+_SKIPPED = "\033[93m○ Skipped\033[0m"
+_ACCEPTING_ALL = "\033[92m✓ Accepting all remaining fixes...\033[0m"
+_QUIT_REQUESTED = "\033[93m⚠ Quit requested\033[0m"
+_DRY_RUN = "\033[93m[DRY RUN] No changes made\033[0m"
+_NO_FIX = "\033[91mNo fix available\033[0m"
+
+
 @dataclass
 class InteractiveFixer(Fixer):
     """交互式修复器
@@ -50,12 +64,11 @@ class InteractiveFixer(Fixer):
         # 过滤可修复的问题
         fixable = self.filter_fixable(issues)
         if not fixable:
-            print("\033[92m✓ No fixable issues found\033[0m")
+            print(_NO_FIXABLE)
             session.complete()
             return session
 
-        print(f"\nFound \033[93m{len(fixable)}\033[0m fixable issue(s)")
-        print("─" * 40)
+        sys.stdout.write(f"\nFound \033[93m{len(fixable)}\033[0m fixable issue(s)\n{_THIN_RULE}\n")
 
         # 收集要修复的问题
         to_fix: list[Issue] = []
@@ -69,8 +82,8 @@ class InteractiveFixer(Fixer):
                 )
                 continue
 
-            # 显示问题
-            print(f"\n[{i}/{len(fixable)}]")
+            # 显示问题（report_issue 本身按块一次写出）
+            sys.stdout.write(f"\n[{i}/{len(fixable)}]\n")
             self.reporter.report_issue(issue, root)
 
             # 获取用户选择
@@ -82,11 +95,11 @@ class InteractiveFixer(Fixer):
                     session.results.append(
                         FixResult(issue=issue, action=FixAction.ACCEPT, fix=issue.get_fix())
                     )
-                    print("\033[92m✓ Accepted\033[0m")
+                    print(_ACCEPTED)
 
                 case FixAction.SKIP:
                     session.results.append(FixResult(issue=issue, action=FixAction.SKIP))
-                    print("\033[93m○ Skipped\033[0m")
+                    print(_SKIPPED)
 
                 case FixAction.ACCEPT_ALL:
                     accept_all = True
@@ -94,20 +107,20 @@ class InteractiveFixer(Fixer):
                     session.results.append(
                         FixResult(issue=issue, action=FixAction.ACCEPT, fix=issue.get_fix())
                     )
-                    print("\033[92m✓ Accepting all remaining fixes...\033[0m")
+                    print(_ACCEPTING_ALL)
 
                 case FixAction.QUIT:
-                    print("\033[93m⚠ Quit requested\033[0m")
+                    print(_QUIT_REQUESTED)
                     break
 
         # 应用修复
         if to_fix:
             print()
-            print("─" * 40)
+            print(_THIN_RULE)
             print(f"Applying \033[92m{len(to_fix)}\033[0m fix(es)...")
 
             if dry_run:
-                print("\033[93m[DRY RUN] No changes made\033[0m")
+                print(_DRY_RUN)
             else:
                 # 使用 PatchFixer 生成和应用 patch
                 self.patch_fixer.fix(to_fix, root, dry_run=False)
@@ -136,8 +149,7 @@ class InteractiveFixer(Fixer):
         """提示用户选择操作"""
         while True:
             try:
-                prompt = "\033[95m[y]es [n]o [a]ll [q]uit [d]iff [?]help\033[0m: "
-                choice = input(prompt).strip().lower()
+                choice = input(_PROMPT).strip().lower()
 
                 match choice:
                     case "y" | "yes":
@@ -168,7 +180,7 @@ class InteractiveFixer(Fixer):
         """显示 diff 预览"""
         fix = issue.get_fix()
         if not fix:
-            print("\033[91mNo fix available\033[0m")
+            print(_NO_FIX)
             return
 
         print()
@@ -180,20 +192,24 @@ class InteractiveFixer(Fixer):
 
     def _print_summary(self, session: FixSession) -> None:
         """打印修复摘要"""
-        accepted = len([r for r in session.results if r.action == FixAction.ACCEPT])
-        skipped = len([r for r in session.results if r.action == FixAction.SKIP])
-        applied = len([r for r in session.results if r.applied])
-
-        print()
-        print("═" * 40)
-        print("Summary:")
+        accepted = skipped = applied = 0
+        for r in session.results:
+            if r.action == FixAction.ACCEPT:
+                accepted += 1
+            elif r.action == FixAction.SKIP:
+                skipped += 1
+            if r.applied:
+                applied += 1
+
+        lines = ["", _THICK_RULE, "Summary:"]
         if applied:
-            print(f"  \033[92m✓ {applied} fix(es) applied\033[0m")
+            lines.append(f"  \033[92m✓ {applied} fix(es) applied\033[0m")
         if accepted - applied:
-            print(f"  \033[93m○ {accepted - applied} fix(es) pending\033[0m")
+            lines.append(f"  \033[93m○ {accepted - applied} fix(es) pending\033[0m")
         if skipped:
-            print(f"  \033[90m○ {skipped} issue(s) skipped\033[0m")
-        print("═" * 40)
+            lines.append(f"  \033[90m○ {skipped} issue(s) skipped\033[0m")
+        lines.append(_THICK_RULE)
+        sys.stdout.write("\n".join(lines) + "\n")
 
 
 def run_interactive_fix(
@@ -204,13 +220,10 @@ def run_interactive_fix(
 
     # 填充上下文信息
     if ctx:
-        for issue in issues:
-            if issue.context is None:
-                issue.context = ctx.get_context_lines(
-                    issue.file,
-                    issue.line,
-                    before=fixer.reporter.context_lines,
-                    after=fixer.reporter.context_lines,
-                )
+        ctx.fill_context(
+            issues,
+            before=fixer.reporter.context_lines,
+            after=fixer.reporter.context_lines,
+        )
 
     return fixer.fix(issues, root, dry_run=dry_run)
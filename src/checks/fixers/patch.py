@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import difflib
+import re
+import shutil
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
@@ -11,14 +13,19 @@ from typing import TYPE_CHECKING
 from checks.fixers.base import FixAction, Fixer, FixResult, FixSession
 
 if TYPE_CHECKING:
+    from collections.abc import Mapping
+
     from checks.core.issue import Issue
 
+# Hunk 头：@@ -start[,count] +start[,count] @@
+_HUNK_HEADER = re.compile(r"@@\s+-(\d+)\S*\s+\S")
+
 
 @dataclass
 class PatchFixer(Fixer):
     """基于 Patch 文件的修复器
 
-    生成 unified diff 格式的 patch 文件，支持：
+    生成 unified diff 格式的 patch 文件并直接写回修复内容，支持：
     - 修复预览（dry-run）
     - Patch 文件保存
     - 撤销修复（通过 patch -R）
@@ -34,6 +41,14 @@ class PatchFixer(Fixer):
     patch_dir: Path = field(default_factory=lambda: Path(".checks/patches"))
     context_lines: int = 3
 
+    # 外部命令可用性缓存：命令名 -> 是否在 PATH 中
+    _tools: dict[str, bool] = field(default_factory=dict, init=False, repr=False, compare=False)
+
+    # 已读取的文件内容缓存：路径 -> (mtime_ns, size, 内容)
+    _content_cache: dict[Path, tuple[int, int, str]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
     def fix(self, issues: list[Issue], root: Path, dry_run: bool = False) -> FixSession:
         """执行修复（生成 patch）"""
         session = FixSession()
@@ -49,21 +64,28 @@ class PatchFixer(Fixer):
         for issue in fixable:
             by_file.setdefault(issue.file, []).append(issue)
 
-        # 为每个文件生成修复
-        all_patches: list[str] = []
+        # 为每个文件生成修复（各文件的 diff 片段收集到同一列表，最后只 join 一次）
+        patch_chunks: list[str] = []
+        fixed_files: list[tuple[Path, str]] = []
         for file, file_issues in by_file.items():
-            patch, results = self._fix_file(file, file_issues, root)
-            if patch:
-                all_patches.append(patch)
+            chunks, fixed_content, results = self._fix_file_chunks(file, file_issues, root)
+            if chunks:
+                if patch_chunks:
+                    patch_chunks.append("\n")  # 文件之间以空行分隔
+                patch_chunks.extend(chunks)
+                fixed_files.append((file, fixed_content))
             session.results.extend(results)
 
         # 保存 patch 文件
-        if all_patches and not dry_run:
-            combined_patch = "\n".join(all_patches)
+        if patch_chunks and not dry_run:
+            combined_patch = "".join(patch_chunks)
             patch_file = self._save_patch(combined_patch, session.id, root)
 
-            # 应用 patch
-            self._apply_patch(patch_file, root)
+            # 直接写回已修复的内容，patch 文件仅用于审阅和撤销；
+            # 生成 patch 后文件被改动时，回退到应用 patch
+            if not self._write_fixed(fixed_files):
+                self._apply_patch(patch_file, root)
+            self._content_cache.clear()  # 文件已被改写，缓存内容作废
 
             # 标记为已应用
             for result in session.results:
@@ -77,27 +99,34 @@ class PatchFixer(Fixer):
         self, file: Path, issues: list[Issue], root: Path
     ) -> tuple[str | None, list[FixResult]]:
         """修复单个文件的所有问题"""
+        chunks, _, results = self._fix_file_chunks(file, issues, root)
+        return ("".join(chunks) if chunks else None), results
+
+    def _fix_file_chunks(
+        self, file: Path, issues: list[Issue], root: Path
+    ) -> tuple[list[str] | None, str, list[FixResult]]:
+        """修复单个文件的所有问题，返回未拼接的 diff 片段和修复后的全文"""
         results: list[FixResult] = []
 
         # 读取原始内容
         try:
-            original_content = file.read_text(encoding="utf-8")
+            original_content = self._read_cached(file)
         except Exception as e:
             for issue in issues:
                 results.append(
                     FixResult(issue=issue, action=FixAction.SKIP, error=f"Failed to read file: {e}")
                 )
-            return None, results
-
-        # 按行号降序排序（从后往前修复，避免行号偏移）
-        issues = sorted(issues, key=lambda i: i.line, reverse=True)
+            return None, "", results
 
-        # 应用修复
-        lines = original_content.splitlines(keepends=True)
+        # 应用修复：只记录被替换的行（行下标 -> 新内容），不复制整个行列表。
+        # 修复均为单行替换、按原始行下标记录，不存在行号偏移，无需排序；
+        # 同一行的多个修复按问题顺序依次应用
+        original_lines = original_content.splitlines(keepends=True)
+        replaced: dict[int, str] = {}
 
         # 确保最后一行有换行符
-        if lines and not lines[-1].endswith("\n"):
-            lines[-1] += "\n"
+        if original_lines and not original_lines[-1].endswith("\n"):
+            replaced[len(original_lines) - 1] = original_lines[-1] + "\n"
 
         for issue in issues:
             fix = issue.get_fix()
@@ -109,10 +138,9 @@ class PatchFixer(Fixer):
 
             # 应用修复到行
             line_idx = issue.line - 1
-            if 0 <= line_idx < len(lines):
-                original_line = lines[line_idx]
-                new_line = fix.apply_to_line(original_line)
-                lines[line_idx] = new_line
+            if 0 <= line_idx < len(original_lines):
+                original_line = replaced.get(line_idx, original_lines[line_idx])
+                replaced[line_idx] = fix.apply_to_line(original_line)
 
                 results.append(
                     FixResult(
@@ -129,9 +157,9 @@ class PatchFixer(Fixer):
                 )
 
         # 生成 diff
-        fixed_content = "".join(lines)
-        if original_content == fixed_content:
-            return None, results
+        changed = sorted(i for i, line in replaced.items() if line != original_lines[i])
+        if not changed:
+            return None, "", results
 
         # 获取相对路径
         try:
@@ -139,15 +167,71 @@ class PatchFixer(Fixer):
         except ValueError:
             rel_path = file
 
+        fromfile = f"a/{rel_path.as_posix()}"
+        tofile = f"b/{rel_path.as_posix()}"
+
+        fixed_lines = original_lines.copy()
+        for i, line in replaced.items():
+            fixed_lines[i] = line
+        fixed_content = "".join(fixed_lines)
+
+        # 每个改动行仍是单独一行时，行号一一对应，可直接按改动行生成 hunk
+        if all(len(replaced[i].splitlines()) == 1 for i in changed):
+            chunks = _line_diff(
+                original_lines,
+                replaced,
+                changed,
+                fromfile=fromfile,
+                tofile=tofile,
+                n=self.context_lines,
+            )
+            return chunks, fixed_content, results
+
+        # 修复引入或删除了换行，回退到 difflib
+        if fixed_content == original_content:
+            return None, "", results
+
         diff = difflib.unified_diff(
-            original_content.splitlines(keepends=True),
+            original_lines,
             fixed_content.splitlines(keepends=True),
-            fromfile=f"a/{rel_path.as_posix()}",
-            tofile=f"b/{rel_path.as_posix()}",
+            fromfile=fromfile,
+            tofile=tofile,
             n=self.context_lines,
         )
 
-        return "".join(diff), results
+        return list(diff), fixed_content, results
+
+    def _read_cached(self, file: Path) -> str:
+        """读取文件内容，文件未变化（mtime 与大小相同）时复用上次的解码结果"""
+        st = file.stat()
+        cached = self._content_cache.get(file)
+        if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            return cached[2]
+
+        # 不做换行转换，保留文件原有的 CRLF/LF，写回时未改动的行字节不变
+        with file.open(encoding="utf-8", newline="") as f:
+            content = f.read()
+        self._content_cache[file] = (st.st_mtime_ns, st.st_size, content)
+        return content
+
+    def _write_fixed(self, fixed_files: list[tuple[Path, str]]) -> bool:
+        """将修复后的内容直接写回文件
+
+        仅当所有文件自读取后未变化（mtime 与大小相同）时才写入，
+        否则不写任何文件并返回 False，由调用方改为应用 patch。
+        """
+        for file, _ in fixed_files:
+            cached = self._content_cache.get(file)
+            try:
+                st = file.stat()
+            except OSError:
+                return False
+            if cached is None or cached[0] != st.st_mtime_ns or cached[1] != st.st_size:
+                return False
+
+        for file, content in fixed_files:
+            file.write_text(content, encoding="utf-8", newline="")
+        return True
 
     def _save_patch(self, patch: str, session_id: str, root: Path) -> Path:
         """保存 patch 文件"""
@@ -156,7 +240,8 @@ class PatchFixer(Fixer):
 
         timestamp = datetime.now().strftime("%Y-%m-%d_%H%M%S")
         patch_file = patch_dir / f"{timestamp}_{session_id}.patch"
-        patch_file.write_text(patch, encoding="utf-8")
+        # diff 行保留源文件的换行符，写出时同样不做转换
+        patch_file.write_text(patch, encoding="utf-8", newline="")
 
         return patch_file
 
@@ -166,86 +251,89 @@ class PatchFixer(Fixer):
 
         try:
             # 尝试使用 git apply
-            result = subprocess.run(
-                ["git", "apply", "--whitespace=nowarn", str(patch_file)],
-                check=False,
-                cwd=root,
-                capture_output=True,
-                text=True,
-            )
-            if result.returncode == 0:
-                return True
+            if self._has_tool("git"):
+                result = subprocess.run(
+                    ["git", "apply", "--whitespace=nowarn", str(patch_file)],
+                    check=False,
+                    cwd=root,
+                    capture_output=True,
+                    text=True,
+                )
+                if result.returncode == 0:
+                    return True
 
             # 回退到 patch 命令
-            result = subprocess.run(
-                ["patch", "-p1", "-i", str(patch_file)],
-                check=False,
-                cwd=root,
-                capture_output=True,
-                text=True,
-            )
-            return result.returncode == 0
+            if self._has_tool("patch"):
+                result = subprocess.run(
+                    ["patch", "-p1", "-i", str(patch_file)],
+                    check=False,
+                    cwd=root,
+                    capture_output=True,
+                    text=True,
+                )
+                return result.returncode == 0
 
         except FileNotFoundError:
-            # git/patch 不可用，手动应用
-            return self._manual_apply_patch(patch_file, root)
+            pass
+
+        # git/patch 不可用，手动应用
+        return self._manual_apply_patch(patch_file, root)
+
+    def _has_tool(self, name: str) -> bool:
+        """外部命令是否可用（每个实例只查找一次 PATH）"""
+        found = self._tools.get(name)
+        if found is None:
+            found = self._tools[name] = shutil.which(name) is not None
+        return found
 
     def _manual_apply_patch(self, patch_file: Path, root: Path) -> bool:
         """手动应用 patch（当 git/patch 不可用时）"""
         patch_content = patch_file.read_text(encoding="utf-8")
 
-        # 简单解析 unified diff
-        current_file = None
+        # 简单解析 unified diff：逐行按前缀分派的状态机
         hunks: dict[Path, list[tuple[int, list[str], list[str]]]] = {}
-
-        lines = patch_content.splitlines()
-        i = 0
-        while i < len(lines):
-            line = lines[i]
-
-            # 文件头
-            if line.startswith("--- a/"):
-                i += 1
-                if i < len(lines) and lines[i].startswith("+++ b/"):
-                    current_file = root / lines[i][6:]
+        current_file = None
+        hunk: tuple[list[str], list[str]] | None = None  # 正在收集的 (旧行, 新行)
+        expect_new_header = False
+
+        for line in patch_content.splitlines():
+            # "--- a/" 之后的一行应为 "+++ b/" 文件头
+            if expect_new_header:
+                expect_new_header = False
+                if line.startswith("+++ b/"):
+                    current_file = root / line[6:]
                     hunks[current_file] = []
-                i += 1
                 continue
 
-            # Hunk 头
-            if line.startswith("@@") and current_file:
-                # 解析 @@ -start,count +start,count @@
-                parts = line.split()
-                if len(parts) >= 3:
-                    old_info = parts[1]  # -start,count
-                    old_start = int(old_info.split(",")[0][1:])
-
-                    # 收集 hunk 内容
-                    i += 1
-                    old_lines = []
-                    new_lines = []
-                    while i < len(lines) and not lines[i].startswith(("@@", "---", "+++")):
-                        hline = lines[i]
-                        if hline.startswith("-"):
-                            old_lines.append(hline[1:])
-                        elif hline.startswith("+"):
-                            new_lines.append(hline[1:])
-                        elif hline.startswith(" "):
-                            old_lines.append(hline[1:])
-                            new_lines.append(hline[1:])
-                        i += 1
-
-                    hunks[current_file].append((old_start, old_lines, new_lines))
-                    continue
-
-            i += 1
+            # 头部行结束当前 hunk
+            if line.startswith(("@@", "---", "+++")):
+                hunk = None
+                if line.startswith("--- a/"):
+                    expect_new_header = True
+                elif current_file and (m := _HUNK_HEADER.match(line)):
+                    removed: list[str] = []
+                    added: list[str] = []
+                    hunks[current_file].append((int(m[1]), removed, added))
+                    hunk = (removed, added)
+                continue
+
+            # Hunk 内容
+            if hunk is not None:
+                match line[:1]:
+                    case "-":
+                        hunk[0].append(line[1:])
+                    case "+":
+                        hunk[1].append(line[1:])
+                    case " ":
+                        hunk[0].append(line[1:])
+                        hunk[1].append(line[1:])
 
         # 应用修改
         for file, file_hunks in hunks.items():
             if not file.exists():
                 continue
 
-            content = file.read_text(encoding="utf-8")
+            content = self._read_cached(file)
             file_lines = content.splitlines()
 
             # 从后往前应用 hunks
@@ -255,6 +343,7 @@ class PatchFixer(Fixer):
                 file_lines[start_idx:end_idx] = new_lines
 
             file.write_text("\n".join(file_lines) + "\n", encoding="utf-8")
+            self._content_cache.pop(file, None)
 
         return True
 
@@ -264,29 +353,33 @@ class PatchFixer(Fixer):
 
         try:
             # 尝试使用 git apply -R
-            result = subprocess.run(
-                ["git", "apply", "-R", "--whitespace=nowarn", str(patch_file)],
-                check=False,
-                cwd=root,
-                capture_output=True,
-                text=True,
-            )
-            if result.returncode == 0:
-                return True
+            if self._has_tool("git"):
+                result = subprocess.run(
+                    ["git", "apply", "-R", "--whitespace=nowarn", str(patch_file)],
+                    check=False,
+                    cwd=root,
+                    capture_output=True,
+                    text=True,
+                )
+                if result.returncode == 0:
+                    return True
 
             # 回退到 patch -R
-            result = subprocess.run(
-                ["patch", "-R", "-p1", "-i", str(patch_file)],
-                check=False,
-                cwd=root,
-                capture_output=True,
-                text=True,
-            )
-            return result.returncode == 0
+            if self._has_tool("patch"):
+                result = subprocess.run(
+                    ["patch", "-R", "-p1", "-i", str(patch_file)],
+                    check=False,
+                    cwd=root,
+                    capture_output=True,
+                    text=True,
+                )
+                return result.returncode == 0
 
         except FileNotFoundError:
-            # 暂不支持手动撤销
-            return False
+            pass
+
+        # 暂不支持手动撤销
+        return False
 
     def list_patches(self, root: Path) -> list[Path]:
         """列出所有 patch 文件"""
@@ -296,10 +389,81 @@ class PatchFixer(Fixer):
         return sorted(patch_dir.glob("*.patch"), reverse=True)
 
     def get_latest_patch(self, root: Path) -> Path | None:
-        """获取最新的 patch 文件"""
-        patches = self.list_patches(root)
-        return patches[0] if patches else None
+        """获取最新的 patch 文件（文件名以时间戳开头，按名称取最大者即可，无需排序）"""
+        patch_dir = root / self.patch_dir
+        if not patch_dir.exists():
+            return None
+        return max(patch_dir.glob("*.patch"), default=None)
 
     def preview_patch(self, patch_file: Path) -> str:
         """预览 patch 内容"""
         return patch_file.read_text(encoding="utf-8")
+
+
+def _line_diff(
+    old: list[str],
+    new: Mapping[int, str],
+    changed: list[int],
+    *,
+    fromfile: str,
+    tofile: str,
+    n: int,
+) -> list[str]:
+    """根据已知的改动行生成 unified diff
+
+    要求新旧内容行数相同、仅 changed 中的行不同。按 difflib.unified_diff 的规则
+    分组：改动行之间的相同行不超过 2n 行时合并为一个 hunk，连续改动行先输出
+    全部删除行再输出全部新增行。只访问改动行附近的内容，不对整个文件做 LCS。
+
+    Args:
+        old: 原始行（含换行符）
+        new: 改动行的新内容（行下标 -> 含换行符的行），至少包含 changed 中的行
+        changed: 升序排列的改动行下标
+        fromfile: 原文件标识
+        tofile: 新文件标识
+        n: 上下文行数
+
+    Returns:
+        unified diff 文本片段（按顺序拼接即为完整 diff）
+    """
+    # 按间隔分组
+    groups: list[list[int]] = []
+    for idx in changed:
+        if groups and idx - groups[-1][-1] - 1 <= 2 * n:
+            groups[-1].append(idx)
+        else:
+            groups.append([idx])
+
+    out = [f"--- {fromfile}\n", f"+++ {tofile}\n"]
+    total = len(old)
+    for group in groups:
+        start = max(group[0] - n, 0)
+        stop = min(group[-1] + n + 1, total)
+        span = _format_range(start, stop)
+        out.append(f"@@ -{span} +{span} @@\n")
+
+        pos = start
+        k = 0
+        while k < len(group):
+            # 连续的改动行作为一个替换块
+            run_start = run_end = group[k]
+            while k + 1 < len(group) and group[k + 1] == run_end + 1:
+                k += 1
+                run_end += 1
+            k += 1
+
+            out.extend(" " + line for line in old[pos:run_start])
+            out.extend("-" + line for line in old[run_start : run_end + 1])
+            out.extend("+" + new[i] for i in range(run_start, run_end + 1))
+            pos = run_end + 1
+        out.extend(" " + line for line in old[pos:stop])
+
+    return out
+
+
+def _format_range(start: int, stop: int) -> str:
+    """格式化 hunk 范围（与 difflib 一致：单行省略长度）"""
+    length = stop - start
+    if length == 1:
+        return str(start + 1)
+    return f"{start + 1},{length}"
@@ -3,8 +3,12 @@
 from __future__ import annotations
 
 import sys
-from dataclasses import dataclass, field
+import unicodedata
+from collections import Counter
+from dataclasses import dataclass, field, fields
 from enum import Enum
+from functools import lru_cache
+from operator import attrgetter
 from typing import TYPE_CHECKING
 
 from checks.core.issue import Issue, Severity
@@ -14,6 +18,40 @@ if TYPE_CHECKING:
     from pathlib import Path
 
 
+# 严重程度图标
+_SEVERITY_ICONS: dict[Severity, str] = {
+    Severity.ERROR: "✗",
+    Severity.WARNING: "⚠",
+    Severity.INFO: "ℹ",
+}
+
+# 排序键在 C 层取属性，免去每次比较调用 lambda
+_BY_LINE = attrgetter("line")
+
+
+@lru_cache(maxsize=256)
+def _format_path(file: Path, root: Path) -> str:
+    """文件相对根目录的显示路径（不在根目录下时原样显示）"""
+    try:
+        return file.relative_to(root).as_posix()
+    except ValueError:
+        return file.as_posix()
+
+
+def _unstyled(text: str, _code: str) -> str:
+    """无颜色时的样式函数，原样返回文本"""
+    return text
+
+
+def _display_width(text: str) -> int:
+    """计算字符串在终端中的显示宽度（全角/宽字符占两列）"""
+    # 绝大多数行是纯 ASCII，直接返回长度，免去逐字符查询
+    if text.isascii():
+        return len(text)
+    east_asian_width = unicodedata.east_asian_width
+    return sum(2 if east_asian_width(ch) in "WF" else 1 for ch in text)
+
+
 class ColorMode(Enum):
     """颜色模式"""
 
@@ -128,6 +166,37 @@ class ConsoleReporter(Reporter):
         """初始化颜色支持检测"""
         self._use_color = self._should_use_color()
         self._chars = self._box_chars if self.box_drawing else self._simple_chars
+        # 常用框线字符解包为属性，逐行渲染时免去字典查找
+        self._v = self._chars["vertical"]
+        self._file_header = self._chars["top_left"] + self._chars["horizontal"] + " "
+        self._file_footer = self._chars["bottom_left"] + self._chars["horizontal"] * 2
+        # 主题各颜色代码对应的 SGR 开始序列与重置序列（无颜色时均为空串）
+        self._reset = "\033[0m" if self._use_color else ""
+        self._sgr: dict[str, str] = (
+            {
+                code: f"\033[{code}m"
+                for code in (getattr(self.theme, f.name) for f in fields(self.theme))
+            }
+            if self._use_color
+            else {}
+        )
+        # 无颜色时在构造时换用原样返回的实现，逐次调用无需再判断
+        if not self._use_color:
+            self._style = _unstyled
+        # 上下文行整行同色，行号与内容共用一对前后缀
+        self._context_open = self._sgr.get(self.theme.context, "")
+        self._line_num_open = self._sgr.get(self.theme.line_num, "")
+        # 预先拼好各严重程度的 "样式 + 图标" 前缀和重置后缀
+        severity_colors = {
+            Severity.ERROR: self.theme.error,
+            Severity.WARNING: self.theme.warning,
+            Severity.INFO: self.theme.info,
+        }
+        self._severity_suffix = self._reset
+        self._severity_prefix = {
+            severity: self._sgr.get(color, "") + _SEVERITY_ICONS[severity] + " "
+            for severity, color in severity_colors.items()
+        }
 
     def _should_use_color(self) -> bool:
         """判断是否应该使用颜色"""
@@ -139,20 +208,11 @@ class ConsoleReporter(Reporter):
         return hasattr(sys.stdout, "isatty") and sys.stdout.isatty()
 
     def _style(self, text: str, code: str) -> str:
-        """应用 ANSI 样式"""
-        if not self._use_color:
-            return text
-        return f"\033[{code}m{text}\033[0m"
-
-    def _severity_color(self, severity: Severity) -> str:
-        """获取严重程度对应的颜色代码"""
-        match severity:
-            case Severity.ERROR:
-                return self.theme.error
-            case Severity.WARNING:
-                return self.theme.warning
-            case Severity.INFO:
-                return self.theme.info
+        """应用 ANSI 样式（无颜色时在 __post_init__ 中替换为 _unstyled）"""
+        sgr = self._sgr.get(code)
+        if sgr is None:
+            sgr = self._sgr[code] = f"\033[{code}m"
+        return sgr + text + self._reset
 
     def report(self, issues: list[Issue], root: Path) -> None:
         """输出所有问题"""
@@ -175,121 +235,105 @@ class ConsoleReporter(Reporter):
     def _report_file(self, file: Path, issues: list[Issue], root: Path) -> None:
         """输出单个文件的所有问题"""
         # 按行号排序
-        issues = sorted(issues, key=lambda i: i.line)
-
-        # 文件头
-        try:
-            rel_path = file.relative_to(root)
-        except ValueError:
-            rel_path = file
-
-        print()
-        print(
-            f"{self._chars['top_left']}{self._chars['horizontal']} "
-            + self._style(rel_path.as_posix(), self.theme.file)
-        )
-        print(self._chars["vertical"])
+        issues = sorted(issues, key=_BY_LINE)
+
+        # 整个文件块拼好后一次写出
+        out = [
+            "",
+            self._file_header + self._style(_format_path(file, root), self.theme.file),
+            self._v,
+        ]
 
         # 输出每个问题
         for issue in issues:
-            self._print_issue_block(issue)
+            self._render_issue_block(issue, out)
 
-        print(self._chars["bottom_left"] + self._chars["horizontal"] * 2)
+        out.append(self._file_footer)
+        sys.stdout.write("\n".join(out) + "\n")
 
     def report_issue(self, issue: Issue, root: Path) -> None:
         """输出单个问题（独立显示）"""
-        try:
-            rel_path = issue.file.relative_to(root)
-        except ValueError:
-            rel_path = issue.file
-
-        print()
-        print(
-            f"{self._chars['top_left']}{self._chars['horizontal']} "
-            + self._style(rel_path.as_posix(), self.theme.file)
-            + self._style(f":{issue.line}", self.theme.line_num)
-        )
-        print(self._chars["vertical"])
-        self._print_issue_block(issue)
-        print(self._chars["bottom_left"] + self._chars["horizontal"] * 2)
-
-    def _print_issue_block(self, issue: Issue) -> None:
-        """打印问题块（含上下文）"""
-        v = self._chars["vertical"]
-
-        if issue.context:
-            # 打印上下文前的行
-            for line_num, content in issue.context.before:
-                self._print_context_line(line_num, content)
-
-            # 打印问题行
-            line_num, content = issue.context.current
-            self._print_issue_line(line_num, content, issue)
-
-            # 打印上下文后的行
-            for line_num, content in issue.context.after:
-                self._print_context_line(line_num, content)
+        out = [
+            "",
+            # 路径与行号颜色相邻，中间直接切换前景色，省去一次重置
+            self._file_header
+            + self._style(
+                _format_path(issue.file, root)
+                + self._sgr.get(self.theme.line_num, "")
+                + f":{issue.line}",
+                self.theme.file,
+            ),
+            self._v,
+        ]
+        self._render_issue_block(issue, out)
+        out.append(self._file_footer)
+        sys.stdout.write("\n".join(out) + "\n")
+
+    def _render_issue_block(self, issue: Issue, out: list[str]) -> None:
+        """渲染问题块（含上下文）到 out"""
+        context = issue.context
+        if context:
+            # 按顺序输出上下文行，问题行单独渲染
+            current = context.current[0]
+            for line_num, content in context.iter_lines():
+                if line_num == current:
+                    self._render_issue_line(line_num, content, issue, out)
+                else:
+                    self._render_context_line(line_num, content, out)
         else:
-            # 没有上下文，只打印问题信息
-            self._print_issue_line(issue.line, issue.original, issue)
+            # 没有上下文，只输出问题信息
+            self._render_issue_line(issue.line, issue.original, issue, out)
 
-        print(v)
+        out.append(self._v)
 
-    def _print_context_line(self, line_num: int, content: str) -> None:
-        """打印上下文行"""
-        v = self._chars["vertical"]
-        num_str = self._style(f"{line_num:>4}", self.theme.context)
-        content_str = self._style(content, self.theme.context)
-        print(f"{v}  {num_str} {v} {content_str}")
+    def _render_context_line(self, line_num: int, content: str, out: list[str]) -> None:
+        """渲染上下文行"""
+        v = self._v
+        sgr = self._context_open
+        reset = self._reset
+        out.append(f"{v}  {sgr}{line_num:>4}{reset} {v} {sgr}{content}{reset}")
 
-    def _print_issue_line(self, line_num: int, content: str, issue: Issue) -> None:
-        """打印问题行及其标记"""
-        v = self._chars["vertical"]
+    def _render_issue_line(self, line_num: int, content: str, issue: Issue, out: list[str]) -> None:
+        """渲染问题行及其标记"""
+        v = self._v
 
         # 行内容
-        num_str = self._style(f"{line_num:>4}", self.theme.line_num)
-        print(f"{v}  {num_str} {v} {content}")
+        out.append(f"{v}  {self._line_num_open}{line_num:>4}{self._reset} {v} {content}")
 
         # 下划线标记
         if issue.column is not None and issue.original:
-            # 计算下划线位置
-            padding = " " * (issue.column)
-            underline = "^" * len(issue.original)
-            print(f"{v}       {v} {padding}{self._style(underline, self.theme.error)}")
+            # 按显示宽度计算下划线位置，使其在中文等宽字符行中对齐
+            lead = content[: issue.column] if issue.context else " " * issue.column
+            padding = " " * _display_width(lead)
+            underline = "^" * _display_width(issue.original)
+            out.append(f"{v}       {v} {padding}{self._style(underline, self.theme.error)}")
 
         # 错误消息
-        severity_icon = self._get_severity_icon(issue.severity)
-        msg = f"{severity_icon} {issue.message}"
-        print(f"{v}       {v} {self._style(msg, self._severity_color(issue.severity))}")
+        prefix = self._severity_prefix[issue.severity]
+        out.append(f"{v}       {v} {prefix}{issue.message}{self._severity_suffix}")
 
         # 建议
         if self.show_suggestions and issue.suggestion:
             suggestion_msg = f"→ Did you mean: `{issue.suggestion}`"
-            print(f"{v}       {v} {self._style(suggestion_msg, self.theme.suggestion)}")
-
-    def _get_severity_icon(self, severity: Severity) -> str:
-        """获取严重程度图标"""
-        match severity:
-            case Severity.ERROR:
-                return "✗"
-            case Severity.WARNING:
-                return "⚠"
-            case Severity.INFO:
-                return "ℹ"
+            out.append(f"{v}       {v} {self._style(suggestion_msg, self.theme.suggestion)}")
 
     def report_summary(self, issues: list[Issue]) -> None:
         """输出摘要"""
         if not issues:
             return
 
-        # 统计
-        errors = sum(1 for i in issues if i.severity == Severity.ERROR)
-        warnings = sum(1 for i in issues if i.severity == Severity.WARNING)
-        infos = sum(1 for i in issues if i.severity == Severity.INFO)
-        fixable = sum(1 for i in issues if i.has_suggestion)
-
-        # 输出
-        print()
+        # 统计（单次遍历）
+        counts: Counter[Severity] = Counter()
+        fixable = 0
+        for i in issues:
+            counts[i.severity] += 1
+            if i.suggestion is not None:
+                fixable += 1
+        errors = counts[Severity.ERROR]
+        warnings = counts[Severity.WARNING]
+        infos = counts[Severity.INFO]
+
+        # 输出（与文件块一样拼好后一次写出）
         parts = []
         if errors:
             parts.append(self._style(f"{errors} error(s)", self.theme.error))
@@ -298,8 +342,10 @@ class ConsoleReporter(Reporter):
         if infos:
             parts.append(self._style(f"{infos} info(s)", self.theme.info))
 
-        summary = ", ".join(parts)
-        print(f"Found {summary}")
-
+        out = ["", f"Found {', '.join(parts)}"]
         if fixable:
-            print(self._style(f"  {fixable} issue(s) can be auto-fixed", self.theme.suggestion))
+            out.append(
+                self._style(f"  {fixable} issue(s) can be auto-fixed", self.theme.suggestion)
+            )
+        sys.stdout.write("\n".join(out) + "\n")
+        sys.stdout.flush()
@@ -37,4 +37,4 @@ class DefaultResolver(PathResolver):
             return True  # 外部链接假定存在
 
         resolved = self.resolve(path, source_file, ctx)
-        return resolved is not None and resolved.exists()
+        return resolved is not None and ctx.path_exists(resolved)
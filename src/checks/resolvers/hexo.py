@@ -31,10 +31,25 @@ class HexoResolver(PathResolver):
     asset_folder_per_post: bool = True
     pages: list[str] = field(default_factory=list)
 
+    # _is_post_file 结果缓存，键为 (文件, 项目根目录)
+    _post_cache: dict[tuple[Path, Path], bool] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    # 文章同名资源文件夹缓存（非文章为 None），键同上
+    _asset_cache: dict[tuple[Path, Path], Path | None] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
+    def before_check(self, ctx: CheckContext) -> None:  # noqa: ARG002
+        """每次运行前清空按文件缓存的判定，避免沿用上次运行或旧 post_dir 的结果"""
+        self._post_cache.clear()
+        self._asset_cache.clear()
+
     def _normalize_path(self, path: str) -> str:
         """规范化路径：解码 URL 编码、去除 ./ 前缀"""
-        # 解码 URL 编码（如 %20 -> 空格）
-        path = unquote(path)
+        # 解码 URL 编码（如 %20 -> 空格），博客中的路径大多不含 %，直接跳过
+        if "%" in path:
+            path = unquote(path)
         # 去除 ./ 前缀
         if path.startswith("./"):
             path = path[2:]
@@ -52,11 +67,13 @@ class HexoResolver(PathResolver):
             return ctx.root / path[1:]
 
         # 检查是否在 _posts 目录中
-        if self._is_post_file(source_file, ctx) and self.asset_folder_per_post:
+        asset_folder = self._asset_folder(source_file, ctx) if self.asset_folder_per_post else None
+        if asset_folder is not None:
             # 尝试在同名资源文件夹中查找
-            asset_folder = source_file.parent / source_file.stem
             asset_path = asset_folder / path
-            if asset_path.exists():
+            # 同一资源文件夹只 scandir 一次，之后的存在性查询直接命中目录索引
+            ctx.list_dir(asset_folder)
+            if ctx.path_exists(asset_path):
                 return asset_path
 
         # 默认：相对于源文件目录
@@ -68,7 +85,11 @@ class HexoResolver(PathResolver):
             return True
 
         resolved = self.resolve(path, source_file, ctx)
-        return resolved is not None and resolved.exists()
+        if resolved is None:
+            return False
+        # 同一目录只 scandir 一次，其下已有文件的查询直接命中目录索引而不再 stat
+        ctx.list_dir(resolved.parent)
+        return ctx.path_exists(resolved)
 
     def find_similar(
         self, path: str, source_file: Path, ctx: CheckContext, threshold: float = 0.6
@@ -92,8 +113,8 @@ class HexoResolver(PathResolver):
             search_dirs.append(base_dir)
 
         # 2. 如果是 post，添加同名资源文件夹
-        if self._is_post_file(source_file, ctx) and self.asset_folder_per_post:
-            asset_folder = source_file.parent / source_file.stem
+        asset_folder = self._asset_folder(source_file, ctx) if self.asset_folder_per_post else None
+        if asset_folder is not None:
             if target_dir_parts:
                 search_dirs.append(asset_folder / Path(*target_dir_parts))
             else:
@@ -102,7 +123,13 @@ class HexoResolver(PathResolver):
         # 在各目录中搜索
         for search_dir in search_dirs:
             similar = self._find_similar_in_dir(
-                search_dir, target_name, target_dir_parts, source_file, ctx, threshold
+                search_dir,
+                target_name,
+                target_dir_parts,
+                base_dir=base_dir,
+                asset_folder=asset_folder,
+                ctx=ctx,
+                threshold=threshold,
             )
             results.extend(similar)
 
@@ -121,68 +148,78 @@ class HexoResolver(PathResolver):
         search_dir: Path,
         target_name: str,
         target_dir_parts: tuple,
-        source_file: Path,
+        *,
+        base_dir: Path,
+        asset_folder: Path | None,
         ctx: CheckContext,
         threshold: float,
     ) -> list[str]:
-        """在指定目录中查找相似文件"""
+        """在指定目录中查找相似文件
+
+        base_dir 为源文件所在目录，asset_folder 为文章资源文件夹（非文章时为 None），
+        均由 find_similar 预先计算。
+        """
         results = []
 
         # 目录不存在时，尝试查找相似目录
-        if not search_dir.exists():
+        if not ctx.path_exists(search_dir):
             parent = search_dir.parent
-            if parent.exists() and target_dir_parts:
-                similar_dirs = get_close_matches(
-                    search_dir.name,
-                    [d.name for d in parent.iterdir() if d.is_dir()],
-                    n=1,
-                    cutoff=threshold,
-                )
+            if ctx.path_exists(parent) and target_dir_parts:
+                _, dir_names = ctx.list_dir(parent)
+                similar_dirs = get_close_matches(search_dir.name, dir_names, n=1, cutoff=threshold)
                 if similar_dirs:
                     search_dir = parent / similar_dirs[0]
 
-        if not search_dir.exists():
+        if not ctx.path_exists(search_dir):
             return results
 
-        # 查找相似文件
-        candidates = [f.name for f in search_dir.iterdir() if f.is_file()]
+        # 查找相似文件（使用缓存的目录索引）
+        candidates, _ = ctx.list_dir(search_dir)
         similar_files = get_close_matches(target_name, candidates, n=3, cutoff=threshold)
 
-        # 构建结果路径
-        for similar in similar_files:
-            similar_path = search_dir / similar
-
-            # 尝试构建相对路径
-            # 对于 post 的资源文件夹，直接用文件名
-            if self._is_post_file(source_file, ctx) and self.asset_folder_per_post:
-                asset_folder = source_file.parent / source_file.stem
-                if similar_path.is_relative_to(asset_folder):
-                    try:
-                        rel = similar_path.relative_to(asset_folder)
-                        results.append(rel.as_posix())
-                        continue
-                    except ValueError:
-                        pass
-
-            # 否则用相对于源文件目录的路径
-            try:
-                rel = similar_path.relative_to(source_file.parent)
-                results.append(rel.as_posix())
-            except ValueError:
-                # 无法获取相对路径时使用绝对路径
-                try:
-                    rel = similar_path.relative_to(ctx.root)
-                    results.append("/" + rel.as_posix())
-                except ValueError:
-                    results.append(similar_path.as_posix())
+        # 构建结果路径：候选文件同处 search_dir，前缀只需计算一次
+        prefix = None
+        # 对于 post 的资源文件夹，直接用文件名
+        if asset_folder is not None:
+            prefix = self._relative_prefix(search_dir, asset_folder)
+
+        # 否则用相对于源文件目录的路径
+        if prefix is None:
+            prefix = self._relative_prefix(search_dir, base_dir)
+
+        # 无法获取相对路径时使用绝对路径
+        if prefix is None:
+            root_prefix = self._relative_prefix(search_dir, ctx.root)
+            if root_prefix is not None:
+                prefix = "/" + root_prefix
+            else:
+                prefix = search_dir.as_posix().rstrip("/") + "/"
+
+        results.extend(prefix + similar for similar in similar_files)
 
         return results
 
     def _is_post_file(self, file: Path, ctx: CheckContext) -> bool:
         """判断文件是否在 _posts 目录中"""
+        key = (file, ctx.root)
+        cached = self._post_cache.get(key)
+        if cached is not None:
+            return cached
+
         try:
-            rel_path = file.relative_to(ctx.root)
-            parts = rel_path.parts
-            return len(parts) > 0 and parts[0] in self.post_dir
+            parts = file.relative_to(ctx.root).parts
+            result = len(parts) > 0 and parts[0] in self.post_dir
         except ValueError:
-            return False
+            result = False
+        self._post_cache[key] = result
+        return result
+
+    def _asset_folder(self, file: Path, ctx: CheckContext) -> Path | None:
+        """获取文章的同名资源文件夹，非文章时返回 None"""
+        key = (file, ctx.root)
+        if key in self._asset_cache:
+            return self._asset_cache[key]
+
+        folder = file.parent / file.stem if self._is_post_file(file, ctx) else None
+        self._asset_cache[key] = folder
+        return folder
@@ -2,16 +2,26 @@
 
 from __future__ import annotations
 
+import glob
+import os
 from dataclasses import dataclass, field
-from fnmatch import fnmatch
+from operator import attrgetter
 from pathlib import Path
 from typing import TYPE_CHECKING
 
 from checks.core.context import CheckContext
 
 if TYPE_CHECKING:
+    import re
+    from collections.abc import Iterator
+
     from checks.config import Config
+    from checks.core.checker import Checker
     from checks.core.issue import Issue
+    from checks.core.resolver import PathResolver
+
+# 并行检查时每个任务批次包含的文件数
+PARALLEL_CHUNKSIZE = 16
 
 
 @dataclass
@@ -29,6 +39,8 @@ class CheckRunner:
     root: Path
 
     _context: CheckContext = field(init=False, repr=False)
+    # 本次运行中启用的检查器（由 _prepare 确定）
+    _active_checkers: list[Checker] = field(default_factory=list, init=False, repr=False)
 
     def __post_init__(self):
         """初始化检查上下文"""
@@ -50,28 +62,91 @@ class CheckRunner:
         Returns:
             发现的问题列表
         """
-        # 前置钩子
-        if self.config.before_check:
-            self.config.before_check(self._context)
+        self._prepare()
+        context_lines = self.config.output.context_lines
+
+        # 边遍历边检查，无需先收集完整文件列表；
+        # 最后按文件稳定排序，结果顺序与按排序后的文件列表检查一致
+        all_issues: list[Issue] = []
+        for file in self._iter_files():
+            issues = self._check_file(file)
+            if issues:
+                # 趁文件内容仍在缓存中立即填充上下文，避免被 LRU 淘汰后重新读取
+                self._context.fill_context(issues, before=context_lines, after=context_lines)
+                all_issues.extend(issues)
+        all_issues.sort(key=attrgetter("file"))
 
-        # 收集要检查的文件
+        return self._finish(all_issues, report)
+
+    def run_parallel(self, max_workers: int | None = None, report: bool = True) -> list[Issue]:
+        """使用多进程并行运行检查
+
+        检查器和解析器会被序列化到各工作进程中，
+        因此检查器内部的缓存在每个工作进程中独立维护；
+        before_check 钩子只在主进程中执行，其建立的状态不会传到工作进程。
+        文件数较少，或检查器/解析器无法序列化（如含闭包）时退化为串行执行；
+        进程池异常终止或提交任务时序列化失败，同样改为串行重新检查。
+
+        Args:
+            max_workers: 最大工作进程数（None 则使用 CPU 核心数）
+            report: 是否输出报告
+
+        Returns:
+            发现的问题列表
+        """
+        import pickle
+        from concurrent.futures import ProcessPoolExecutor
+        from concurrent.futures.process import BrokenProcessPool
+
+        self._prepare()
         files = self._collect_files()
+        workers = max_workers or os.cpu_count() or 1
+
+        initargs = (self.root, self.config.resolver, self.config.checkers)
 
-        # 运行检查
         all_issues: list[Issue] = []
-        for file in files:
-            issues = self._check_file(file)
-            all_issues.extend(issues)
-
-        # 填充上下文信息
-        for issue in all_issues:
-            if issue.context is None:
-                issue.context = self._context.get_context_lines(
-                    issue.file,
-                    issue.line,
-                    before=self.config.output.context_lines,
-                    after=self.config.output.context_lines,
-                )
+        if workers <= 1 or len(files) <= PARALLEL_CHUNKSIZE or not _can_send_to_workers(initargs):
+            for file in files:
+                all_issues.extend(self._check_file(file))
+        else:
+            # 文件很多时增大批次，每个进程约分到 4 批，减少进程间通信次数
+            chunksize = max(PARALLEL_CHUNKSIZE, len(files) // (4 * workers))
+            try:
+                with ProcessPoolExecutor(
+                    max_workers=workers, initializer=_init_worker, initargs=initargs
+                ) as executor:
+                    for issues in executor.map(_check_one_file, files, chunksize=chunksize):
+                        all_issues.extend(issues)
+            except (BrokenProcessPool, pickle.PicklingError):
+                all_issues = []
+                for file in files:
+                    all_issues.extend(self._check_file(file))
+
+        return self._finish(all_issues, report)
+
+    def _prepare(self) -> None:
+        """执行前置钩子并重置检查器状态"""
+        # 前置钩子
+        if self.config.before_check:
+            self.config.before_check(self._context)
+
+        # 路径状态可能在两次运行之间变化
+        self._context.clear_path_cache()
+        self._context.resolver.before_check(self._context)
+
+        # 重置检查器状态，并确定本次运行启用的检查器
+        self._active_checkers = [c for c in self.config.checkers if c.enabled]
+        for checker in self._active_checkers:
+            checker.before_check(self._context)
+
+    def _finish(self, all_issues: list[Issue], report: bool) -> list[Issue]:
+        """填充上下文、执行后置钩子并输出报告"""
+        # 填充上下文信息（已填充的问题会被跳过）
+        self._context.fill_context(
+            all_issues,
+            before=self.config.output.context_lines,
+            after=self.config.output.context_lines,
+        )
 
         # 后置钩子
         if self.config.after_check:
@@ -84,31 +159,128 @@ class CheckRunner:
         return all_issues
 
     def _collect_files(self) -> list[Path]:
-        """收集要检查的文件"""
-        files: list[Path] = []
+        """收集要检查的文件（按路径排序）"""
+        return sorted(self._iter_files())
 
+    def _iter_files(self) -> Iterator[Path]:
+        """按遍历顺序逐个产出要检查的文件
+
+        所有 include 模式共享一次目录遍历：先求出各模式的字面量目录前缀，
+        只遍历互不嵌套的前缀目录，再用联合正则筛选文件。整目录排除的
+        exclude 模式（如 ``node_modules/**``）在遍历时直接跳过该目录。
+        前缀目录互不嵌套，每个文件只会产出一次。
+        """
+        include_re, exclude_re = self.config.compiled_filter
+        prune_re = self.config.compiled_prune
+        # 遍历出的文件均由 root 拼接而来，直接截掉字符串前缀得到相对路径
+        root_prefix = self.root.as_posix().rstrip("/") + "/"
+
+        bases, literals = self._walk_bases()
+        for base in bases:
+            # 遍历全程使用字符串路径，只为选中的文件构造 Path
+            for path, rel_str in self._walk_files(base, len(str(self.root)), prune_re):
+                if not include_re.match(rel_str):
+                    continue
+                if exclude_re is not None and exclude_re.match(rel_str):
+                    continue
+                yield Path(path)
+
+        # 不含通配符的模式直接检查文件，已被遍历覆盖的跳过以免重复
+        for file in literals:
+            if any(file.is_relative_to(b) for b in bases) or not file.is_file():
+                continue
+            rel_str = file.as_posix().removeprefix(root_prefix)
+            if not include_re.match(rel_str):
+                continue
+            if exclude_re is None or not exclude_re.match(rel_str):
+                yield file
+
+    def _walk_bases(self) -> tuple[list[Path], list[Path]]:
+        """计算需要遍历的目录（各 include 模式的字面量目录前缀，去除嵌套）
+
+        Returns:
+            (需要遍历的目录, 不含通配符的模式对应的文件路径)
+        """
+        bases: set[Path] = set()
+        literals: set[Path] = set()
         for pattern in self.config.include:
-            for file in self.root.glob(pattern):
-                if file.is_file() and not self._is_excluded(file):
-                    files.append(file)
+            path = Path(pattern)
+            # 根目录之外的文件一律排除
+            if ".." in path.parts or path.is_absolute():
+                continue
+            # 整个模式都是字面量：无需遍历，直接检查该文件
+            if not glob.has_magic(pattern):
+                literals.add(self.root / path)
+                continue
+            literal: list[str] = []
+            for part in path.parts[:-1]:
+                if glob.has_magic(part):
+                    break
+                literal.append(part)
+            bases.add(self.root.joinpath(*literal))
 
-        return sorted(set(files))
+        # 只保留最外层目录，避免重复遍历
+        walk = [b for b in sorted(bases) if not any(b.is_relative_to(o) for o in bases if o != b)]
+        return walk, sorted(literals)
 
-    def _is_excluded(self, file: Path) -> bool:
-        """检查文件是否被排除"""
-        try:
-            rel_path = file.relative_to(self.root)
-        except ValueError:
-            return True
+    @staticmethod
+    def _walk_files(
+        base: Path, root_len: int, prune_re: re.Pattern[str] | None = None
+    ) -> Iterator[tuple[str, str]]:
+        """递归遍历目录下的所有文件
 
-        rel_str = rel_path.as_posix()
+        与 Path.glob 一样进入目录的符号链接；链接指向当前目录自身或其上级时跳过，避免循环。
 
-        return any(fnmatch(rel_str, pattern) for pattern in self.config.exclude)
+        Args:
+            base: 起始目录（位于根目录之下）
+            root_len: 根目录路径字符串的长度，用于截取相对路径
+            prune_re: 匹配此正则（相对 POSIX 路径）的子目录整个跳过
+
+        Yields:
+            (文件路径, 相对根目录的 POSIX 路径) 字符串对
+        """
+        posix = os.sep == "/"
+        # 栈元素为 (目录, 经过的符号链接两端的真实路径)，仅在遇到链接时才解析真实路径
+        stack: list[tuple[str, tuple[str, ...]]] = [(str(base), ())]
+        while stack:
+            current, chain = stack.pop()
+            current_real: str | None = None
+            try:
+                with os.scandir(current) as it:
+                    for entry in it:
+                        path = entry.path
+                        # 根目录本身可能以分隔符结尾（如 "/"），统一去掉开头的分隔符
+                        rel = path[root_len:].lstrip(os.sep)
+                        if not posix:
+                            rel = rel.replace(os.sep, "/")
+                        if entry.is_dir():
+                            if prune_re is not None and prune_re.match(rel):
+                                continue
+                            if not entry.is_symlink():
+                                stack.append((path, chain))
+                                continue
+                            if current_real is None:
+                                current_real = os.path.realpath(current)
+                            target = os.path.realpath(path)
+                            prefix = target.rstrip(os.sep) + os.sep
+                            visited = (*chain, current_real)
+                            if any(r == target or r.startswith(prefix) for r in visited):
+                                continue
+                            stack.append((path, (*visited, target)))
+                        elif entry.is_file():
+                            yield path, rel
+            except (FileNotFoundError, NotADirectoryError, PermissionError):
+                continue
 
     def _check_file(self, file: Path) -> list[Issue]:
         """检查单个文件"""
         issues: list[Issue] = []
 
+        # 没有检查器支持该文件时无需读取
+        checkers = [c for c in self._active_checkers if c.supports_file(file)]
+        if not checkers:
+            return issues
+
         # 读取文件内容
         try:
             content = self._context.read_file(file)
@@ -117,12 +289,7 @@ class CheckRunner:
             return issues
 
         # 运行每个检查器
-        for checker in self.config.checkers:
-            if not checker.enabled:
-                continue
-            if not checker.supports_file(file):
-                continue
-
+        for checker in checkers:
             try:
                 checker_issues = checker.check(file, content, self._context)
                 issues.extend(checker_issues)
@@ -138,6 +305,49 @@ class CheckRunner:
         return self._context
 
 
+# 工作进程内的检查运行器（由 _init_worker 初始化）
+_worker_runner: CheckRunner | None = None
+
+
+def _can_send_to_workers(initargs: tuple) -> bool:
+    """工作进程的初始化参数能否传入子进程
+
+    fork 启动的子进程直接继承父进程内存，无需序列化；
+    spawn/forkserver 启动时参数须可 pickle。
+    """
+    import multiprocessing
+    import pickle
+
+    # allow_none 避免查询时顺带固定全局启动方式；未设置时取平台默认（列表首项）
+    method = (
+        multiprocessing.get_start_method(allow_none=True)
+        or multiprocessing.get_all_start_methods()[0]
+    )
+    if method == "fork":
+        return True
+    try:
+        pickle.dumps(initargs)
+    except Exception:
+        return False
+    return True
+
+
+def _init_worker(root: Path, resolver: PathResolver, checkers: list[Checker]) -> None:
+    """初始化工作进程：用序列化传入的组件重建最小化的检查运行器"""
+    from checks.config import Config
+
+    global _worker_runner  # noqa: PLW0603
+    config = Config(root=root, resolver=resolver, checkers=checkers)
+    _worker_runner = CheckRunner(config=config, root=root)
+    _worker_runner._prepare()
+
+
+def _check_one_file(file: Path) -> list[Issue]:
+    """在工作进程中检查单个文件"""
+    assert _worker_runner is not None, "Worker not initialized"
+    return _worker_runner._check_file(file)
+
+
 def run_checks(
     config: Config | None = None, root: Path | str | None = None, report: bool = True
 ) -> list[Issue]:
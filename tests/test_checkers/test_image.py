@@ -1,6 +1,9 @@
 """Tests for ImageChecker"""
 
+import os
+import pickle
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
@@ -66,12 +69,18 @@ class TestImagePatterns:
         assert match is not None
         assert match.group("path") == "image.png"
 
-    def test_code_fence_detection(self) -> None:
-        """测试代码块检测"""
-        assert ImagePatterns.CODE_FENCE.match("```python")
-        assert ImagePatterns.CODE_FENCE.match("```")
-        assert ImagePatterns.CODE_FENCE.match("  ```")  # 缩进
-        assert not ImagePatterns.CODE_FENCE.match("text ```")
+    def test_unterminated_markdown_no_match(self) -> None:
+        """测试未闭合的长图片语法不匹配"""
+        line = "![" + "[a](b)" * 2000 + "](" + "x(y)" * 2000
+        assert ImagePatterns.MARKDOWN_IMAGE.search(line) is None
+
+    def test_fence_block_detection(self) -> None:
+        """测试代码块范围检测（支持缩进，未闭合时延续到文件末尾）"""
+        content = "a\n  ```python\n![x](y.png)\n  ```\nb\n```\nc"
+        spans = [m.group() for m in ImagePatterns.FENCE_BLOCK.finditer(content)]
+        assert spans[0].startswith("  ```python") and "![x](y.png)" in spans[0]
+        assert spans[-1].startswith("```") and spans[-1].endswith("c")
+        assert not ImagePatterns.FENCE_BLOCK.search("text ```")
 
     def test_inline_code_detection(self) -> None:
         """测试行内代码检测"""
@@ -149,6 +158,18 @@ class TestImageChecker:
         issues = checker.check(md_file, content, context)
         assert len(issues) == 0
 
+    def test_line_numbers_and_unclosed_fence(
+        self, checker: ImageChecker, context: CheckContext, tmp_path: Path
+    ) -> None:
+        """测试 CRLF 换行下的行号/列号以及未闭合代码块"""
+        md_file = tmp_path / "test.md"
+        content = "text\r\n\r\nsee ![A](a.png)\r\n```\r\n![B](b.png)\r\n"
+        md_file.write_text(content, encoding="utf-8")
+
+        issues = checker.check(md_file, content, context)
+        assert [(i.line, i.column, i.original) for i in issues] == [(3, 9, "a.png")]
+        assert issues[0].metadata["line_content"] == "see ![A](a.png)"
+
     def test_skip_inline_code(
         self, checker: ImageChecker, context: CheckContext, tmp_path: Path
     ) -> None:
@@ -171,6 +192,56 @@ class TestImageChecker:
         issues = checker.check(md_file, content, context)
         assert len(issues) == 1
 
+    def test_check_html_uppercase_and_video_poster(
+        self, checker: ImageChecker, context: CheckContext, tmp_path: Path
+    ) -> None:
+        """测试大写 HTML 标签和 video poster"""
+        md_file = tmp_path / "test.md"
+        content = '<IMG SRC="missing.png">\n<video poster="cover.png" controls>\nplain text'
+        md_file.write_text(content, encoding="utf-8")
+
+        issues = checker.check(md_file, content, context)
+        assert [(i.line, i.original) for i in issues] == [(1, "missing.png"), (2, "cover.png")]
+
+    def test_unterminated_tags_do_not_span_lines(
+        self, checker: ImageChecker, context: CheckContext, tmp_path: Path
+    ) -> None:
+        """测试未闭合的标签/图片语法不与后续行的内容配对"""
+        md_file = tmp_path / "test.md"
+        content = (
+            '<img class="hero"\n'
+            "text\n"
+            'see src="stray.png" here>\n'
+            '<img src="missing.png">\n'
+            "![a](gone.png\n"
+            '"title")\n'
+        )
+        md_file.write_text(content, encoding="utf-8")
+
+        issues = checker.check(md_file, content, context)
+        assert [(i.line, i.original) for i in issues] == [(4, "missing.png")]
+
+    def test_html_inside_markdown_image(
+        self, checker: ImageChecker, context: CheckContext, tmp_path: Path
+    ) -> None:
+        """测试 Markdown 图片片段内的 HTML 标签同样被检查"""
+        md_file = tmp_path / "test.md"
+        content = '<img src="a.png"> ![<img src="inner.png">](outer.png)\n'
+        md_file.write_text(content, encoding="utf-8")
+
+        issues = checker.check(md_file, content, context)
+        # 同一行内先 Markdown 后 HTML，与逐语法检查的顺序一致
+        assert [i.original for i in issues] == ["outer.png", "a.png", "inner.png"]
+
+    def test_html_img_disabled(self, context: CheckContext, tmp_path: Path) -> None:
+        """测试关闭 HTML img 检查"""
+        md_file = tmp_path / "test.md"
+        content = '<img src="missing.png"> ![A](a.png)'
+        md_file.write_text(content, encoding="utf-8")
+
+        issues = ImageChecker(check_html_img=False).check(md_file, content, context)
+        assert [i.original for i in issues] == ["a.png"]
+
     def test_multiple_issues_same_line(
         self, checker: ImageChecker, context: CheckContext, tmp_path: Path
     ) -> None:
@@ -182,6 +253,51 @@ class TestImageChecker:
         issues = checker.check(md_file, content, context)
         assert len(issues) == 2
 
+    def test_column_from_match_offset(
+        self, checker: ImageChecker, context: CheckContext, tmp_path: Path
+    ) -> None:
+        """测试列号取自匹配位置而非首次出现的位置"""
+        md_file = tmp_path / "test.md"
+        content = "![a.png](a.png) ![B](a.png)"
+        md_file.write_text(content, encoding="utf-8")
+
+        issues = checker.check(md_file, content, context)
+        assert [i.column for i in issues] == [9, 21]
+
+    def test_repeated_path_cached(
+        self, checker: ImageChecker, context: CheckContext, tmp_path: Path
+    ) -> None:
+        """测试同一目标路径只 stat 一次（由 ctx.path_exists 缓存）"""
+        md_file = tmp_path / "test.md"
+        content = "![A](missing.png)\n![B](missing.png)"
+        md_file.write_text(content, encoding="utf-8")
+
+        with patch("os.path.exists", wraps=os.path.exists) as mock_exists:
+            issues = checker.check(md_file, content, context)
+
+        assert len(issues) == 2
+        target = os.fspath(tmp_path / "missing.png")
+        assert [c.args[0] for c in mock_exists.call_args_list].count(target) == 1
+
+        # 新一轮运行前清空缓存
+        (tmp_path / "missing.png").write_bytes(b"fake")
+        context.clear_cache()
+        assert checker.check(md_file, content, context) == []
+
+    def test_slots_layout(self, checker: ImageChecker) -> None:
+        """测试 slots 布局下元数据仍可从类上读取"""
+        assert ImageChecker.name == checker.name == "image"
+        assert isinstance(ImageChecker.description, str)
+        assert not hasattr(checker, "__dict__")
+
+        assert ImageChecker(False).ignore_external is False
+        assert ImageChecker(enabled=False).enabled is False
+
+        checker.enabled = False
+        restored = pickle.loads(pickle.dumps(checker))
+        assert restored.enabled is False
+        assert restored.fuzzy_threshold == checker.fuzzy_threshold
+
     def test_supports_file(self, checker: ImageChecker) -> None:
         """测试文件类型支持"""
         assert checker.supports_file(Path("test.md"))
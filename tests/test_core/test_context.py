@@ -1,11 +1,12 @@
 """Tests for CheckContext"""
 
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
 from checks import CheckContext, Config
-from checks.core.issue import ContextLines
+from checks.core.issue import ContextLines, Issue
 
 
 class TestCheckContext:
@@ -51,11 +52,122 @@ class TestCheckContext:
         content2 = context.read_file(test_file)
         assert content2 == "Original"
 
+    def test_read_file_cache_limit(self, tmp_path: Path) -> None:
+        """测试文件缓存按 LRU 淘汰"""
+        config = Config(root=tmp_path, max_cache_bytes=10)
+        assert config.resolver is not None
+        ctx = CheckContext(root=tmp_path, config=config, resolver=config.resolver)
+
+        for name in ("a", "b", "c"):
+            (tmp_path / f"{name}.txt").write_text(name * 4, encoding="utf-8")
+
+        ctx.read_file(tmp_path / "a.txt")
+        ctx.read_file(tmp_path / "b.txt")
+        ctx.read_file(tmp_path / "a.txt")  # a 变为最近使用
+        ctx.read_file(tmp_path / "c.txt")  # 超出上限，淘汰 b
+
+        assert [p.name for p in ctx.file_cache] == ["a.txt", "c.txt"]
+        assert ctx.cache_bytes == 8
+
+    def test_lines_cache_counts_toward_limit(self, tmp_path: Path) -> None:
+        """测试行缓存计入缓存占用，并随文件一同淘汰"""
+        config = Config(root=tmp_path, max_cache_bytes=10)
+        assert config.resolver is not None
+        ctx = CheckContext(root=tmp_path, config=config, resolver=config.resolver)
+
+        for name in ("a", "b"):
+            (tmp_path / f"{name}.txt").write_text(name * 4, encoding="utf-8")
+
+        ctx.get_file_lines(tmp_path / "a.txt")
+        assert ctx.cache_bytes == 8
+
+        ctx.get_file_lines(tmp_path / "b.txt")  # 超出上限，淘汰 a 及其行缓存
+        assert [p.name for p in ctx.file_cache] == ["b.txt"]
+        assert [p.name for p in ctx.lines_cache] == ["b.txt"]
+        assert ctx.cache_bytes == 8
+
+    def test_lines_cache_hit_refreshes_lru(self, tmp_path: Path) -> None:
+        """测试行缓存命中时刷新 LRU 位置"""
+        config = Config(root=tmp_path, max_cache_bytes=20)
+        assert config.resolver is not None
+        ctx = CheckContext(root=tmp_path, config=config, resolver=config.resolver)
+
+        for name in ("a", "b", "c"):
+            (tmp_path / f"{name}.txt").write_text(name * 4, encoding="utf-8")
+
+        ctx.get_file_lines(tmp_path / "a.txt")
+        ctx.get_file_lines(tmp_path / "b.txt")
+        ctx.get_file_lines(tmp_path / "a.txt")  # 命中，a 变为最近使用
+        ctx.get_file_lines(tmp_path / "c.txt")  # 超出上限，淘汰 b
+
+        assert [p.name for p in ctx.file_cache] == ["a.txt", "c.txt"]
+        assert [p.name for p in ctx.lines_cache] == ["a.txt", "c.txt"]
+
     def test_read_file_not_found(self, context: CheckContext, tmp_path: Path) -> None:
         """测试读取不存在的文件"""
         with pytest.raises(FileNotFoundError):
             context.read_file(tmp_path / "nonexistent.txt")
 
+    def test_path_exists_cached(self, context: CheckContext, tmp_path: Path) -> None:
+        """测试路径存在性缓存"""
+        image = tmp_path / "image.png"
+        assert not context.path_exists(image)
+
+        # 缓存命中，不重新 stat
+        image.write_bytes(b"fake")
+        assert not context.path_exists(image)
+
+        context.clear_cache()
+        assert context.path_exists(image)
+        assert context.path_exists(str(image))
+
+    def test_list_dir(self, context: CheckContext, tmp_path: Path) -> None:
+        """测试目录索引缓存"""
+        (tmp_path / "a.png").write_bytes(b"fake")
+        (tmp_path / "sub").mkdir()
+
+        files, dirs = context.list_dir(tmp_path)
+        assert files == ["a.png"]
+        assert dirs == ["sub"]
+
+        # 缓存命中，新文件不可见
+        (tmp_path / "b.png").write_bytes(b"fake")
+        assert context.list_dir(tmp_path)[0] == ["a.png"]
+
+        context.clear_path_cache()
+        assert sorted(context.list_dir(tmp_path)[0]) == ["a.png", "b.png"]
+        assert context.list_dir(tmp_path / "missing") == ([], [])
+
+    def test_list_dir_unreadable(self, context: CheckContext, tmp_path: Path) -> None:
+        """测试无法读取的目录按空目录缓存"""
+        with patch("os.scandir", side_effect=PermissionError):
+            assert context.list_dir(tmp_path) == ([], [])
+        assert context.list_dir(tmp_path) == ([], [])
+
+    def test_path_exists_uses_dir_listing(self, context: CheckContext, tmp_path: Path) -> None:
+        """测试已缓存目录索引时存在性查询不再 stat"""
+        image = tmp_path / "a.png"
+        image.write_bytes(b"fake")
+        context.list_dir(tmp_path)
+
+        # 目录索引中包含该文件，删除后仍命中索引
+        image.unlink()
+        assert context.path_exists(image)
+        # 不在索引中的路径仍回退到 stat
+        assert not context.path_exists(tmp_path / "b.png")
+
+    def test_resolve_path_cached(self, context: CheckContext, tmp_path: Path) -> None:
+        """测试绝对路径缓存"""
+        test_file = tmp_path / "test.md"
+        test_file.write_text("# test", encoding="utf-8")
+
+        resolved = context.resolve_path(test_file)
+        assert resolved == test_file.resolve()
+        assert context.resolve_path(test_file) is resolved
+
+        context.clear_cache()
+        assert not context.resolve_cache
+
     def test_get_file_lines(self, context: CheckContext, tmp_path: Path) -> None:
         """测试获取文件行"""
         test_file = tmp_path / "test.txt"
@@ -66,6 +178,9 @@ class TestCheckContext:
         assert lines[0] == "Line 1"
         assert lines[2] == "Line 3"
 
+        # 同一文件复用缓存的行列表
+        assert context.get_file_lines(test_file) is lines
+
     def test_get_context_lines(self, context: CheckContext, tmp_path: Path) -> None:
         """测试获取上下文行"""
         test_file = tmp_path / "test.md"
@@ -109,6 +224,33 @@ class TestCheckContext:
         assert ctx_lines.current == (3, "Line 3")
         assert len(ctx_lines.after) == 0  # 没有后面的行
 
+    def test_fill_context(self, context: CheckContext, tmp_path: Path) -> None:
+        """测试批量填充上下文"""
+        test_file = tmp_path / "test.md"
+        test_file.write_text("Line 1\nLine 2\nLine 3\nLine 4", encoding="utf-8")
+
+        existing = ContextLines(before=[], current=(1, "kept"), after=[])
+        issues = [
+            Issue(file=test_file, line=2, type="t", message="m", original="o", checker="c"),
+            Issue(file=test_file, line=4, type="t", message="m", original="o", checker="c"),
+            Issue(
+                file=test_file,
+                line=1,
+                type="t",
+                message="m",
+                original="o",
+                checker="c",
+                context=existing,
+            ),
+        ]
+        context.fill_context(issues, before=1, after=1)
+
+        assert issues[0].context == context.get_context_lines(test_file, 2, before=1, after=1)
+        assert issues[1].context == ContextLines(
+            before=[(3, "Line 3")], current=(4, "Line 4"), after=[]
+        )
+        assert issues[2].context is existing
+
     def test_relative_path(self, context: CheckContext, tmp_path: Path) -> None:
         """测试相对路径计算"""
         file_path = tmp_path / "subdir" / "test.md"
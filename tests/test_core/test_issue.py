@@ -1,9 +1,17 @@
 """Tests for core.issue module"""
 
+from enum import Enum
 from pathlib import Path
 
+import pytest
+
 from checks.core.issue import ContextLines, Fix, Issue, Severity
 
+_TEST_MD = Path("test.md")
+_SRC_MD = Path("src/test.md")
+# 使用 Path 匹配平台分隔符
+_SRC_LOC = str(_SRC_MD)
+
 
 class TestSeverity:
     """Severity 枚举测试"""
@@ -19,6 +27,14 @@ class TestSeverity:
         assert str(Severity.ERROR) == "error"
         assert str(Severity.WARNING) == "warning"
 
+    def test_severity_is_enum(self) -> None:
+        """测试严重程度保持枚举语义"""
+        assert isinstance(Severity.ERROR, Enum)
+        assert Severity("warning") is Severity.WARNING
+        assert [s.name for s in Severity] == ["ERROR", "WARNING", "INFO"]
+        with pytest.raises(ValueError):
+            Severity("bogus")
+
 
 class TestContextLines:
     """ContextLines 测试"""
@@ -36,6 +52,7 @@ class TestContextLines:
         assert all_lines[0] == (1, "line 1")
         assert all_lines[2] == (3, "current line")
         assert all_lines[4] == (5, "line 5")
+        assert list(ctx.iter_lines()) == all_lines
 
     def test_empty_context(self) -> None:
         """测试空上下文"""
@@ -52,72 +69,72 @@ class TestContextLines:
 class TestFix:
     """Fix 测试"""
 
-    def test_apply_to_line_simple(self) -> None:
-        """测试简单替换"""
-        fix = Fix(
-            original="old_text",
-            replacement="new_text",
-            line=1,
-        )
-
-        result = fix.apply_to_line("This is old_text here")
-        assert result == "This is new_text here"
-
-    def test_apply_to_line_with_column(self) -> None:
-        """测试精确位置替换"""
+    @pytest.mark.parametrize(
+        ("original", "replacement", "start_col", "end_col", "line", "expected"),
+        [
+            pytest.param(
+                "old_text",
+                "new_text",
+                None,
+                None,
+                "This is old_text here",
+                "This is new_text here",
+                id="simple",
+            ),
+            pytest.param("old", "new", 5, 8, "This old world", "This new world", id="with-column"),
+            # 回归测试：之前 end_col 为 None 时导致错误替换，
+            # 出现 '![alt](new.png)![alt](old.png)' 这样的重复内容
+            pytest.param(
+                "![alt](old.png)",
+                "![alt](new.png)",
+                0,
+                None,
+                "![alt](old.png)",
+                "![alt](new.png)",
+                id="start-col-no-end-col",
+            ),
+            pytest.param(
+                "![img](old.png)",
+                "![img](new.png)",
+                10,
+                None,
+                "Some text ![img](old.png) more text",
+                "Some text ![img](new.png) more text",
+                id="middle-start-col-only",
+            ),
+            pytest.param(
+                "test",
+                "TEST",
+                None,
+                None,
+                "test and test again",
+                "TEST and test again",
+                id="first-occurrence",
+            ),
+            pytest.param(
+                "test", "TEST", None, None, "test test test", "TEST test test", id="repeated"
+            ),
+        ],
+    )
+    def test_apply_to_line(
+        self,
+        *,
+        original: str,
+        replacement: str,
+        start_col: int | None,
+        end_col: int | None,
+        line: str,
+        expected: str,
+    ) -> None:
+        """测试将修复应用到行内容（只替换一处）"""
         fix = Fix(
-            original="old",
-            replacement="new",
+            original=original,
+            replacement=replacement,
             line=1,
-            start_col=5,
-            end_col=8,
+            start_col=start_col,
+            end_col=end_col,
         )
-
-        result = fix.apply_to_line("This old world")
-        assert result == "This new world"
-
-    def test_apply_to_line_with_start_col_no_end_col(self) -> None:
-        """测试有 start_col 但无 end_col 时自动计算 end_col
-
-        回归测试：修复 bug，之前 end_col 为 None 时导致错误替换，
-        出现 '![alt](new.png)![alt](old.png)' 这样的重复内容。
-        """
-        fix = Fix(
-            original="![alt](old.png)",
-            replacement="![alt](new.png)",
-            line=1,
-            start_col=0,
-            end_col=None,  # 未设置 end_col
-        )
-
-        result = fix.apply_to_line("![alt](old.png)")
-        assert result == "![alt](new.png)"
-        # 确保没有重复
-        assert result.count("![alt]") == 1
-
-    def test_apply_to_line_middle_with_start_col_only(self) -> None:
-        """测试行中间替换，只有 start_col"""
-        fix = Fix(
-            original="![img](old.png)",
-            replacement="![img](new.png)",
-            line=1,
-            start_col=10,
-            end_col=None,
-        )
-
-        result = fix.apply_to_line("Some text ![img](old.png) more text")
-        assert result == "Some text ![img](new.png) more text"
-
-    def test_apply_to_line_first_occurrence(self) -> None:
-        """测试只替换第一次出现"""
-        fix = Fix(
-            original="test",
-            replacement="TEST",
-            line=1,
-        )
-
-        result = fix.apply_to_line("test and test again")
-        assert result == "TEST and test again"
+        assert fix.apply_to_line(line) == expected
 
 
 class TestIssue:
@@ -126,7 +143,7 @@ class TestIssue:
     def test_issue_creation(self) -> None:
         """测试创建 Issue"""
         issue = Issue(
-            file=Path("test.md"),
+            file=_TEST_MD,
             line=10,
             type="broken_image",
             message="Image not found",
@@ -134,7 +151,7 @@ class TestIssue:
             checker="image",
         )
 
-        assert issue.file == Path("test.md")
+        assert issue.file == _TEST_MD
         assert issue.line == 10
         assert issue.severity == Severity.ERROR  # default
         assert issue.column is None
@@ -157,7 +174,7 @@ class TestIssue:
     def test_has_suggestion(self) -> None:
         """测试是否有建议"""
         issue_without = Issue(
-            file=Path("test.md"),
+            file=_TEST_MD,
             line=1,
             type="test",
             message="test",
@@ -167,7 +184,7 @@ class TestIssue:
         assert not issue_without.has_suggestion
 
         issue_with = Issue(
-            file=Path("test.md"),
+            file=_TEST_MD,
             line=1,
             type="test",
             message="test",
@@ -180,7 +197,7 @@ class TestIssue:
     def test_location_without_column(self) -> None:
         """测试位置字符串（无列号）"""
         issue = Issue(
-            file=Path("src/test.md"),
+            file=_SRC_MD,
             line=42,
             type="test",
             message="test",
@@ -188,14 +205,12 @@ class TestIssue:
             checker="test",
         )
 
-        # 使用 Path 匹配平台分隔符
-        expected = f"{Path('src/test.md')}:42"
-        assert issue.location == expected
+        assert issue.location == f"{_SRC_LOC}:42"
 
     def test_location_with_column(self) -> None:
         """测试位置字符串（有列号）"""
         issue = Issue(
-            file=Path("src/test.md"),
+            file=_SRC_MD,
             line=42,
             column=10,
             type="test",
@@ -204,14 +219,29 @@ class TestIssue:
             checker="test",
         )
 
-        # 使用 Path 匹配平台分隔符
-        expected = f"{Path('src/test.md')}:42:10"
-        assert issue.location == expected
+        assert issue.location == f"{_SRC_LOC}:42:10"
+
+    def test_location_follows_fields_and_slotted(self) -> None:
+        """测试位置字符串随字段更新且实例无 __dict__"""
+        issue = Issue(
+            file=_SRC_MD,
+            line=42,
+            type="test",
+            message="test",
+            original="test",
+            checker="test",
+        )
+
+        assert issue.location == f"{_SRC_LOC}:42"
+        issue.line = 43
+        issue.column = 5
+        assert issue.location == f"{_SRC_LOC}:43:5"
+        assert not hasattr(issue, "__dict__")
 
     def test_get_fix(self) -> None:
         """测试获取修复方案"""
         issue = Issue(
-            file=Path("test.md"),
+            file=_TEST_MD,
             line=5,
             column=10,
             type="test",
@@ -228,10 +258,18 @@ class TestIssue:
         assert fix.line == 5
         assert fix.start_col == 10
 
+        # 修改字段后重新获取的修复方案反映最新值
+        issue.suggestion = "newer"
+        issue.line = 6
+        new_fix = issue.get_fix()
+        assert new_fix is not None
+        assert new_fix.replacement == "newer"
+        assert new_fix.line == 6
+
     def test_get_fix_no_suggestion(self) -> None:
         """测试无建议时获取修复"""
         issue = Issue(
-            file=Path("test.md"),
+            file=_TEST_MD,
             line=5,
             type="test",
             message="test",
@@ -244,7 +282,7 @@ class TestIssue:
     def test_str_representation(self) -> None:
         """测试字符串表示"""
         issue = Issue(
-            file=Path("test.md"),
+            file=_TEST_MD,
             line=10,
             type="broken_image",
             message="Image not found",
@@ -260,7 +298,7 @@ class TestIssue:
     def test_repr(self) -> None:
         """测试 repr"""
         issue = Issue(
-            file=Path("test.md"),
+            file=_TEST_MD,
             line=10,
             type="broken_image",
             message="Image not found",
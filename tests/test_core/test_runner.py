@@ -0,0 +1,195 @@
+"""Tests for CheckRunner"""
+
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from checks import CheckRunner, Config, ImageChecker
+from checks.resolvers import DefaultResolver
+from checks.runner import _can_send_to_workers
+
+
+class TestCheckRunner:
+    """CheckRunner 测试"""
+
+    @pytest.fixture
+    def project(self, tmp_path: Path) -> Path:
+        """创建包含多个文件的临时项目"""
+        (tmp_path / "image.png").write_bytes(b"fake")
+        for i in range(40):
+            (tmp_path / f"post-{i:02d}.md").write_text(
+                f"# Post {i}\n\n![ok](image.png)\n![missing](missing-{i}.png)\n",
+                encoding="utf-8",
+            )
+        return tmp_path
+
+    @pytest.fixture
+    def runner(self, project: Path) -> CheckRunner:
+        """创建检查运行器"""
+        config = Config(root=project, resolver=DefaultResolver(), checkers=[ImageChecker()])
+        return CheckRunner(config=config, root=project)
+
+    def test_run(self, runner: CheckRunner) -> None:
+        """测试串行运行"""
+        issues = runner.run(report=False)
+
+        assert len(issues) == 40
+        assert all(issue.context is not None for issue in issues)
+
+    def test_run_reads_each_file_once(self, project: Path) -> None:
+        """测试缓存容量很小时，填充上下文也不会重新读取文件"""
+        config = Config(
+            root=project,
+            resolver=DefaultResolver(),
+            checkers=[ImageChecker()],
+            max_cache_bytes=1,
+        )
+        runner = CheckRunner(config=config, root=project)
+
+        with patch.object(Path, "read_text", autospec=True, side_effect=Path.read_text) as read:
+            issues = runner.run(report=False)
+
+        assert read.call_count == 40
+        assert all(issue.context is not None for issue in issues)
+
+    def test_unsupported_file_not_read(self, runner: CheckRunner, project: Path) -> None:
+        """测试没有检查器支持的文件不会被读取"""
+        (project / "notes.txt").write_text("![x](missing.png)", encoding="utf-8")
+        runner._prepare()
+
+        assert runner._check_file(project / "notes.txt") == []
+        assert not runner.context.file_cache
+
+    def test_run_parallel_matches_serial(self, runner: CheckRunner) -> None:
+        """测试并行运行结果与串行一致"""
+        serial = runner.run(report=False)
+        parallel = runner.run_parallel(max_workers=2, report=False)
+
+        assert [(i.file, i.line, i.original) for i in parallel] == [
+            (i.file, i.line, i.original) for i in serial
+        ]
+        assert all(issue.context is not None for issue in parallel)
+
+    def test_run_parallel_single_worker(self, runner: CheckRunner) -> None:
+        """测试单个工作进程时退化为串行"""
+        issues = runner.run_parallel(max_workers=1, report=False)
+        assert len(issues) == 40
+
+    def test_run_parallel_unpicklable_falls_back(self, runner: CheckRunner) -> None:
+        """测试 spawn 模式下组件无法序列化时退化为串行"""
+        assert _can_send_to_workers((runner.root, runner.config.resolver))
+        with patch("multiprocessing.get_start_method", return_value=None) as get_method:
+            _can_send_to_workers((runner.root,))
+        # 只查询、不固定全局启动方式
+        get_method.assert_called_once_with(allow_none=True)
+        with patch("multiprocessing.get_start_method", return_value="spawn"):
+            assert not _can_send_to_workers((lambda: None,))
+
+        with (
+            patch("checks.runner._can_send_to_workers", return_value=False),
+            patch("concurrent.futures.ProcessPoolExecutor") as pool,
+        ):
+            issues = runner.run_parallel(max_workers=2, report=False)
+            pool.assert_not_called()
+        assert len(issues) == 40
+
+    def test_run_parallel_broken_pool_falls_back(self, runner: CheckRunner) -> None:
+        """测试进程池异常终止时改为串行检查"""
+        with patch("concurrent.futures.ProcessPoolExecutor", side_effect=BrokenProcessPool):
+            issues = runner.run_parallel(max_workers=2, report=False)
+        assert len(issues) == 40
+
+
+class TestCollectFiles:
+    """CheckRunner 文件收集测试"""
+
+    @pytest.fixture
+    def project(self, tmp_path: Path) -> Path:
+        """创建包含多级目录的临时项目"""
+        for rel in [
+            "index.md",
+            "_posts/a.md",
+            "_posts/sub/b.md",
+            "_posts/sub/c.txt",
+            "notes/n.md",
+            "node_modules/pkg/readme.md",
+        ]:
+            file = tmp_path / rel
+            file.parent.mkdir(parents=True, exist_ok=True)
+            file.write_text("# test", encoding="utf-8")
+        return tmp_path
+
+    def _collect(self, root: Path, include: list[str], exclude: list[str]) -> list[str]:
+        config = Config(root=root, include=include, exclude=exclude)
+        runner = CheckRunner(config=config, root=root)
+        return [f.relative_to(runner.root).as_posix() for f in runner._collect_files()]
+
+    def test_recursive_glob_matches_root_files(self, project: Path) -> None:
+        """测试 ** 匹配零级目录"""
+        files = self._collect(project, ["**/*.md"], ["node_modules/**"])
+        assert files == ["_posts/a.md", "_posts/sub/b.md", "index.md", "notes/n.md"]
+
+    def test_overlapping_patterns(self, project: Path) -> None:
+        """测试重叠的 include 模式不产生重复文件"""
+        files = self._collect(project, ["_posts/**/*.md", "_posts/*.md", "notes/*.md"], [])
+        assert files == ["_posts/a.md", "_posts/sub/b.md", "notes/n.md"]
+
+    def test_exclude_fnmatch_semantics(self, project: Path) -> None:
+        """测试 exclude 中的 * 可跨越目录"""
+        files = self._collect(project, ["**/*.md"], ["_posts/*", "node_modules/*"])
+        assert files == ["index.md", "notes/n.md"]
+
+    def test_literal_patterns_not_walked(self, project: Path) -> None:
+        """测试不含通配符的模式直接检查文件而不遍历目录"""
+        config = Config(root=project, include=["index.md", "notes/n.md", "missing.md"])
+        runner = CheckRunner(config=config, root=project)
+
+        bases, literals = runner._walk_bases()
+        assert bases == []
+        assert len(literals) == 3
+
+        files = self._collect(project, ["index.md", "_posts/a.md", "_posts/**/*.md"], [])
+        assert files == ["_posts/a.md", "_posts/sub/b.md", "index.md"]
+
+    def test_excluded_directories_pruned(self, project: Path) -> None:
+        """测试整目录排除的模式在遍历时跳过该目录"""
+        config = Config(root=project, include=["**/*.md"], exclude=["node_modules/**"])
+        assert config.compiled_prune is not None
+        runner = CheckRunner(config=config, root=project)
+
+        walked = [
+            rel
+            for _, rel in runner._walk_files(
+                runner.root, len(str(runner.root)), config.compiled_prune
+            )
+        ]
+        assert "index.md" in walked
+        assert not any(rel.startswith("node_modules/") for rel in walked)
+        assert Config(root=project, exclude=["*.tmp", "notes/*.md"]).compiled_prune is None
+
+    def test_dot_slash_prefix(self, project: Path) -> None:
+        """测试带 ./ 前缀的 include 模式"""
+        files = self._collect(project, ["./_posts/**/*.md", "./index.md"], [])
+        assert files == ["_posts/a.md", "_posts/sub/b.md", "index.md"]
+
+    def test_symlinked_directories_followed(self, project: Path) -> None:
+        """测试进入目录的符号链接，且指向上级目录的链接不会造成循环"""
+        try:
+            (project / "_posts" / "linked").symlink_to(project / "notes", target_is_directory=True)
+            (project / "notes" / "loop").symlink_to(project, target_is_directory=True)
+        except OSError:
+            pytest.skip("symlinks not supported")
+
+        files = self._collect(project, ["_posts/*/*.md"], [])
+        assert files == ["_posts/linked/n.md", "_posts/sub/b.md"]
+
+        files = self._collect(project, ["**/*.md"], ["node_modules/**"])
+        assert files == [
+            "_posts/a.md",
+            "_posts/linked/n.md",
+            "_posts/sub/b.md",
+            "index.md",
+            "notes/n.md",
+        ]
@@ -0,0 +1,11 @@
+"""修复器测试共享 fixtures"""
+
+import pytest
+
+from checks.reporters.console import ColorMode, ConsoleReporter
+
+
+@pytest.fixture
+def reporter() -> ConsoleReporter:
+    """无颜色控制台报告器"""
+    return ConsoleReporter(color=ColorMode.NEVER)
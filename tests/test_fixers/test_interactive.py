@@ -7,6 +7,7 @@
 4. 边界情况处理
 """
 
+from dataclasses import replace
 from pathlib import Path
 from unittest.mock import patch
 
@@ -15,24 +16,68 @@ import pytest
 from checks.core.issue import Issue, Severity
 from checks.fixers.base import FixAction, FixResult, FixSession
 from checks.fixers.interactive import InteractiveFixer
-from checks.reporters.console import ColorMode, ConsoleReporter
+from checks.reporters.console import ConsoleReporter
+
+
+def _feed_input(monkeypatch: pytest.MonkeyPatch, *answers: str | type[BaseException]) -> None:
+    """用给定答案依次替换 input()，答案为异常类型时抛出该异常"""
+    remaining = list(answers)
+
+    def fake_input(_prompt: str = "") -> str:
+        answer = remaining.pop(0)
+        if isinstance(answer, type):
+            raise answer
+        return answer
+
+    monkeypatch.setattr("builtins.input", fake_input)
+
+
+def _assert_contains_all(out: str, *required: str) -> None:
+    """断言输出包含所有片段，失败时列出缺失的片段"""
+    missing = [s for s in required if s not in out]
+    assert not missing, f"missing {missing} in output:\n{out}"
+
+
+# 流程测试共用的问题模板，通过 replace 派生各条问题
+_BASE_ISSUE = Issue(
+    file=Path("placeholder.md"),
+    line=1,
+    type="test",
+    message="x",
+    original="o",
+    suggestion="n",
+    checker="test",
+)
+
+
+def _make_issues(file: Path, count: int) -> list[Issue]:
+    """生成 count 条位于 file 第 1..count 行的可修复问题"""
+    return [
+        replace(
+            _BASE_ISSUE,
+            file=file,
+            line=i,
+            message=f"Issue {i}",
+            original=f"old{i}",
+            suggestion=f"new{i}",
+        )
+        for i in range(1, count + 1)
+    ]
 
 
 class TestInteractiveFixerBasic:
     """InteractiveFixer 基础功能测试"""
 
     @pytest.fixture
-    def fixer(self) -> InteractiveFixer:
+    def fixer(self, reporter: ConsoleReporter) -> InteractiveFixer:
         """创建修复器实例"""
-        return InteractiveFixer(
-            reporter=ConsoleReporter(color=ColorMode.NEVER),
-        )
+        return InteractiveFixer(reporter=reporter)
 
-    @pytest.fixture
-    def sample_issue(self, tmp_path: Path) -> Issue:
+    @pytest.fixture(scope="module")
+    def sample_issue(self, tmp_path_factory: pytest.TempPathFactory) -> Issue:
         """创建示例可修复问题"""
         return Issue(
-            file=tmp_path / "test.md",
+            file=tmp_path_factory.mktemp("issues") / "test.md",
             line=5,
             column=10,
             type="broken_image",
@@ -43,11 +88,11 @@ class TestInteractiveFixerBasic:
             severity=Severity.ERROR,
         )
 
-    @pytest.fixture
-    def non_fixable_issue(self, tmp_path: Path) -> Issue:
+    @pytest.fixture(scope="module")
+    def non_fixable_issue(self, tmp_path_factory: pytest.TempPathFactory) -> Issue:
         """创建不可修复问题（无建议）"""
         return Issue(
-            file=tmp_path / "test.md",
+            file=tmp_path_factory.mktemp("issues") / "test.md",
             line=10,
             type="test",
             message="Cannot fix this",
@@ -74,20 +119,29 @@ class TestInteractiveFixerBasic:
         assert fixer.can_fix(sample_issue) is True
         assert fixer.can_fix(non_fixable_issue) is False
 
+    def test_filter_fixable_respects_can_fix_override(
+        self, sample_issue: Issue, non_fixable_issue: Issue
+    ) -> None:
+        """测试子类覆盖 can_fix 时仍按其判断过滤"""
+
+        class NoFixer(InteractiveFixer):
+            def can_fix(self, issue: Issue) -> bool:  # noqa: ARG002
+                return False
+
+        assert NoFixer().filter_fixable([sample_issue, non_fixable_issue]) == []
+
 
 class TestInteractiveFixerPrompt:
     """InteractiveFixer 提示功能测试"""
 
     @pytest.fixture
-    def fixer(self) -> InteractiveFixer:
-        return InteractiveFixer(
-            reporter=ConsoleReporter(color=ColorMode.NEVER),
-        )
+    def fixer(self, reporter: ConsoleReporter) -> InteractiveFixer:
+        return InteractiveFixer(reporter=reporter)
 
-    @pytest.fixture
-    def sample_issue(self, tmp_path: Path) -> Issue:
+    @pytest.fixture(scope="module")
+    def sample_issue(self, tmp_path_factory: pytest.TempPathFactory) -> Issue:
         return Issue(
-            file=tmp_path / "test.md",
+            file=tmp_path_factory.mktemp("issues") / "test.md",
             line=5,
             type="test",
             message="Test",
@@ -96,158 +150,106 @@ class TestInteractiveFixerPrompt:
             checker="test",
         )
 
-    def test_prompt_yes(self, fixer: InteractiveFixer, sample_issue: Issue, tmp_path: Path) -> None:
-        """测试输入 y 返回 ACCEPT"""
-        with patch("builtins.input", return_value="y"):
-            action = fixer._prompt_action(sample_issue, tmp_path)
-            assert action == FixAction.ACCEPT
-
-    def test_prompt_yes_full(
-        self, fixer: InteractiveFixer, sample_issue: Issue, tmp_path: Path
-    ) -> None:
-        """测试输入 yes 返回 ACCEPT"""
-        with patch("builtins.input", return_value="yes"):
-            action = fixer._prompt_action(sample_issue, tmp_path)
-            assert action == FixAction.ACCEPT
-
-    def test_prompt_no(self, fixer: InteractiveFixer, sample_issue: Issue, tmp_path: Path) -> None:
-        """测试输入 n 返回 SKIP"""
-        with patch("builtins.input", return_value="n"):
-            action = fixer._prompt_action(sample_issue, tmp_path)
-            assert action == FixAction.SKIP
-
-    def test_prompt_no_full(
-        self, fixer: InteractiveFixer, sample_issue: Issue, tmp_path: Path
-    ) -> None:
-        """测试输入 no 返回 SKIP"""
-        with patch("builtins.input", return_value="no"):
-            action = fixer._prompt_action(sample_issue, tmp_path)
-            assert action == FixAction.SKIP
-
-    def test_prompt_all(self, fixer: InteractiveFixer, sample_issue: Issue, tmp_path: Path) -> None:
-        """测试输入 a 返回 ACCEPT_ALL"""
-        with patch("builtins.input", return_value="a"):
-            action = fixer._prompt_action(sample_issue, tmp_path)
-            assert action == FixAction.ACCEPT_ALL
-
-    def test_prompt_all_full(
-        self, fixer: InteractiveFixer, sample_issue: Issue, tmp_path: Path
-    ) -> None:
-        """测试输入 all 返回 ACCEPT_ALL"""
-        with patch("builtins.input", return_value="all"):
-            action = fixer._prompt_action(sample_issue, tmp_path)
-            assert action == FixAction.ACCEPT_ALL
-
-    def test_prompt_quit(
-        self, fixer: InteractiveFixer, sample_issue: Issue, tmp_path: Path
-    ) -> None:
-        """测试输入 q 返回 QUIT"""
-        with patch("builtins.input", return_value="q"):
-            action = fixer._prompt_action(sample_issue, tmp_path)
-            assert action == FixAction.QUIT
-
-    def test_prompt_quit_full(
-        self, fixer: InteractiveFixer, sample_issue: Issue, tmp_path: Path
-    ) -> None:
-        """测试输入 quit 返回 QUIT"""
-        with patch("builtins.input", return_value="quit"):
-            action = fixer._prompt_action(sample_issue, tmp_path)
-            assert action == FixAction.QUIT
-
-    def test_prompt_empty_default_skip(
-        self, fixer: InteractiveFixer, sample_issue: Issue, tmp_path: Path
-    ) -> None:
-        """测试空输入默认返回 SKIP"""
-        with patch("builtins.input", return_value=""):
-            action = fixer._prompt_action(sample_issue, tmp_path)
-            assert action == FixAction.SKIP
-
-    def test_prompt_eof_quit(
-        self, fixer: InteractiveFixer, sample_issue: Issue, tmp_path: Path
+    @pytest.mark.parametrize(
+        ("user_input", "expected"),
+        [
+            ("y", FixAction.ACCEPT),
+            ("yes", FixAction.ACCEPT),
+            ("Y", FixAction.ACCEPT),
+            ("YES", FixAction.ACCEPT),
+            ("n", FixAction.SKIP),
+            ("no", FixAction.SKIP),
+            ("a", FixAction.ACCEPT_ALL),
+            ("all", FixAction.ACCEPT_ALL),
+            ("q", FixAction.QUIT),
+            ("quit", FixAction.QUIT),
+            ("", FixAction.SKIP),
+        ],
+    )
+    def test_prompt_action(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        fixer: InteractiveFixer,
+        sample_issue: Issue,
+        user_input: str,
+        expected: str,
     ) -> None:
-        """测试 EOF 返回 QUIT"""
-        with patch("builtins.input", side_effect=EOFError):
-            action = fixer._prompt_action(sample_issue, tmp_path)
-            assert action == FixAction.QUIT
-
-    def test_prompt_keyboard_interrupt(
-        self, fixer: InteractiveFixer, sample_issue: Issue, tmp_path: Path
+        """测试输入到动作的映射（大小写不敏感，空输入默认 SKIP）"""
+        _feed_input(monkeypatch, user_input)
+        assert fixer._prompt_action(sample_issue, sample_issue.file.parent) == expected
+
+    @pytest.mark.parametrize(
+        "error", [pytest.param(EOFError, id="eof"), pytest.param(KeyboardInterrupt, id="ctrl-c")]
+    )
+    def test_prompt_interrupt_quit(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        fixer: InteractiveFixer,
+        sample_issue: Issue,
+        tmp_path: Path,
+        error: type[BaseException],
     ) -> None:
-        """测试 Ctrl+C 返回 QUIT"""
-        with patch("builtins.input", side_effect=KeyboardInterrupt):
-            action = fixer._prompt_action(sample_issue, tmp_path)
-            assert action == FixAction.QUIT
+        """测试 EOF / Ctrl+C 返回 QUIT"""
+        _feed_input(monkeypatch, error)
+        assert fixer._prompt_action(sample_issue, tmp_path) == FixAction.QUIT
 
     def test_prompt_diff_then_accept(
         self,
+        monkeypatch: pytest.MonkeyPatch,
         fixer: InteractiveFixer,
         sample_issue: Issue,
         tmp_path: Path,
         capsys: pytest.CaptureFixture[str],
     ) -> None:
         """测试先查看 diff 然后接受"""
-        with patch("builtins.input", side_effect=["d", "y"]):
-            action = fixer._prompt_action(sample_issue, tmp_path)
-            assert action == FixAction.ACCEPT
+        _feed_input(monkeypatch, "d", "y")
+        action = fixer._prompt_action(sample_issue, tmp_path)
+        assert action == FixAction.ACCEPT
 
-            # 检查 diff 输出
-            captured = capsys.readouterr()
-            assert "Original" in captured.out
-            assert "Fixed" in captured.out
+        # 检查 diff 输出
+        _assert_contains_all(capsys.readouterr().out, "Original", "Fixed")
 
     def test_prompt_help_then_skip(
         self,
+        monkeypatch: pytest.MonkeyPatch,
         fixer: InteractiveFixer,
         sample_issue: Issue,
         tmp_path: Path,
         capsys: pytest.CaptureFixture[str],
     ) -> None:
         """测试先查看帮助然后跳过"""
-        with patch("builtins.input", side_effect=["?", "n"]):
-            action = fixer._prompt_action(sample_issue, tmp_path)
-            assert action == FixAction.SKIP
+        _feed_input(monkeypatch, "?", "n")
+        action = fixer._prompt_action(sample_issue, tmp_path)
+        assert action == FixAction.SKIP
 
-            # 检查帮助输出
-            captured = capsys.readouterr()
-            assert "Accept this fix" in captured.out
+        # 检查帮助输出
+        captured = capsys.readouterr()
+        assert "Accept this fix" in captured.out
 
     def test_prompt_invalid_then_valid(
         self,
+        monkeypatch: pytest.MonkeyPatch,
         fixer: InteractiveFixer,
         sample_issue: Issue,
         tmp_path: Path,
         capsys: pytest.CaptureFixture[str],
     ) -> None:
         """测试无效输入后有效输入"""
-        with patch("builtins.input", side_effect=["invalid", "y"]):
-            action = fixer._prompt_action(sample_issue, tmp_path)
-            assert action == FixAction.ACCEPT
+        _feed_input(monkeypatch, "invalid", "y")
+        action = fixer._prompt_action(sample_issue, tmp_path)
+        assert action == FixAction.ACCEPT
 
-            # 检查错误提示
-            captured = capsys.readouterr()
-            assert "Unknown option" in captured.out
-
-    def test_prompt_case_insensitive(
-        self, fixer: InteractiveFixer, sample_issue: Issue, tmp_path: Path
-    ) -> None:
-        """测试大小写不敏感"""
-        with patch("builtins.input", return_value="Y"):
-            action = fixer._prompt_action(sample_issue, tmp_path)
-            assert action == FixAction.ACCEPT
-
-        with patch("builtins.input", return_value="YES"):
-            action = fixer._prompt_action(sample_issue, tmp_path)
-            assert action == FixAction.ACCEPT
+        # 检查错误提示
+        captured = capsys.readouterr()
+        assert "Unknown option" in captured.out
 
 
 class TestInteractiveFixerDiffPreview:
     """InteractiveFixer diff 预览测试"""
 
     @pytest.fixture
-    def fixer(self) -> InteractiveFixer:
-        return InteractiveFixer(
-            reporter=ConsoleReporter(color=ColorMode.NEVER),
-        )
+    def fixer(self, reporter: ConsoleReporter) -> InteractiveFixer:
+        return InteractiveFixer(reporter=reporter)
 
     def test_show_diff_preview(
         self,
@@ -266,12 +268,13 @@ class TestInteractiveFixerDiffPreview:
             checker="test",
         )
         fixer._show_diff_preview(issue, tmp_path)
-        captured = capsys.readouterr()
-
-        assert "--- Original" in captured.out
-        assert "- old content" in captured.out
-        assert "+++ Fixed" in captured.out
-        assert "+ new content" in captured.out
+        _assert_contains_all(
+            capsys.readouterr().out,
+            "--- Original",
+            "- old content",
+            "+++ Fixed",
+            "+ new content",
+        )
 
     def test_show_diff_preview_no_fix(
         self,
@@ -299,12 +302,26 @@ class TestInteractiveFixerFlow:
     """InteractiveFixer 流程测试"""
 
     @pytest.fixture
-    def fixer(self) -> InteractiveFixer:
-        return InteractiveFixer(
-            reporter=ConsoleReporter(color=ColorMode.NEVER),
-        )
+    def fixer(self, reporter: ConsoleReporter) -> InteractiveFixer:
+        return InteractiveFixer(reporter=reporter)
+
+    @pytest.fixture(scope="module")
+    def issue_batch(
+        self, request: pytest.FixtureRequest, tmp_path_factory: pytest.TempPathFactory
+    ) -> list[Issue]:
+        """按参数生成一批可修复问题，同一数量的批次在模块内复用"""
+        return _make_issues(tmp_path_factory.mktemp("batch") / "test.md", request.param)
+
+    def test_fix_no_fixable_issues(self, fixer: InteractiveFixer, tmp_path: Path) -> None:
+        """测试无可修复问题时不产生结果"""
+        issues = [
+            replace(_BASE_ISSUE, file=tmp_path / "test.md", message="Not fixable", suggestion=None)
+        ]
+
+        session = fixer.fix(issues, tmp_path, dry_run=True)
+        assert len(session.results) == 0
 
-    def test_fix_no_fixable_issues(
+    def test_fix_no_fixable_issues_message(
         self,
         fixer: InteractiveFixer,
         tmp_path: Path,
@@ -312,162 +329,99 @@ class TestInteractiveFixerFlow:
     ) -> None:
         """测试无可修复问题时的输出"""
         issues = [
-            Issue(
-                file=tmp_path / "test.md",
-                line=1,
-                type="test",
-                message="Not fixable",
-                original="x",
-                suggestion=None,
-                checker="test",
-            )
+            replace(_BASE_ISSUE, file=tmp_path / "test.md", message="Not fixable", suggestion=None)
         ]
 
-        session = fixer.fix(issues, tmp_path, dry_run=True)
-        captured = capsys.readouterr()
-
-        assert "No fixable issues found" in captured.out
-        assert len(session.results) == 0
+        fixer.fix(issues, tmp_path, dry_run=True)
+        assert "No fixable issues found" in capsys.readouterr().out
 
+    @pytest.mark.parametrize("issue_batch", [2], indirect=True)
     def test_fix_skip_all(
         self,
+        monkeypatch: pytest.MonkeyPatch,
         fixer: InteractiveFixer,
-        tmp_path: Path,
+        issue_batch: list[Issue],
     ) -> None:
         """测试跳过所有问题"""
-        issues = [
-            Issue(
-                file=tmp_path / "test.md",
-                line=1,
-                type="test",
-                message="Issue 1",
-                original="old1",
-                suggestion="new1",
-                checker="test",
-            ),
-            Issue(
-                file=tmp_path / "test.md",
-                line=2,
-                type="test",
-                message="Issue 2",
-                original="old2",
-                suggestion="new2",
-                checker="test",
-            ),
-        ]
-
-        with patch("builtins.input", return_value="n"):
-            session = fixer.fix(issues, tmp_path, dry_run=True)
+        _feed_input(monkeypatch, "n", "n")
+        session = fixer.fix(issue_batch, issue_batch[0].file.parent, dry_run=True)
 
         assert len(session.results) == 2
         assert all(r.action == FixAction.SKIP for r in session.results)
 
+    @pytest.mark.parametrize("issue_batch", [2], indirect=True)
     def test_fix_accept_first_skip_second(
         self,
+        monkeypatch: pytest.MonkeyPatch,
         fixer: InteractiveFixer,
-        tmp_path: Path,
+        issue_batch: list[Issue],
     ) -> None:
         """测试接受第一个，跳过第二个"""
-        issues = [
-            Issue(
-                file=tmp_path / "test.md",
-                line=1,
-                type="test",
-                message="Issue 1",
-                original="old1",
-                suggestion="new1",
-                checker="test",
-            ),
-            Issue(
-                file=tmp_path / "test.md",
-                line=2,
-                type="test",
-                message="Issue 2",
-                original="old2",
-                suggestion="new2",
-                checker="test",
-            ),
-        ]
-
-        with patch("builtins.input", side_effect=["y", "n"]):
-            session = fixer.fix(issues, tmp_path, dry_run=True)
+        _feed_input(monkeypatch, "y", "n")
+        session = fixer.fix(issue_batch, issue_batch[0].file.parent, dry_run=True)
 
         assert len(session.results) == 2
         assert session.results[0].action == FixAction.ACCEPT
         assert session.results[1].action == FixAction.SKIP
 
+    @pytest.mark.parametrize("issue_batch", [5], indirect=True)
     def test_fix_quit_early(
         self,
+        monkeypatch: pytest.MonkeyPatch,
         fixer: InteractiveFixer,
-        tmp_path: Path,
+        issue_batch: list[Issue],
     ) -> None:
         """测试提前退出
 
         quit 会立即中断循环，所以第二个问题不会被记录到 results 中。
         只有被处理过的问题（接受/跳过）才会有结果。
         """
-        issues = [
-            Issue(
-                file=tmp_path / "test.md",
-                line=i,
-                type="test",
-                message=f"Issue {i}",
-                original=f"old{i}",
-                suggestion=f"new{i}",
-                checker="test",
-            )
-            for i in range(1, 6)
-        ]
-
         # 接受第一个，然后退出
-        with patch("builtins.input", side_effect=["y", "q"]):
-            session = fixer.fix(issues, tmp_path, dry_run=True)
+        _feed_input(monkeypatch, "y", "q")
+        session = fixer.fix(issue_batch, issue_batch[0].file.parent, dry_run=True)
 
         # quit 中断循环，第二个问题没有被记录
         # 只有第一个被接受的问题有结果
         assert len(session.results) == 1
         assert session.results[0].action == FixAction.ACCEPT
 
+    @pytest.mark.parametrize("issue_batch", [3], indirect=True)
     def test_fix_accept_all(
         self,
+        monkeypatch: pytest.MonkeyPatch,
         fixer: InteractiveFixer,
-        tmp_path: Path,
-        capsys: pytest.CaptureFixture[str],
+        issue_batch: list[Issue],
     ) -> None:
         """测试接受所有"""
-        issues = [
-            Issue(
-                file=tmp_path / "test.md",
-                line=i,
-                type="test",
-                message=f"Issue {i}",
-                original=f"old{i}",
-                suggestion=f"new{i}",
-                checker="test",
-            )
-            for i in range(1, 4)
-        ]
-
         # 接受第一个后选择 all
-        with patch("builtins.input", side_effect=["a"]):
-            session = fixer.fix(issues, tmp_path, dry_run=True)
+        _feed_input(monkeypatch, "a")
+        session = fixer.fix(issue_batch, issue_batch[0].file.parent, dry_run=True)
 
         # 所有问题都应该被接受
         assert len(session.results) == 3
         assert all(r.action == FixAction.ACCEPT for r in session.results)
 
-        captured = capsys.readouterr()
-        assert "Accepting all remaining" in captured.out
+    @pytest.mark.parametrize("issue_batch", [1], indirect=True)
+    def test_accept_all_prints_message(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        fixer: InteractiveFixer,
+        issue_batch: list[Issue],
+        capsys: pytest.CaptureFixture[str],
+    ) -> None:
+        """测试选择 all 时的提示输出"""
+        _feed_input(monkeypatch, "a")
+        fixer.fix(issue_batch, issue_batch[0].file.parent, dry_run=True)
+
+        assert "Accepting all remaining" in capsys.readouterr().out
 
 
 class TestInteractiveFixerSummary:
     """InteractiveFixer 摘要测试"""
 
     @pytest.fixture
-    def fixer(self) -> InteractiveFixer:
-        return InteractiveFixer(
-            reporter=ConsoleReporter(color=ColorMode.NEVER),
-        )
+    def fixer(self, reporter: ConsoleReporter) -> InteractiveFixer:
+        return InteractiveFixer(reporter=reporter)
 
     def test_print_summary(
         self,
@@ -493,31 +447,41 @@ class TestInteractiveFixerSummary:
         ]
 
         fixer._print_summary(session)
-        captured = capsys.readouterr()
+        _assert_contains_all(
+            capsys.readouterr().out,
+            "Summary",
+            "1 fix(es) applied",
+            "1 fix(es) pending",
+            "1 issue(s) skipped",
+        )
+
 
-        assert "Summary" in captured.out
-        assert "1 fix(es) applied" in captured.out
-        assert "1 fix(es) pending" in captured.out
-        assert "1 issue(s) skipped" in captured.out
+_INTEGRATION_CONTENT = b"line1\nold content\nline3\n"
 
 
 class TestInteractiveFixerIntegration:
     """InteractiveFixer 集成测试"""
 
     @pytest.fixture
-    def test_file(self, tmp_path: Path) -> Path:
+    def fixer(self, reporter: ConsoleReporter) -> InteractiveFixer:
+        return InteractiveFixer(reporter=reporter)
+
+    @pytest.fixture(scope="module")
+    def test_file(self, tmp_path_factory: pytest.TempPathFactory) -> Path:
         """创建测试文件"""
-        file = tmp_path / "test.md"
-        file.write_text("line1\nold content\nline3\n", encoding="utf-8")
+        file = tmp_path_factory.mktemp("integration") / "test.md"
+        file.write_bytes(_INTEGRATION_CONTENT)
         return file
 
-    def test_fix_applies_changes(self, tmp_path: Path, test_file: Path) -> None:
-        """测试修复确实应用了更改"""
-        fixer = InteractiveFixer(
-            reporter=ConsoleReporter(color=ColorMode.NEVER),
-        )
-
-        issues = [
+    @pytest.fixture
+    def pristine_test_file(self, test_file: Path) -> Path:
+        """恢复测试文件的初始内容（用于检查文件是否被修改的测试）"""
+        test_file.write_bytes(_INTEGRATION_CONTENT)
+        return test_file
+
+    @pytest.fixture(scope="module")
+    def issues(self, test_file: Path) -> list[Issue]:
+        return [
             Issue(
                 file=test_file,
                 line=2,
@@ -529,39 +493,35 @@ class TestInteractiveFixerIntegration:
             )
         ]
 
+    def test_fix_applies_changes(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        fixer: InteractiveFixer,
+        test_file: Path,
+        issues: list[Issue],
+    ) -> None:
+        """测试修复确实应用了更改"""
         # Mock PatchFixer 的 fix 方法来避免实际文件操作
         with patch.object(fixer.patch_fixer, "fix") as mock_fix:
             mock_session = FixSession()
             mock_fix.return_value = mock_session
 
-            with patch("builtins.input", return_value="y"):
-                fixer.fix(issues, tmp_path, dry_run=False)
+            _feed_input(monkeypatch, "y")
+            fixer.fix(issues, test_file.parent, dry_run=False)
 
         # 验证调用
         assert mock_fix.called
 
-    def test_dry_run_no_changes(self, tmp_path: Path, test_file: Path) -> None:
+    def test_dry_run_no_changes(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        fixer: InteractiveFixer,
+        pristine_test_file: Path,
+        issues: list[Issue],
+    ) -> None:
         """测试 dry-run 不修改文件"""
-        original_content = test_file.read_text(encoding="utf-8")
-
-        fixer = InteractiveFixer(
-            reporter=ConsoleReporter(color=ColorMode.NEVER),
-        )
-
-        issues = [
-            Issue(
-                file=test_file,
-                line=2,
-                type="test",
-                message="Fix this",
-                original="old content",
-                suggestion="new content",
-                checker="test",
-            )
-        ]
-
-        with patch("builtins.input", return_value="y"):
-            fixer.fix(issues, tmp_path, dry_run=True)
+        _feed_input(monkeypatch, "y")
+        fixer.fix(issues, pristine_test_file.parent, dry_run=True)
 
         # 文件内容应该没有变化
-        assert test_file.read_text(encoding="utf-8") == original_content
+        assert pristine_test_file.read_bytes() == _INTEGRATION_CONTENT
@@ -9,23 +9,91 @@
 6. 撤销功能
 """
 
+import difflib
+from collections.abc import Iterator
+from datetime import datetime, tzinfo
 from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Final
 from unittest.mock import MagicMock, patch
 
 import pytest
 
 from checks.core.issue import Fix, Issue
-from checks.fixers.base import FixAction
+from checks.fixers.base import FixAction, FixSession
 from checks.fixers.patch import PatchFixer
 
 
+def _write_utf8(path: Path, text: str) -> None:
+    """以 UTF-8 字节写入（不经过文本 IO 包装）"""
+    path.write_bytes(text.encode("utf-8"))
+
+
+def _read_utf8(path: Path) -> str:
+    """以 UTF-8 字节读取并解码（不经过文本 IO 包装）"""
+    return path.read_bytes().decode("utf-8")
+
+
+# 测试问题的公共字段，各测试只覆盖需要的字段
+_DEFAULT_ISSUE: Final = {"type": "test", "message": "Fix", "checker": "test"}
+
+
+def _issue(**overrides: Any) -> Issue:
+    """以公共字段为默认值创建 Issue"""
+    return Issue(**(_DEFAULT_ISSUE | overrides))
+
+
+# 单文件修复测试使用的文件内容（预先编码，按键名生成 <key>.md）
+_FILES: dict[str, bytes] = {
+    "test": b"line 1\nold content here\nline 3\nline 4\nline 5\n",
+    "multi": b"line 1\nfix me\nline 3\nalso fix\nline 5\n",
+    "first": b"fix this\nline 2\nline 3\n",
+    "last": b"line 1\nline 2\nfix this",
+    "long": "".join(f"line {i}\n" for i in range(1, 41)).encode("utf-8"),
+}
+
+# patch 文件测试使用的 unified diff 内容
+_SAVE_PATCH: Final = "--- a/test.md\n+++ b/test.md\n@@ -1 +1 @@\n-old\n+new\n"
+_PREVIEW_PATCH: Final = b"--- a/test.md\n+++ b/test.md\n"
+_SIMPLE_PATCH: Final = (
+    b"--- a/test.md\n+++ b/test.md\n@@ -1,3 +1,3 @@\n line 1\n-old line\n+new line\n line 3\n"
+)
+_MISSING_PATCH: Final = b"--- a/missing.md\n+++ b/missing.md\n@@ -1 +1 @@\n-old\n+new\n"
+# 只需存在、不会被解析的 patch 文件内容
+_DUMMY_PATCH: Final = b"patch content"
+
+
+@pytest.fixture
+def fixer() -> PatchFixer:
+    """每个测试独立的修复器实例，内容缓存与工具探测结果不跨测试共享"""
+    return PatchFixer()
+
+
+@pytest.fixture
+def patch_dir(fixer: PatchFixer, tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """空 patch 目录（供写入单个 patch 的测试使用）"""
+    patch_dir = tmp_path_factory.mktemp("patches_root") / fixer.patch_dir
+    patch_dir.mkdir(parents=True)
+    return patch_dir
+
+
+@pytest.fixture(autouse=True)
+def tools_on_path() -> Iterator[None]:
+    """假定 git/patch 均在 PATH 中，使 subprocess 相关测试不依赖运行环境"""
+    with patch("shutil.which", side_effect=lambda name: f"/usr/bin/{name}"):
+        yield
+
+
+@pytest.fixture
+def mock_run() -> Iterator[MagicMock]:
+    """替换 subprocess.run"""
+    with patch("subprocess.run") as mock:
+        yield mock
+
+
 class TestPatchFixerBasic:
     """PatchFixer 基础功能测试"""
 
-    @pytest.fixture
-    def fixer(self) -> PatchFixer:
-        return PatchFixer()
-
     def test_default_attributes(self, fixer: PatchFixer) -> None:
         """测试默认属性"""
         assert fixer.name == "patch"
@@ -37,32 +105,26 @@ class TestPatchFixerFixFile:
     """PatchFixer 单文件修复测试"""
 
     @pytest.fixture
-    def fixer(self) -> PatchFixer:
-        return PatchFixer()
-
-    @pytest.fixture
-    def test_file(self, tmp_path: Path) -> Path:
-        """创建测试文件"""
-        file = tmp_path / "test.md"
-        file.write_text(
-            "line 1\nold content here\nline 3\nline 4\nline 5\n",
-            encoding="utf-8",
-        )
+    def md_file(self, request: pytest.FixtureRequest, tmp_path: Path) -> Path:
+        """按参数（_FILES 的键，默认 test）创建测试文件，键不在 _FILES 中时不创建"""
+        key = getattr(request, "param", "test")
+        file = tmp_path / f"{key}.md"
+        content = _FILES.get(key)
+        if content is not None:
+            file.write_bytes(content)
         return file
 
-    def test_fix_single_issue(self, fixer: PatchFixer, test_file: Path, tmp_path: Path) -> None:
+    def test_fix_single_issue(self, fixer: PatchFixer, md_file: Path, tmp_path: Path) -> None:
         """测试修复单个问题"""
-        issue = Issue(
-            file=test_file,
+        issue = _issue(
+            file=md_file,
             line=2,
-            type="test",
             message="Fix this",
             original="old content",
             suggestion="new content",
-            checker="test",
         )
 
-        patch_str, results = fixer._fix_file(test_file, [issue], tmp_path)
+        patch_str, results = fixer._fix_file(md_file, [issue], tmp_path)
 
         assert patch_str is not None
         assert len(results) == 1
@@ -70,171 +132,148 @@ class TestPatchFixerFixFile:
         assert "old content" in patch_str
         assert "new content" in patch_str
 
-    def test_fix_multiple_issues_same_file(self, fixer: PatchFixer, tmp_path: Path) -> None:
+    @pytest.mark.parametrize("md_file", ["multi"], indirect=True)
+    def test_fix_multiple_issues_same_file(
+        self, fixer: PatchFixer, md_file: Path, tmp_path: Path
+    ) -> None:
         """测试同文件多个问题"""
-        file = tmp_path / "multi.md"
-        file.write_text(
-            "line 1\nfix me\nline 3\nalso fix\nline 5\n",
-            encoding="utf-8",
-        )
-
         issues = [
-            Issue(
-                file=file,
-                line=2,
-                type="test",
-                message="First",
-                original="fix me",
-                suggestion="fixed 1",
-                checker="test",
-            ),
-            Issue(
-                file=file,
-                line=4,
-                type="test",
-                message="Second",
-                original="also fix",
-                suggestion="fixed 2",
-                checker="test",
+            _issue(file=md_file, line=2, message="First", original="fix me", suggestion="fixed 1"),
+            _issue(
+                file=md_file, line=4, message="Second", original="also fix", suggestion="fixed 2"
             ),
         ]
 
-        patch_str, results = fixer._fix_file(file, issues, tmp_path)
+        patch_str, results = fixer._fix_file(md_file, issues, tmp_path)
 
         assert patch_str is not None
         assert len(results) == 2
         # 两个修复都应该成功
         assert all(r.action == FixAction.ACCEPT for r in results)
 
-    def test_fix_issue_no_suggestion(
-        self, fixer: PatchFixer, test_file: Path, tmp_path: Path
+    @pytest.mark.parametrize("md_file", ["long"], indirect=True)
+    def test_fix_matches_difflib_output(
+        self, fixer: PatchFixer, md_file: Path, tmp_path: Path
     ) -> None:
-        """测试无建议的问题"""
-        issue = Issue(
-            file=test_file,
-            line=2,
-            type="test",
-            message="No fix",
-            original="old content",
-            suggestion=None,  # 无建议
-            checker="test",
-        )
+        """测试直接生成的 diff 与 difflib 一致（含多个 hunk）"""
+        original = _FILES["long"].decode("utf-8")
 
-        patch_str, results = fixer._fix_file(test_file, [issue], tmp_path)
+        issues = [
+            _issue(file=md_file, line=line, original=f"line {line}", suggestion=f"fixed {line}")
+            for line in (2, 5, 6, 30)
+        ]
 
-        # 没有实际修复，patch 应该为 None
-        assert patch_str is None
-        assert len(results) == 1
-        assert results[0].action == FixAction.SKIP
-        assert "No fix available" in (results[0].error or "")
-
-    def test_fix_file_not_found(self, fixer: PatchFixer, tmp_path: Path) -> None:
-        """测试文件不存在"""
-        missing_file = tmp_path / "missing.md"
-        issue = Issue(
-            file=missing_file,
-            line=1,
-            type="test",
-            message="Test",
-            original="x",
-            suggestion="y",
-            checker="test",
+        patch_str, _ = fixer._fix_file(md_file, issues, tmp_path)
+
+        fixed = original
+        for line in (2, 5, 6, 30):
+            fixed = fixed.replace(f"line {line}\n", f"fixed {line}\n")
+        expected = "".join(
+            difflib.unified_diff(
+                original.splitlines(keepends=True),
+                fixed.splitlines(keepends=True),
+                fromfile="a/long.md",
+                tofile="b/long.md",
+            )
         )
-
-        patch_str, results = fixer._fix_file(missing_file, [issue], tmp_path)
-
-        assert patch_str is None
-        assert len(results) == 1
-        assert results[0].action == FixAction.SKIP
-        assert "Failed to read file" in (results[0].error or "")
-
-    def test_fix_line_out_of_range(
-        self, fixer: PatchFixer, test_file: Path, tmp_path: Path
+        assert patch_str == expected
+
+    @pytest.mark.parametrize(
+        ("md_file", "line", "original", "suggestion", "action", "error", "patch_parts"),
+        [
+            # 修复第一行 / 最后一行（无结尾换行）
+            pytest.param(
+                "first",
+                1,
+                "fix this",
+                "fixed",
+                FixAction.ACCEPT,
+                None,
+                ("-fix this", "+fixed"),
+                id="first-line",
+            ),
+            pytest.param(
+                "last",
+                3,
+                "fix this",
+                "fixed",
+                FixAction.ACCEPT,
+                None,
+                ("-fix this", "+fixed"),
+                id="last-line",
+            ),
+            # 行号超出文件行数
+            pytest.param(
+                "test", 999, "x", "y", FixAction.SKIP, "out of range", None, id="out-of-range"
+            ),
+            # 替换不会改变内容（original 不存在），没有 patch 但仍标记为 ACCEPT
+            pytest.param(
+                "test",
+                2,
+                "nonexistent text",
+                "new text",
+                FixAction.ACCEPT,
+                None,
+                None,
+                id="no-change-needed",
+            ),
+            # 无建议的问题
+            pytest.param(
+                "test",
+                2,
+                "old content",
+                None,
+                FixAction.SKIP,
+                "No fix available",
+                None,
+                id="no-suggestion",
+            ),
+            # 文件不存在
+            pytest.param(
+                "missing",
+                1,
+                "x",
+                "y",
+                FixAction.SKIP,
+                "Failed to read file",
+                None,
+                id="file-not-found",
+            ),
+        ],
+        indirect=["md_file"],
+    )
+    def test_fix_edge_cases(
+        self,
+        fixer: PatchFixer,
+        md_file: Path,
+        tmp_path: Path,
+        *,
+        line: int,
+        original: str,
+        suggestion: str | None,
+        action: str,
+        error: str | None,
+        patch_parts: tuple[str, ...] | None,
     ) -> None:
-        """测试行号超出范围"""
-        issue = Issue(
-            file=test_file,
-            line=999,  # 超出文件行数
-            type="test",
-            message="Test",
-            original="x",
-            suggestion="y",
-            checker="test",
-        )
+        """测试单个问题的边界情况（patch_parts 为 None 表示不应生成 patch）"""
+        issue = _issue(file=md_file, line=line, original=original, suggestion=suggestion)
 
-        _patch_str, results = fixer._fix_file(test_file, [issue], tmp_path)
+        patch_str, results = fixer._fix_file(md_file, [issue], tmp_path)
 
         assert len(results) == 1
-        assert results[0].action == FixAction.SKIP
-        assert "out of range" in (results[0].error or "")
-
-    def test_fix_first_line(self, fixer: PatchFixer, tmp_path: Path) -> None:
-        """测试修复第一行"""
-        file = tmp_path / "first.md"
-        file.write_text("fix this\nline 2\nline 3\n", encoding="utf-8")
-
-        issue = Issue(
-            file=file,
-            line=1,
-            type="test",
-            message="Fix",
-            original="fix this",
-            suggestion="fixed",
-            checker="test",
-        )
-
-        patch_str, _results = fixer._fix_file(file, [issue], tmp_path)
-
-        assert patch_str is not None
-        assert "-fix this" in patch_str
-        assert "+fixed" in patch_str
-
-    def test_fix_last_line(self, fixer: PatchFixer, tmp_path: Path) -> None:
-        """测试修复最后一行"""
-        file = tmp_path / "last.md"
-        file.write_text("line 1\nline 2\nfix this", encoding="utf-8")
-
-        issue = Issue(
-            file=file,
-            line=3,
-            type="test",
-            message="Fix",
-            original="fix this",
-            suggestion="fixed",
-            checker="test",
-        )
-
-        patch_str, results = fixer._fix_file(file, [issue], tmp_path)
-
-        assert patch_str is not None
-        assert results[0].action == FixAction.ACCEPT
-
-    def test_fix_no_change_needed(self, fixer: PatchFixer, test_file: Path, tmp_path: Path) -> None:
-        """测试内容没有变化（original 不在文件中）"""
-        issue = Issue(
-            file=test_file,
-            line=2,
-            type="test",
-            message="Fix",
-            original="nonexistent text",
-            suggestion="new text",
-            checker="test",
-        )
-
-        _patch_str, results = fixer._fix_file(test_file, [issue], tmp_path)
-
-        # 替换不会改变内容（因为 original 不存在），所以没有 patch
-        # 但 FixResult 仍然标记为 ACCEPT
-        assert results[0].action == FixAction.ACCEPT
+        assert results[0].action == action
+        if error is not None:
+            assert error in (results[0].error or "")
+        if patch_parts is None:
+            assert patch_str is None
+        else:
+            assert patch_str is not None
+            assert all(part in patch_str for part in patch_parts)
 
 
 class TestPatchFixerSession:
     """PatchFixer 会话测试"""
 
-    @pytest.fixture
-    def fixer(self) -> PatchFixer:
-        return PatchFixer()
-
     def test_fix_empty_issues(self, fixer: PatchFixer, tmp_path: Path) -> None:
         """测试空问题列表"""
         session = fixer.fix([], tmp_path, dry_run=True)
@@ -242,96 +281,89 @@ class TestPatchFixerSession:
         assert len(session.results) == 0
         assert session.completed_at is not None
 
-    def test_fix_dry_run(self, fixer: PatchFixer, tmp_path: Path) -> None:
-        """测试 dry-run 模式"""
-        file = tmp_path / "test.md"
-        original_content = "old content\n"
-        file.write_text(original_content, encoding="utf-8")
-
-        issues = [
-            Issue(
-                file=file,
-                line=1,
-                type="test",
-                message="Fix",
-                original="old content",
-                suggestion="new content",
-                checker="test",
-            )
-        ]
+    @staticmethod
+    def _run_session(
+        fixer: PatchFixer, root: Path, n_files: int, dry_run: bool
+    ) -> tuple[list[Path], FixSession]:
+        """在 n_files 个文件中各放一个可修复问题并执行修复"""
+        files = []
+        issues = []
+        for i in range(1, n_files + 1):
+            file = root / f"file{i}.md"
+            _write_utf8(file, f"content{i}\n")
+            files.append(file)
+            issues.append(_issue(file=file, line=1, original=f"content{i}", suggestion=f"fixed{i}"))
+        return files, fixer.fix(issues, root, dry_run=dry_run)
+
+    @pytest.mark.parametrize(
+        ("n_files", "dry_run"),
+        [
+            pytest.param(1, True, id="dry-run"),
+            pytest.param(2, True, id="multiple-files-dry-run"),
+            pytest.param(2, False, id="multiple-files-write"),
+        ],
+    )
+    def test_fix_session(
+        self, fixer: PatchFixer, tmp_path: Path, n_files: int, dry_run: bool
+    ) -> None:
+        """测试多文件修复与 dry-run 模式"""
+        files, session = self._run_session(fixer, tmp_path, n_files, dry_run)
 
-        fixer.fix(issues, tmp_path, dry_run=True)
+        assert len(session.results) == n_files
+        assert all(r.action == FixAction.ACCEPT for r in session.results)
 
-        # dry-run 不应该修改文件
-        assert file.read_text(encoding="utf-8") == original_content
-        # 不应该创建 patch 文件
         patch_dir = tmp_path / fixer.patch_dir
-        assert not patch_dir.exists() or len(list(patch_dir.glob("*.patch"))) == 0
-
-    def test_fix_multiple_files(self, fixer: PatchFixer, tmp_path: Path) -> None:
-        """测试多文件修复"""
-        file1 = tmp_path / "file1.md"
-        file1.write_text("content1\n", encoding="utf-8")
-
-        file2 = tmp_path / "file2.md"
-        file2.write_text("content2\n", encoding="utf-8")
-
-        issues = [
-            Issue(
-                file=file1,
-                line=1,
-                type="test",
-                message="Fix1",
-                original="content1",
-                suggestion="fixed1",
-                checker="test",
-            ),
-            Issue(
-                file=file2,
-                line=1,
-                type="test",
-                message="Fix2",
-                original="content2",
-                suggestion="fixed2",
-                checker="test",
-            ),
-        ]
-
-        session = fixer.fix(issues, tmp_path, dry_run=True)
-
-        assert len(session.results) == 2
+        if dry_run:
+            # dry-run 不应该修改文件，也不应该创建 patch 文件
+            assert [_read_utf8(f) for f in files] == [
+                f"content{i}\n" for i in range(1, n_files + 1)
+            ]
+            assert next(patch_dir.glob("*.patch"), None) is None
+        else:
+            assert [_read_utf8(f) for f in files] == [f"fixed{i}\n" for i in range(1, n_files + 1)]
+            assert len(list(patch_dir.glob("*.patch"))) == 1
+            assert all(r.applied for r in session.results)
 
 
 class TestPatchFixerPatchFile:
     """PatchFixer Patch 文件测试"""
 
-    @pytest.fixture
-    def fixer(self) -> PatchFixer:
-        return PatchFixer()
+    def test_save_patch(
+        self, fixer: PatchFixer, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """测试保存 patch 文件（固定当前时间，文件名可确定）"""
 
-    def test_save_patch(self, fixer: PatchFixer, tmp_path: Path) -> None:
-        """测试保存 patch 文件"""
-        patch_content = "--- a/test.md\n+++ b/test.md\n@@ -1 +1 @@\n-old\n+new\n"
-        session_id = "test_session"
+        class FrozenDatetime(datetime):
+            @classmethod
+            def now(cls, tz: tzinfo | None = None) -> datetime:  # noqa: ARG003
+                return cls(2024, 1, 2, 3, 4, 5)
 
-        patch_file = fixer._save_patch(patch_content, session_id, tmp_path)
+        monkeypatch.setattr("checks.fixers.patch.datetime", FrozenDatetime)
 
-        assert patch_file.exists()
-        assert patch_file.read_text(encoding="utf-8") == patch_content
-        assert session_id in patch_file.name
-        assert patch_file.suffix == ".patch"
+        patch_file = fixer._save_patch(_SAVE_PATCH, "test_session", tmp_path)
 
-    def test_list_patches(self, fixer: PatchFixer, tmp_path: Path) -> None:
-        """测试列出 patch 文件"""
-        patch_dir = tmp_path / fixer.patch_dir
-        patch_dir.mkdir(parents=True)
+        assert patch_file == tmp_path / fixer.patch_dir / "2024-01-02_030405_test_session.patch"
+        assert _read_utf8(patch_file) == _SAVE_PATCH
+        assert fixer.get_latest_patch(tmp_path) == patch_file
 
-        # 创建几个 patch 文件
-        (patch_dir / "2024-01-01_120000_s1.patch").write_text("p1", encoding="utf-8")
-        (patch_dir / "2024-01-02_120000_s2.patch").write_text("p2", encoding="utf-8")
-        (patch_dir / "2024-01-03_120000_s3.patch").write_text("p3", encoding="utf-8")
+    @pytest.fixture
+    def patch_root(self, fixer: PatchFixer, tmp_path_factory: pytest.TempPathFactory) -> Path:
+        """含三个 patch 文件的项目根目录"""
+        root = tmp_path_factory.mktemp("patches")
+        patch_dir = root / fixer.patch_dir
+        patch_dir.mkdir(parents=True)
+        # 列表与取最新只看文件名，创建空文件即可
+        for name in (
+            "2024-01-01_120000_s1.patch",
+            "2024-01-02_120000_s2.patch",
+            "2024-01-03_120000_s3.patch",
+        ):
+            (patch_dir / name).touch()
+        return root
 
-        patches = fixer.list_patches(tmp_path)
+    def test_list_patches(self, fixer: PatchFixer, patch_root: Path) -> None:
+        """测试列出 patch 文件"""
+        patches = fixer.list_patches(patch_root)
 
         assert len(patches) == 3
         # 应该按时间倒序排列
@@ -342,251 +374,285 @@ class TestPatchFixerPatchFile:
         patches = fixer.list_patches(tmp_path)
         assert patches == []
 
-    def test_get_latest_patch(self, fixer: PatchFixer, tmp_path: Path) -> None:
+    def test_get_latest_patch(self, fixer: PatchFixer, patch_root: Path) -> None:
         """测试获取最新 patch"""
-        patch_dir = tmp_path / fixer.patch_dir
-        patch_dir.mkdir(parents=True)
-
-        (patch_dir / "2024-01-01_s1.patch").write_text("old", encoding="utf-8")
-        (patch_dir / "2024-01-02_s2.patch").write_text("new", encoding="utf-8")
-
-        latest = fixer.get_latest_patch(tmp_path)
+        latest = fixer.get_latest_patch(patch_root)
 
         assert latest is not None
-        assert "2024-01-02" in latest.name
+        assert "2024-01-03" in latest.name
 
     def test_get_latest_patch_none(self, fixer: PatchFixer, tmp_path: Path) -> None:
         """测试无 patch 时返回 None"""
         latest = fixer.get_latest_patch(tmp_path)
         assert latest is None
 
-    def test_preview_patch(self, fixer: PatchFixer, tmp_path: Path) -> None:
+    def test_preview_patch(self, fixer: PatchFixer, patch_dir: Path) -> None:
         """测试预览 patch"""
-        patch_dir = tmp_path / fixer.patch_dir
-        patch_dir.mkdir(parents=True)
-
-        content = "--- a/test.md\n+++ b/test.md\n"
         patch_file = patch_dir / "test.patch"
-        patch_file.write_text(content, encoding="utf-8")
+        patch_file.write_bytes(_PREVIEW_PATCH)
 
         preview = fixer.preview_patch(patch_file)
-        assert preview == content
+        assert preview == _PREVIEW_PATCH.decode("utf-8")
 
 
 class TestPatchFixerApply:
     """PatchFixer 应用测试"""
 
-    @pytest.fixture
-    def fixer(self) -> PatchFixer:
-        return PatchFixer()
-
-    def test_apply_patch_git(self, fixer: PatchFixer, tmp_path: Path) -> None:
+    def test_apply_patch_git(self, fixer: PatchFixer, tmp_path: Path, mock_run: MagicMock) -> None:
         """测试使用 git apply"""
         patch_file = tmp_path / "test.patch"
-        patch_file.write_text("patch content", encoding="utf-8")
+        patch_file.write_bytes(_DUMMY_PATCH)
 
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = MagicMock(returncode=0)
-            result = fixer._apply_patch(patch_file, tmp_path)
+        mock_run.return_value = SimpleNamespace(returncode=0)
+        result = fixer._apply_patch(patch_file, tmp_path)
 
         assert result is True
         mock_run.assert_called_once()
         # 应该使用 git apply
         assert "git" in mock_run.call_args[0][0]
 
-    def test_apply_patch_fallback_patch_cmd(self, fixer: PatchFixer, tmp_path: Path) -> None:
+    def test_apply_patch_fallback_patch_cmd(
+        self, fixer: PatchFixer, tmp_path: Path, mock_run: MagicMock
+    ) -> None:
         """测试回退到 patch 命令"""
         patch_file = tmp_path / "test.patch"
-        patch_file.write_text("patch content", encoding="utf-8")
+        patch_file.write_bytes(_DUMMY_PATCH)
 
-        with patch("subprocess.run") as mock_run:
-            # git apply 失败，patch 成功
-            mock_run.side_effect = [
-                MagicMock(returncode=1),  # git apply 失败
-                MagicMock(returncode=0),  # patch 成功
-            ]
-            result = fixer._apply_patch(patch_file, tmp_path)
+        # git apply 失败，patch 成功
+        mock_run.side_effect = [
+            SimpleNamespace(returncode=1),  # git apply 失败
+            SimpleNamespace(returncode=0),  # patch 成功
+        ]
+        result = fixer._apply_patch(patch_file, tmp_path)
 
         assert result is True
         assert mock_run.call_count == 2
 
-    def test_apply_patch_manual_fallback(self, fixer: PatchFixer, tmp_path: Path) -> None:
+    def test_apply_patch_manual_fallback(
+        self, fixer: PatchFixer, tmp_path: Path, mock_run: MagicMock
+    ) -> None:
         """测试手动应用 patch"""
         patch_file = tmp_path / "test.patch"
-        patch_file.write_text("patch content", encoding="utf-8")
+        patch_file.write_bytes(_DUMMY_PATCH)
+
+        mock_run.side_effect = FileNotFoundError
+        with patch.object(fixer, "_manual_apply_patch", return_value=True) as mock:
+            result = fixer._apply_patch(patch_file, tmp_path)
+
+        assert result is True
+        mock.assert_called_once()
+
+    def test_apply_patch_no_tools_skips_subprocess(
+        self, tmp_path: Path, mock_run: MagicMock
+    ) -> None:
+        """测试 git/patch 均不可用时直接手动应用"""
+        # 工具查找结果按实例缓存，需要未查找过的新实例
+        fixer = PatchFixer()
+        patch_file = tmp_path / "test.patch"
+        patch_file.write_bytes(_DUMMY_PATCH)
 
         with (
-            patch("subprocess.run", side_effect=FileNotFoundError),
+            patch("shutil.which", return_value=None),
             patch.object(fixer, "_manual_apply_patch", return_value=True) as mock,
         ):
             result = fixer._apply_patch(patch_file, tmp_path)
 
         assert result is True
+        mock_run.assert_not_called()
         mock.assert_called_once()
 
 
 class TestPatchFixerUndo:
     """PatchFixer 撤销测试"""
 
-    @pytest.fixture
-    def fixer(self) -> PatchFixer:
-        return PatchFixer()
-
-    def test_undo_patch_git(self, fixer: PatchFixer, tmp_path: Path) -> None:
+    def test_undo_patch_git(self, fixer: PatchFixer, tmp_path: Path, mock_run: MagicMock) -> None:
         """测试使用 git apply -R 撤销"""
         patch_file = tmp_path / "test.patch"
-        patch_file.write_text("patch content", encoding="utf-8")
+        patch_file.write_bytes(_DUMMY_PATCH)
 
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = MagicMock(returncode=0)
-            result = fixer.undo(patch_file, tmp_path)
+        mock_run.return_value = SimpleNamespace(returncode=0)
+        result = fixer.undo(patch_file, tmp_path)
 
         assert result is True
         # 应该使用 -R 选项
         assert "-R" in mock_run.call_args[0][0]
 
-    def test_undo_patch_fallback(self, fixer: PatchFixer, tmp_path: Path) -> None:
+    def test_undo_patch_fallback(
+        self, fixer: PatchFixer, tmp_path: Path, mock_run: MagicMock
+    ) -> None:
         """测试回退到 patch -R"""
         patch_file = tmp_path / "test.patch"
-        patch_file.write_text("patch content", encoding="utf-8")
+        patch_file.write_bytes(_DUMMY_PATCH)
 
-        with patch("subprocess.run") as mock_run:
-            mock_run.side_effect = [
-                MagicMock(returncode=1),  # git 失败
-                MagicMock(returncode=0),  # patch -R 成功
-            ]
-            result = fixer.undo(patch_file, tmp_path)
+        mock_run.side_effect = [
+            SimpleNamespace(returncode=1),  # git 失败
+            SimpleNamespace(returncode=0),  # patch -R 成功
+        ]
+        result = fixer.undo(patch_file, tmp_path)
 
         assert result is True
 
-    def test_undo_patch_no_tool(self, fixer: PatchFixer, tmp_path: Path) -> None:
+    def test_undo_patch_no_tool(
+        self, fixer: PatchFixer, tmp_path: Path, mock_run: MagicMock
+    ) -> None:
         """测试无工具可用时返回 False"""
         patch_file = tmp_path / "test.patch"
-        patch_file.write_text("patch content", encoding="utf-8")
+        patch_file.write_bytes(_DUMMY_PATCH)
+
+        mock_run.side_effect = FileNotFoundError
+        result = fixer.undo(patch_file, tmp_path)
+
+        assert result is False
 
-        with patch("subprocess.run", side_effect=FileNotFoundError):
+    def test_undo_patch_tools_not_on_path(self, tmp_path: Path, mock_run: MagicMock) -> None:
+        """测试 PATH 中没有 git/patch 时不启动子进程"""
+        # 工具查找结果按实例缓存，需要未查找过的新实例
+        fixer = PatchFixer()
+        patch_file = tmp_path / "test.patch"
+        patch_file.write_bytes(_DUMMY_PATCH)
+
+        with patch("shutil.which", return_value=None):
             result = fixer.undo(patch_file, tmp_path)
 
         assert result is False
+        mock_run.assert_not_called()
 
 
 class TestPatchFixerManualApply:
     """PatchFixer 手动应用测试"""
 
-    @pytest.fixture
-    def fixer(self) -> PatchFixer:
-        return PatchFixer()
+    def test_write_fixed_skips_changed_files(self, fixer: PatchFixer, tmp_path: Path) -> None:
+        """测试读取后被改动的文件不直接写回"""
+        file = tmp_path / "test.md"
+        file.write_bytes(b"old\n")
+        fixer._read_cached(file)
+
+        assert fixer._write_fixed([(file, "new\n")])
+        assert _read_utf8(file) == "new\n"
+
+        # 缓存仍记录旧的 mtime/大小，文件已变化
+        file.write_bytes(b"changed!\n")
+        assert not fixer._write_fixed([(file, "new\n")])
+        assert _read_utf8(file) == "changed!\n"
+
+    def test_fix_preserves_line_endings(self, fixer: PatchFixer, tmp_path: Path) -> None:
+        """测试直接写回时保留原有换行符（CRLF 与 LF 混用）"""
+        file = tmp_path / "crlf.md"
+        file.write_bytes(b"line 1\r\nold content\r\nline 3\nline 4\r\n")
+        issue = _issue(file=file, line=2, original="old", suggestion="new")
+
+        session = fixer.fix([issue], tmp_path, dry_run=False)
+
+        assert session.results[0].applied
+        assert file.read_bytes() == b"line 1\r\nnew content\r\nline 3\nline 4\r\n"
 
     def test_manual_apply_simple(self, fixer: PatchFixer, tmp_path: Path) -> None:
         """测试简单手动应用"""
         # 创建测试文件
         test_file = tmp_path / "test.md"
-        test_file.write_text("line 1\nold line\nline 3\n", encoding="utf-8")
+        test_file.write_bytes(b"line 1\nold line\nline 3\n")
 
         # 创建 patch
-        patch_content = """--- a/test.md
-+++ b/test.md
-@@ -1,3 +1,3 @@
- line 1
--old line
-+new line
- line 3
-"""
         patch_file = tmp_path / "test.patch"
-        patch_file.write_text(patch_content, encoding="utf-8")
+        patch_file.write_bytes(_SIMPLE_PATCH)
 
         result = fixer._manual_apply_patch(patch_file, tmp_path)
 
         assert result is True
-        content = test_file.read_text(encoding="utf-8")
+        content = _read_utf8(test_file)
         assert "new line" in content
         assert "old line" not in content
 
     def test_manual_apply_file_not_exists(self, fixer: PatchFixer, tmp_path: Path) -> None:
         """测试文件不存在时的手动应用"""
-        patch_content = """--- a/missing.md
-+++ b/missing.md
-@@ -1 +1 @@
--old
-+new
-"""
         patch_file = tmp_path / "test.patch"
-        patch_file.write_text(patch_content, encoding="utf-8")
+        patch_file.write_bytes(_MISSING_PATCH)
 
         result = fixer._manual_apply_patch(patch_file, tmp_path)
 
         # 应该返回 True（跳过不存在的文件）
         assert result is True
 
+    def test_read_cached(self, fixer: PatchFixer, tmp_path: Path) -> None:
+        """测试文件内容缓存随文件变化失效"""
+        test_file = tmp_path / "test.md"
+        test_file.write_bytes(b"old")
 
-class TestFixApplyToLine:
-    """Fix.apply_to_line 测试"""
-
-    def test_simple_replacement(self) -> None:
-        """测试简单替换"""
-        fix = Fix(
-            original="old",
-            replacement="new",
-            line=1,
-        )
-        result = fix.apply_to_line("This has old text")
-        assert result == "This has new text"
+        content = fixer._read_cached(test_file)
+        assert fixer._read_cached(test_file) is content
 
-    def test_replacement_with_column(self) -> None:
-        """测试精确列位置替换"""
-        fix = Fix(
-            original="old",
-            replacement="new",
-            line=1,
-            start_col=9,
-            end_col=12,
-        )
-        result = fix.apply_to_line("This has old text")
-        assert result == "This has new text"
+        test_file.write_bytes(b"new content")
+        assert fixer._read_cached(test_file) == "new content"
 
-    def test_replacement_only_first(self) -> None:
-        """测试只替换第一个匹配"""
-        fix = Fix(
-            original="test",
-            replacement="TEST",
-            line=1,
-        )
-        result = fix.apply_to_line("test and test again")
-        assert result == "TEST and test again"
 
-    def test_replacement_special_chars(self) -> None:
-        """测试特殊字符"""
-        fix = Fix(
-            original="![alt](old.png)",
-            replacement="![alt](new.png)",
-            line=1,
-        )
-        result = fix.apply_to_line("See ![alt](old.png) here")
-        assert result == "See ![alt](new.png) here"
+class TestFixApplyToLine:
+    """Fix.apply_to_line 测试"""
 
-    def test_replacement_chinese(self) -> None:
-        """测试中文字符"""
+    @pytest.mark.parametrize(
+        ("original", "replacement", "start_col", "end_col", "line", "expected"),
+        [
+            pytest.param(
+                "old", "new", None, None, "This has old text", "This has new text", id="simple"
+            ),
+            pytest.param(
+                "old", "new", 9, 12, "This has old text", "This has new text", id="with-column"
+            ),
+            pytest.param(
+                "test",
+                "TEST",
+                None,
+                None,
+                "test and test again",
+                "TEST and test again",
+                id="only-first",
+            ),
+            pytest.param(
+                "![alt](old.png)",
+                "![alt](new.png)",
+                None,
+                None,
+                "See ![alt](old.png) here",
+                "See ![alt](new.png) here",
+                id="special-chars",
+            ),
+            pytest.param(
+                "旧内容", "新内容", None, None, "这是旧内容测试", "这是新内容测试", id="chinese"
+            ),
+        ],
+    )
+    def test_apply_to_line(
+        self,
+        *,
+        original: str,
+        replacement: str,
+        start_col: int | None,
+        end_col: int | None,
+        line: str,
+        expected: str,
+    ) -> None:
+        """测试将修复应用到行内容"""
         fix = Fix(
-            original="旧内容",
-            replacement="新内容",
+            original=original,
+            replacement=replacement,
             line=1,
+            start_col=start_col,
+            end_col=end_col,
         )
-        result = fix.apply_to_line("这是旧内容测试")
-        assert result == "这是新内容测试"
+        assert fix.apply_to_line(line) == expected
 
 
 class TestPatchFixerIntegration:
     """PatchFixer 集成测试"""
 
-    def test_full_workflow(self, tmp_path: Path) -> None:
+    def test_full_workflow(self, tmp_path: Path, mock_run: MagicMock) -> None:
         """测试完整工作流程"""
         # 创建测试文件
         file = tmp_path / "test.md"
-        file.write_text("# Title\n\n![image](old.png)\n\nMore text\n", encoding="utf-8")
+        file.write_bytes(b"# Title\n\n![image](old.png)\n\nMore text\n")
 
         # 创建问题
         issues = [
-            Issue(
+            _issue(
                 file=file,
                 line=3,
                 type="broken_image",
@@ -597,21 +663,23 @@ class TestPatchFixerIntegration:
             )
         ]
 
-        # 执行修复（模拟 git apply）
+        # 执行修复（文件未变化时直接写回，不调用 git apply）
         fixer = PatchFixer()
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = MagicMock(returncode=0)
-            session = fixer.fix(issues, tmp_path, dry_run=False)
+        mock_run.return_value = SimpleNamespace(returncode=0)
+        session = fixer.fix(issues, tmp_path, dry_run=False)
+        mock_run.assert_not_called()
 
         # 验证结果
         assert len(session.results) == 1
         assert session.results[0].action == FixAction.ACCEPT
+        assert session.results[0].applied
+        assert _read_utf8(file) == "# Title\n\n![image](new.png)\n\nMore text\n"
 
         # 验证 patch 文件已创建
         patches = fixer.list_patches(tmp_path)
         assert len(patches) == 1
 
         # 验证 patch 内容
-        patch_content = patches[0].read_text(encoding="utf-8")
+        patch_content = _read_utf8(patches[0])
         assert "old.png" in patch_content
         assert "new.png" in patch_content
@@ -60,6 +60,14 @@ class TestTheme:
         assert theme.warning == "93"  # 黄色
         assert theme.suggestion == "92"  # 绿色
 
+    def test_theme_mutable(self) -> None:
+        """测试主题可在配置中修改，且不影响其他报告器"""
+        theme = Theme.default()
+        theme.error = "31"
+        assert Theme.default().error == "91"
+        assert ConsoleReporter().theme.error == "91"
+        assert ConsoleReporter(theme=theme).theme.error == "31"
+
     def test_light_theme(self) -> None:
         """测试浅色主题"""
         theme = Theme.light()
@@ -95,17 +103,19 @@ class TestConsoleReporterBasic:
             severity=Severity.ERROR,
         )
 
-    def test_severity_color(self, reporter: ConsoleReporter) -> None:
-        """测试不同严重程度的颜色代码"""
-        assert reporter._severity_color(Severity.ERROR) == reporter.theme.error
-        assert reporter._severity_color(Severity.WARNING) == reporter.theme.warning
-        assert reporter._severity_color(Severity.INFO) == reporter.theme.info
+    def test_severity_color(self) -> None:
+        """测试不同严重程度使用主题中的颜色"""
+        reporter = ConsoleReporter(color=ColorMode.ALWAYS)
+        theme = reporter.theme
+        assert reporter._severity_prefix[Severity.ERROR].startswith(f"\033[{theme.error}m")
+        assert reporter._severity_prefix[Severity.WARNING].startswith(f"\033[{theme.warning}m")
+        assert reporter._severity_prefix[Severity.INFO].startswith(f"\033[{theme.info}m")
 
     def test_severity_icon(self, reporter: ConsoleReporter) -> None:
         """测试严重程度图标"""
-        assert reporter._get_severity_icon(Severity.ERROR) == "✗"
-        assert reporter._get_severity_icon(Severity.WARNING) == "⚠"
-        assert reporter._get_severity_icon(Severity.INFO) == "ℹ"
+        assert reporter._severity_prefix[Severity.ERROR] == "✗ "
+        assert reporter._severity_prefix[Severity.WARNING] == "⚠ "
+        assert reporter._severity_prefix[Severity.INFO] == "ℹ "
 
     def test_box_drawing_chars(self, reporter: ConsoleReporter) -> None:
         """测试 Unicode 框线字符"""
@@ -423,6 +433,30 @@ class TestConsoleReporterAlignment:
         assert underline_match is not None
         assert len(underline_match.group()) == len("target")
 
+    def test_underline_alignment_wide_chars(
+        self, reporter: ConsoleReporter, tmp_path: Path, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """测试含中文的行按显示宽度对齐下划线"""
+        issue = Issue(
+            file=tmp_path / "test.md",
+            line=1,
+            column=3,
+            type="test",
+            message="Test",
+            original="![图](a.png)",
+            checker="test",
+            context=ContextLines(before=[], current=(1, "中文 ![图](a.png)"), after=[]),
+        )
+        reporter.report([issue], tmp_path)
+        lines = capsys.readouterr().out.splitlines()
+
+        content_line = next(line for line in lines if "中文" in line)
+        underline_line = next(line for line in lines if "^" in line)
+        # "中文 " 占 5 列，"![图](a.png)" 占 12 列
+        start = content_line.index("中文")
+        assert underline_line.index("^") == start + 5
+        assert underline_line.count("^") == 12
+
 
 class TestConsoleReporterSpecialCases:
     """ConsoleReporter 特殊情况测试"""
@@ -560,6 +594,23 @@ class TestConsoleReporterColorOutput:
         # 检查 ANSI 红色代码
         assert "\033[91m" in captured.out or "\033[31m" in captured.out
 
+    def test_report_issue_header_no_redundant_reset(
+        self, reporter: ConsoleReporter, tmp_path: Path, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """测试独立问题的文件头在路径与行号之间直接切换颜色"""
+        issue = Issue(
+            file=tmp_path / "test.md",
+            line=10,
+            type="test",
+            message="Standalone issue",
+            original="x",
+            checker="test",
+        )
+        reporter.report_issue(issue, tmp_path)
+        captured = capsys.readouterr()
+
+        assert "\033[96mtest.md\033[93m:10\033[0m" in captured.out
+
     def test_warning_color(
         self, reporter: ConsoleReporter, tmp_path: Path, capsys: pytest.CaptureFixture[str]
     ) -> None:
@@ -1,6 +1,8 @@
 """Tests for HexoResolver"""
 
+import os
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
@@ -55,6 +57,12 @@ class TestHexoResolver:
 
         resolved = resolver.resolve("image.png", source_file, context)
         assert resolved == asset_folder / "image.png"
+        # 资源文件夹已建立目录索引
+        assert str(asset_folder) in context.dir_cache
+        # 资源文件夹路径按源文件缓存
+        assert resolver._asset_folder(source_file, context) is resolver._asset_folder(
+            source_file, context
+        )
 
     def test_resolve_relative_path_in_page(
         self, resolver: HexoResolver, context: CheckContext, tmp_path: Path
@@ -79,6 +87,22 @@ class TestHexoResolver:
         assert resolver.exists("exists.png", source_file, context)
         assert not resolver.exists("missing.png", source_file, context)
 
+    def test_exists_lists_page_dir_once(
+        self, resolver: HexoResolver, context: CheckContext, tmp_path: Path
+    ) -> None:
+        """测试页面目录建立索引后，已有文件的存在性查询不再 stat"""
+        source_file = tmp_path / "pages" / "about.md"
+        source_file.parent.mkdir(exist_ok=True)
+        for name in ("a.png", "b.png"):
+            (source_file.parent / name).write_bytes(b"fake")
+
+        with patch("os.path.exists", side_effect=os.path.exists) as stat:
+            assert resolver.exists("a.png", source_file, context)
+            assert resolver.exists("b.png", source_file, context)
+            stat.assert_not_called()
+            assert not resolver.exists("missing.png", source_file, context)
+            stat.assert_called_once()
+
     def test_exists_external(
         self,
         resolver: HexoResolver,
@@ -121,3 +145,24 @@ class TestHexoResolver:
 
         assert resolver._is_post_file(post_file, context)
         assert not resolver._is_post_file(page_file, context)
+
+        # 结果按 (文件, 根目录) 缓存
+        assert resolver._post_cache[post_file, context.root] is True
+        assert resolver._post_cache[page_file, context.root] is False
+        assert resolver._is_post_file(post_file, context)
+
+    def test_before_check_clears_caches(
+        self, resolver: HexoResolver, context: CheckContext, tmp_path: Path
+    ) -> None:
+        """测试运行前重置缓存，post_dir 变化后重新判定"""
+        post_file = tmp_path / "_posts" / "test.md"
+        assert resolver._is_post_file(post_file, context)
+        resolver._asset_folder(post_file, context)
+        assert resolver._post_cache
+        assert resolver._asset_cache
+
+        resolver.post_dir = ["pages"]
+        resolver.before_check(context)
+        assert not resolver._post_cache
+        assert not resolver._asset_cache
+        assert not resolver._is_post_file(post_file, context)